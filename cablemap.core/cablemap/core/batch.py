@@ -0,0 +1,275 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (c) 2011 - 2015 -- Lars Heuer <heuer[at]semagia.com>
+# All rights reserved.
+#
+# License: BSD, see LICENSE.txt for more details.
+#
+"""\
+Processes chunks of cables as columns.
+
+A `CableBatch` provides the properties of a chunk of cables column by
+column. Properties which hold a sequence per cable (tags, recipients,
+references etc., c.f. `SEQUENCE_COLUMNS`) are flattened into one list and
+an offsets list: the values of the ``i``-th cable are
+``column[offsets[i]:offsets[i + 1]]``.
+
+Batches are consumed by `cablemap.core.interfaces.IBatchCableHandler`
+instances, i.e.::
+
+    from cablemap.core.batch import handle_source_batches
+
+    class TagCounter(object):
+        wanted_columns = ('tags',)
+
+        def __init__(self):
+            self.count = 0
+
+        def start(self):
+            pass
+
+        def end(self):
+            pass
+
+        def handle_batch(self, batch):
+            self.count += len(batch.column('tags'))
+
+    handle_source_batches('cables.csv', TagCounter())
+
+`CableHandlerAdapter` lets a `cablemap.core.interfaces.ICableHandler`
+consume batches.
+
+:author:       Lars Heuer (heuer[at]semagia.com)
+:organization: Semagia - <http://www.semagia.com/>
+:license:      BSD license
+"""
+from __future__ import absolute_import
+from itertools import chain, islice
+from cablemap.core.models import ParsedCable, PARSED_CABLE_FIELDS
+from cablemap.core.interfaces import IBatchCableHandler, implements
+from cablemap.core.handler import wanted_events, _handle_cable
+
+__all__ = ['CableBatch', 'CableHandlerAdapter', 'cable_batches', 'handle_batches',
+           'handle_source_batches', 'wanted_columns', 'DEFAULT_BATCH_SIZE',
+           'SEQUENCE_COLUMNS']
+
+# Number of cables per batch
+DEFAULT_BATCH_SIZE = 1000
+
+# Properties which provide a sequence of values per cable
+SEQUENCE_COLUMNS = frozenset([
+    'media_uris', 'recipients', 'info_recipients', 'classification_categories',
+    'references', 'tags', 'signed_by', 'classified_by',
+    ])
+
+_FIELD_INDEX = dict((name, i) for i, name in enumerate(PARSED_CABLE_FIELDS))
+
+
+class CableBatch(object):
+    """\
+    A chunk of cables which provides the cable properties as columns.
+
+    Properties which were not parsed (c.f. `properties`) are ``None`` for
+    each cable, sequence columns treat them as empty sequences.
+    """
+    def __init__(self, cables, properties=None):
+        """\
+
+        `cables`
+            A sequence of `cablemap.core.models.ParsedCable` instances.
+        `properties`
+            The properties which were parsed or ``None`` if all properties
+            were parsed.
+        """
+        self._cables = cables
+        self._columns = zip(*cables) if cables else [()] * len(PARSED_CABLE_FIELDS)
+        self._flattened = {}
+        self.properties = frozenset(properties) if properties is not None else None
+
+    def __len__(self):
+        return len(self._cables)
+
+    def __iter__(self):
+        """\
+        Returns an iterator over the `cablemap.core.models.ParsedCable`
+        instances of this batch.
+        """
+        return iter(self._cables)
+
+    def column(self, name):
+        """\
+        Returns the values of the property `name`.
+
+        If `name` is a sequence property (c.f. `SEQUENCE_COLUMNS`), the
+        values of all cables are returned as one list (c.f. `offsets`).
+        Otherwise, the returned sequence provides one value per cable.
+
+        `name`
+            A property name, i.e. ``reference_id`` or ``tags``
+            (c.f. `cablemap.core.models.PARSED_CABLE_FIELDS`).
+        """
+        if name in SEQUENCE_COLUMNS:
+            return self._flatten(name)[0]
+        return self._columns[_FIELD_INDEX[name]]
+
+    def offsets(self, name):
+        """\
+        Returns the offsets of the sequence property `name`.
+
+        The returned list has ``len(batch) + 1`` items, the values of the
+        ``i``-th cable are ``batch.column(name)[offsets[i]:offsets[i + 1]]``.
+
+        `name`
+            A property name (c.f. `SEQUENCE_COLUMNS`).
+        """
+        if name not in SEQUENCE_COLUMNS:
+            raise ValueError('"%s" is not a sequence property' % name)
+        return self._flatten(name)[1]
+
+    def values(self, name, index):
+        """\
+        Returns the value(s) of the property `name` of the ``index``-th
+        cable.
+
+        `name`
+            A property name.
+        `index`
+            The index of the cable in this batch.
+        """
+        if name in SEQUENCE_COLUMNS:
+            values, offsets = self._flatten(name)
+            return values[offsets[index]:offsets[index + 1]]
+        return self._columns[_FIELD_INDEX[name]][index]
+
+    def _flatten(self, name):
+        res = self._flattened.get(name)
+        if res is None:
+            sequences = self._columns[_FIELD_INDEX[name]]
+            offsets = [0]
+            append = offsets.append
+            total = 0
+            for seq in sequences:
+                if seq:
+                    total += len(seq)
+                append(total)
+            values = list(chain.from_iterable(seq for seq in sequences if seq))
+            res = self._flattened[name] = values, offsets
+        return res
+
+
+class CableHandlerAdapter(object):
+    """\
+    A `IBatchCableHandler` which issues the events of each cable of a batch
+    to an underlying `cablemap.core.interfaces.ICableHandler` instance.
+    """
+    implements(IBatchCableHandler)
+
+    def __init__(self, handler):
+        """\
+
+        `handler`
+            The ICableHandler instance which should receive the events.
+        """
+        from cablemap.core.parallel import properties_for_events
+        self._handler = handler
+        self._wanted = wanted_events(handler)
+        self.wanted_columns = properties_for_events(self._wanted)
+
+    def start(self):
+        self._handler.start()
+
+    def end(self):
+        self._handler.end()
+
+    def handle_batch(self, batch):
+        handler, wanted = self._handler, self._wanted
+        for cable in batch:
+            _handle_cable(cable, handler, wanted)
+
+
+def wanted_columns(handler):
+    """\
+    Returns the properties (a frozenset of property names) the provided
+    `handler` consumes or ``None`` if the handler wants to receive all
+    properties.
+
+    c.f. `cablemap.core.interfaces.IBatchCableHandler.wanted_columns`
+
+    `handler`
+        A `IBatchCableHandler` instance.
+    """
+    wanted = getattr(handler, 'wanted_columns', None)
+    if wanted is None or callable(wanted):
+        return None
+    return frozenset(wanted)
+
+
+def cable_batches(cables, size=DEFAULT_BATCH_SIZE, properties=None):
+    """\
+    Returns a generator with `CableBatch` instances.
+
+    `cables`
+        An iterable of `cablemap.core.interfaces.ICable` instances.
+    `size`
+        The max. number of cables per batch.
+    `properties`
+        An iterable of property names which should be taken from the cables
+        or ``None`` (default) to take all properties
+        (c.f. `cablemap.core.models.ParsedCable.from_cable`).
+    """
+    from_cable = ParsedCable.from_cable
+    it = iter(cables)
+    while True:
+        chunk = [cable if isinstance(cable, ParsedCable) else from_cable(cable, properties)
+                 for cable in islice(it, size)]
+        if not chunk:
+            break
+        yield CableBatch(chunk, properties)
+
+
+def handle_batches(cables, handler, size=DEFAULT_BATCH_SIZE):
+    """\
+    Issues one ``handler.start()`` event, a ``handler.handle_batch(batch)``
+    event per chunk of `size` cables and a ``handler.end()`` event.
+
+    `cables`
+        An iterable of `cablemap.core.interfaces.ICable` instances.
+    `handler`
+        The `IBatchCableHandler` instance which should receive the batches.
+    `size`
+        The max. number of cables per batch.
+    """
+    properties = wanted_columns(handler)
+    handler.start()
+    for batch in cable_batches(cables, size, properties):
+        handler.handle_batch(batch)
+    handler.end()
+
+
+def handle_source_batches(path, handler, predicate=None, size=DEFAULT_BATCH_SIZE, workers=None):
+    """\
+    Reads all cables from the provided source and issues batches of cables
+    to the `handler`.
+
+    `path`
+        Either a directory with cable files, an archive of cable files or
+        a (compressed) CSV file (c.f. `cablemap.core.utils.cables_from_source`).
+    `handler`
+        The `IBatchCableHandler` instance which should receive the batches.
+    `predicate`
+        A predicate that is invoked for each cable reference identifier.
+        If the predicate evaluates to ``False`` the cable is ignored.
+    `size`
+        The max. number of cables per batch.
+    `workers`
+        The number of processes which should parse the cables
+        (c.f. `cablemap.core.handler.handle_source`).
+    """
+    if workers is not None and workers > 1:
+        from cablemap.core.parallel import parsed_cables_from_source
+        cables = parsed_cables_from_source(path, predicate, workers,
+                                           properties=wanted_columns(handler))
+    else:
+        from cablemap.core.utils import cables_from_source
+        cables = cables_from_source(path, predicate)
+    handle_batches(cables, handler, size)
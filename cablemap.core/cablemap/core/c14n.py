@@ -14,8 +14,56 @@ Canonicalization utility functions.
 """
 from __future__ import absolute_import
 import re
+from collections import namedtuple
 from cablemap.core.consts import MALFORMED_CABLE_IDS, INVALID_CABLE_IDS
 
+# Default max. number of memoized results per function
+DEFAULT_MEMO_SIZE = 1 << 17
+
+CacheInfo = namedtuple('CacheInfo', 'hits misses maxsize currsize')
+
+
+def memoize(maxsize=DEFAULT_MEMO_SIZE):
+    """\
+    Returns a decorator which memoizes the results of a function with one
+    (hashable) argument.
+
+    If the cache holds `maxsize` results, it is cleared before the next
+    result is stored. The decorated function provides ``cache_info()``,
+    which returns a `CacheInfo` tuple ``(hits, misses, maxsize, currsize)``,
+    and ``cache_clear()`` (like ``functools.lru_cache`` in Python 3).
+
+    `maxsize`
+        The max. number of memoized results.
+    """
+    def decorate(func):
+        values = {}
+        stats = [0, 0]
+        def memoized(arg):
+            try:
+                res = values[arg]
+                stats[0] += 1
+                return res
+            except KeyError:
+                stats[1] += 1
+                if len(values) >= maxsize:
+                    values.clear()
+                res = values[arg] = func(arg)
+                return res
+        def cache_info():
+            return CacheInfo(stats[0], stats[1], maxsize, len(values))
+        def cache_clear():
+            values.clear()
+            stats[:] = [0, 0]
+        memoized.__name__ = func.__name__
+        memoized.__doc__ = func.__doc__
+        memoized.__wrapped__ = func
+        memoized.cache_info = cache_info
+        memoized.cache_clear = cache_clear
+        return memoized
+    return decorate
+
+
 _STATION_C14N = {
     u'AUBJA': u'ABUJA',
     u'RANGON': u'RANGOON',
@@ -171,9 +219,13 @@ _STATION_C14N = {
 
 _C14N_PATTERN = re.compile(r'[0-9]{2}([0A-Z\-]+)[0-9]+')
 
+@memoize()
 def canonicalize_origin(origin):
     """\
+    Returns the canonicalized form of the provided station identifier.
 
+    `origin`
+        The station identifier to canonicalize
     """
     origin = origin.replace(u'USMISSION', u'') \
                      .replace(u'AMEMBASSY', u'') \
@@ -181,6 +233,7 @@ def canonicalize_origin(origin):
     return _STATION_C14N.get(origin, origin)
 
 
+@memoize()
 def canonicalize_id(reference_id):
     """\
     Returns the canonicalized form of the provided reference_id.
@@ -206,6 +259,21 @@ def canonicalize_id(reference_id):
         return reference_id.replace(origin, canonicalize_origin(origin))
     return reference_id
 
+
+def canonicalize_ids(reference_ids):
+    """\
+    Returns a list with the canonicalized forms of the provided reference
+    identifiers (c.f. `canonicalize_id`).
+
+    Each distinct identifier is canonicalized once.
+
+    `reference_ids`
+        An iterable of cable identifiers.
+    """
+    reference_ids = list(reference_ids)
+    c14n = dict((reference_id, canonicalize_id(reference_id)) for reference_id in set(reference_ids))
+    return [c14n[reference_id] for reference_id in reference_ids]
+
 _SURNAME_C14N = {
     u'ADDELTON': u'ADDLETON',
     u'ALLGEIR': u'ALLGEIER',
@@ -0,0 +1,218 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (c) 2011 - 2015 -- Lars Heuer <heuer[at]semagia.com>
+# All rights reserved.
+#
+# License: BSD, see LICENSE.txt for more details.
+#
+"""\
+Caches the parsed properties of cables on disk.
+
+The entries of the cache are keyed by a hash of the reference identifier,
+the header and the content of a cable. Each property is stored with the
+version of its parser (c.f. `cablemap.core.reader.PARSER_VERSIONS`), if the
+version of a parser changes, only the affected property is parsed again::
+
+    from cablemap.core import handle_source
+    from cablemap.core.cache import ParseCache
+
+    cache = ParseCache('cables.cache')
+    handle_source('cables.csv', handler, cache=cache)
+    cache.close()
+
+The cache is bounded by the size of the stored values, the least recently
+used cables are evicted first.
+
+:author:       Lars Heuer (heuer[at]semagia.com)
+:organization: Semagia - <http://www.semagia.com/>
+:license:      BSD license
+"""
+from __future__ import absolute_import
+import sqlite3
+import hashlib
+import cPickle as pickle
+from cablemap.core.models import ParsedCable, PARSED_CABLE_FIELDS
+from cablemap.core.reader import PARSER_VERSIONS
+
+__all__ = ['ParseCache', 'cable_key', 'CACHED_PROPERTIES']
+
+# Max. size of the cached values in bytes
+DEFAULT_MAX_SIZE = 256 * 1024 * 1024
+
+# Properties which are read from the cache
+CACHED_PROPERTIES = frozenset(PARSER_VERSIONS)
+
+# Number of cables after which the changes are committed
+_COMMIT_INTERVAL = 1000
+
+_SCHEMA = (
+    'CREATE TABLE IF NOT EXISTS cables (key TEXT PRIMARY KEY, atime INTEGER NOT NULL, size INTEGER NOT NULL)',
+    'CREATE INDEX IF NOT EXISTS cables_atime ON cables (atime)',
+    'CREATE TABLE IF NOT EXISTS properties (key TEXT NOT NULL, name TEXT NOT NULL, '
+        'version INTEGER NOT NULL, value BLOB NOT NULL, PRIMARY KEY (key, name))',
+)
+
+
+def cable_key(cable):
+    """\
+    Returns the cache key of the provided cable.
+
+    The key depends on the reference identifier, the header and the
+    content of the cable.
+    """
+    h = hashlib.sha1()
+    for text in (cable.reference_id, cable.header, cable.content):
+        h.update((text or u'').encode('utf-8'))
+        h.update('\0')
+    return h.hexdigest()
+
+
+class ParseCache(object):
+    """\
+    On-disk cache of parsed cable properties.
+    """
+    def __init__(self, filename, max_size=DEFAULT_MAX_SIZE, versions=None):
+        """\
+
+        `filename`
+            The name of the cache file. The file is created if it does not
+            exist.
+        `max_size`
+            The max. size of the cached values in bytes.
+        `versions`
+            A dict which maps property names to parser versions
+            (`cablemap.core.reader.PARSER_VERSIONS` by default).
+        """
+        self.max_size = max_size
+        self.versions = versions if versions is not None else PARSER_VERSIONS
+        self.hits = 0
+        self.misses = 0
+        self._conn = sqlite3.connect(filename)
+        self._conn.text_factory = str
+        for stmt in _SCHEMA:
+            self._conn.execute(stmt)
+        self._clock, self._size = self._conn.execute('SELECT MAX(atime), SUM(size) FROM cables').fetchone()
+        self._clock = self._clock or 0
+        self._size = self._size or 0
+        self._pending = 0
+
+    def __len__(self):
+        return self._conn.execute('SELECT COUNT(*) FROM cables').fetchone()[0]
+
+    @property
+    def size(self):
+        """\
+        Returns the size of the cached values in bytes.
+        """
+        return self._size
+
+    def parsed_cable(self, cable, properties=None):
+        """\
+        Returns a `cablemap.core.models.ParsedCable` of the provided `cable`.
+
+        The cached properties are taken from the cache, all other properties
+        are parsed and written into the cache.
+
+        `cable`
+            An `ICable` instance.
+        `properties`
+            An optional iterable of property names which are needed. The
+            metadata, the header, and the content are always taken. If
+            `properties` is ``None`` (default), all properties are provided.
+        """
+        key = cable_key(cable)
+        conn, versions = self._conn, self.versions
+        cached = {}
+        for name, version, value in conn.execute('SELECT name, version, value FROM properties WHERE key = ?', (key,)):
+            if versions.get(name) == version:
+                cached[name] = value
+        wanted = CACHED_PROPERTIES if properties is None else CACHED_PROPERTIES.intersection(properties)
+        values = []
+        added = []
+        for name in PARSED_CABLE_FIELDS:
+            if name not in CACHED_PROPERTIES:
+                values.append(getattr(cable, name))
+            elif name not in wanted:
+                values.append(None)
+            elif name in cached:
+                self.hits += 1
+                values.append(pickle.loads(str(cached[name])))
+            else:
+                self.misses += 1
+                value = getattr(cable, name)
+                values.append(value)
+                added.append((key, name, versions.get(name, 0), sqlite3.Binary(pickle.dumps(value, 2))))
+        self._clock += 1
+        if added:
+            conn.executemany('INSERT OR REPLACE INTO properties VALUES (?, ?, ?, ?)', added)
+            size = conn.execute('SELECT SUM(LENGTH(value)) FROM properties WHERE key = ?', (key,)).fetchone()[0]
+            row = conn.execute('SELECT size FROM cables WHERE key = ?', (key,)).fetchone()
+            self._size += size - (row[0] if row else 0)
+            conn.execute('INSERT OR REPLACE INTO cables VALUES (?, ?, ?)', (key, self._clock, size))
+            if self._size > self.max_size:
+                self._evict()
+        else:
+            conn.execute('UPDATE cables SET atime = ? WHERE key = ?', (self._clock, key))
+        self._pending += 1
+        if self._pending >= _COMMIT_INTERVAL:
+            self.flush()
+        return ParsedCable(*values)
+
+    def cached_cables(self, cables, properties=None):
+        """\
+        Returns a generator of `cablemap.core.models.ParsedCable` instances.
+
+        `cables`
+            An iterable of `ICable` instances.
+        `properties`
+            An optional iterable of property names which are needed
+            (c.f. `parsed_cable`).
+        """
+        if properties is not None:
+            properties = frozenset(properties)
+        try:
+            for cable in cables:
+                yield self.parsed_cable(cable, properties)
+        finally:
+            self.flush()
+
+    def _evict(self):
+        """\
+        Removes the least recently used cables until the size of the cache
+        is below 90% of the max. size.
+        """
+        conn = self._conn
+        target = self.max_size * 0.9
+        evicted = []
+        for key, size in conn.execute('SELECT key, size FROM cables ORDER BY atime').fetchall():
+            if self._size <= target:
+                break
+            evicted.append((key,))
+            self._size -= size
+        conn.executemany('DELETE FROM properties WHERE key = ?', evicted)
+        conn.executemany('DELETE FROM cables WHERE key = ?', evicted)
+
+    def clear(self):
+        """\
+        Removes all entries from the cache.
+        """
+        self._conn.execute('DELETE FROM properties')
+        self._conn.execute('DELETE FROM cables')
+        self._size = 0
+        self.flush()
+
+    def flush(self):
+        """\
+        Writes pending changes to disk.
+        """
+        self._conn.commit()
+        self._pending = 0
+
+    def close(self):
+        """\
+        Writes pending changes to disk and closes the cache.
+        """
+        if self._conn is not None:
+            self.flush()
+            self._conn.close()
+            self._conn = None
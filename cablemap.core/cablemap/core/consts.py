@@ -14,6 +14,48 @@ This module provides some global constants.
 """
 import re
 
+
+class LazyPattern(object):
+    """\
+    A regular expression which is compiled on first use.
+
+    Provides the methods and attributes of a compiled regular expression
+    (``match``, ``search``, ``sub``, ``findall`` etc.). After the first
+    access these are plain instance attributes, so using a lazy pattern
+    costs the same as using the compiled pattern.
+
+    `pattern`
+        The regular expression or a callable which returns the regular
+        expression (i.e. if it has to be read from a file).
+    `flags`
+        The ``re`` flags.
+    """
+    _ATTRS = ('match', 'search', 'sub', 'subn', 'split', 'findall',
+              'finditer', 'scanner', 'pattern', 'flags', 'groups',
+              'groupindex')
+
+    def __init__(self, pattern, flags=0):
+        self._pattern = pattern
+        self._flags = flags
+
+    def compile(self):
+        """\
+        Compiles the regular expression (if necessary) and returns it.
+        """
+        pattern = self._pattern
+        compiled = re.compile(pattern() if callable(pattern) else pattern, self._flags)
+        for name in LazyPattern._ATTRS:
+            setattr(self, name, getattr(compiled, name))
+        self.compile = lambda: compiled
+        return compiled
+
+    def __getattr__(self, name):
+        # Called only if the attribute is unknown, i.e. before compilation
+        if name.startswith('__'):
+            raise AttributeError(name)
+        return getattr(self.compile(), name)
+
+
 # Min/max length of station identifiers
 MIN_ORIGIN_LENGTH = len(u'ROME')
 MAX_ORIGIN_LENGTH = len(u'BANDARSERIBEGAWAN')
@@ -142,7 +184,31 @@ _STATIONS = (
     u'ZAGREB'
 )
 
-REFERENCE_ID_PATTERN = re.compile(r'^([0-9]{2})(%s)([0-9]{%d,%d})$' % ('|'.join(_STATIONS), MIN_SERIAL_LENGTH, MAX_SERIAL_LENGTH), re.UNICODE)
+# Valid station identifiers (hash lookup)
+STATIONS = frozenset(_STATIONS)
+
+_REFERENCE_ID_SPLIT_PATTERN = re.compile(r'^([0-9]{2})([A-Z]+)([0-9]{%d,%d})$' % (MIN_SERIAL_LENGTH, MAX_SERIAL_LENGTH), re.UNICODE)
+
+class _ReferenceIdPattern(object):
+    """\
+    Matches valid cable reference identifiers.
+
+    Provides the ``match`` method of the former regular expression which
+    enumerated all station identifiers. The reference identifier is split
+    into year, station and serial number by a simple pattern, the station
+    is looked up in `STATIONS`.
+    """
+    __slots__ = ()
+
+    def match(self, reference_id):
+        """\
+        Returns a match object with the groups ``(year, station, serial)``
+        or ``None`` if `reference_id` is not a valid reference identifier.
+        """
+        m = _REFERENCE_ID_SPLIT_PATTERN.match(reference_id)
+        return m if m and m.group(2) in STATIONS else None
+
+REFERENCE_ID_PATTERN = _ReferenceIdPattern()
 
 # Wrong WikiLeaks cable identifiers
 # These cable identifiers are cables which exist in two versions: One with the
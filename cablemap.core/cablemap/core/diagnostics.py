@@ -0,0 +1,114 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (c) 2011 - 2015 -- Lars Heuer <heuer[at]semagia.com>
+# All rights reserved.
+#
+# License: BSD, see LICENSE.txt for more details.
+#
+"""\
+Counts the anomalies the `cablemap.core.reader` finds in cables.
+
+The reader reports each anomaly (i.e. a cable without TAGs) to
+`DIAGNOSTICS` which counts the anomalies per condition and keeps the
+reference ids of the first cables as samples. The log message of an
+anomaly is only formatted if the logger is enabled for its level, so the
+diagnostics are cheap if logging is disabled.
+
+Print a summary at the end of a run::
+
+    from cablemap.core import handle_source
+    from cablemap.core.diagnostics import DIAGNOSTICS
+
+    handle_source('cables.csv', handler)
+    print DIAGNOSTICS.summary()
+
+Anomalies of cables which are parsed by worker processes
+(c.f. `cablemap.core.parallel`) are counted by the worker processes and
+are not available to the calling process.
+
+:author:       Lars Heuer (heuer[at]semagia.com)
+:organization: Semagia - <http://www.semagia.com/>
+:license:      BSD license
+"""
+from __future__ import absolute_import
+import logging
+
+__all__ = ['Diagnostics', 'DIAGNOSTICS', 'MISSING_TAGS', 'MISSING_TO',
+           'MALFORMED_SUMMARY', 'MALFORMED_REFERENCES']
+
+# Conditions reported by the reader
+MISSING_TAGS = 'missing_tags'
+MISSING_TO = 'missing_to'
+MALFORMED_SUMMARY = 'malformed_summary'
+MALFORMED_REFERENCES = 'malformed_references'
+
+
+class Diagnostics(object):
+    """\
+    Counts anomalies per condition and keeps sample reference ids.
+    """
+    def __init__(self, samples=5):
+        """\
+
+        `samples`
+            The max. number of reference ids which are kept per condition
+            (default: ``5``).
+        """
+        self._max_samples = samples
+        self.counts = {}
+        self.samples = {}
+
+    def report(self, condition, reference_id, logger=None, level=logging.DEBUG, msg=None, *args):
+        """\
+        Counts an anomaly and logs the message if the `logger` is enabled
+        for the provided `level`.
+
+        `condition`
+            The kind of the anomaly, i.e. `MISSING_TAGS`.
+        `reference_id`
+            The reference id of the cable or ``None``.
+        `logger`
+            An optional logger.
+        `level`
+            The logging level (default: ``logging.DEBUG``).
+        `msg`
+            The log message, it is formatted with the `args` only if the
+            message is logged.
+        """
+        count = self.counts.get(condition, 0)
+        self.counts[condition] = count + 1
+        if count < self._max_samples:
+            self.samples.setdefault(condition, []).append(reference_id)
+        if logger is not None and logger.isEnabledFor(level):
+            logger.log(level, msg, *args)
+
+    def reset(self):
+        """\
+        Discards all counts and samples.
+        """
+        self.counts.clear()
+        self.samples.clear()
+
+    def summary(self):
+        """\
+        Returns a human readable summary of the counted anomalies, one line
+        per condition.
+        """
+        return '\n'.join('%s: %d (i.e. %s)' % (condition, count, ', '.join(map(unicode, self.samples.get(condition, ()))))
+                         for condition, count in sorted(self.counts.iteritems()))
+
+    def log_summary(self, logger, level=logging.INFO):
+        """\
+        Logs the summary if any anomaly was reported.
+
+        `logger`
+            The logger.
+        `level`
+            The logging level (default: ``logging.INFO``).
+        """
+        if self.counts:
+            logger.log(level, 'Diagnostics:\n%s', self.summary())
+
+
+# The diagnostics of the reader
+DIAGNOSTICS = Diagnostics()
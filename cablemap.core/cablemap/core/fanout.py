@@ -0,0 +1,326 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (c) 2011 - 2015 -- Lars Heuer <heuer[at]semagia.com>
+# All rights reserved.
+#
+# License: BSD, see LICENSE.txt for more details.
+#
+"""\
+Runs `cablemap.core.interfaces.ICableHandler` instances in worker threads
+or worker processes.
+
+The `FanOutCableHandler` records the events of a cable and puts them into
+a bounded queue per underlying handler once the cable has been processed
+(``end_cable``). Each underlying handler consumes its queue in its own
+worker, so parsing overlaps with the output and the handlers do not wait
+for each other. If a queue is full, the `FanOutCableHandler` blocks until
+the worker has taken a cable from it, so memory stays bounded even if a
+handler cannot keep up.
+
+Worker threads pay off for handlers which wait for I/O (i.e. network or
+slow disks). Threads share one interpreter lock, so handlers which are
+CPU-bound (i.e. serializers) do not get faster in threads; they may run in
+a worker process (c.f. `SubprocessHandler`) if there are CPUs to spare and
+their work per cable outweighs pickling the events. Recording and copying
+the events has its own cost, for CPU-bound handlers on a single CPU the
+synchronous ``DispatchCableHandler(MultipleCableHandler(handlers))`` is
+faster (c.f. ``helpers/benchmark_fanout.py``)::
+
+    from cablemap.core import handle_source
+    from cablemap.core.fanout import FanOutCableHandler, SubprocessHandler
+
+    handle_source('cables.csv', FanOutCableHandler([handler_a,
+                                                    SubprocessHandler(create_handler_b, ('b.ctm',))]))
+
+:author:       Lars Heuer (heuer[at]semagia.com)
+:organization: Semagia - <http://www.semagia.com/>
+:license:      BSD license
+"""
+from __future__ import absolute_import
+import sys
+import threading
+import traceback
+import multiprocessing
+from Queue import Queue, Full, Empty
+from cablemap.core.interfaces import ICableHandler, implements
+from cablemap.core.handler import DispatchCableHandler, CABLE_EVENTS, wanted_events, \
+     _union_wanted_events
+
+__all__ = ['FanOutCableHandler', 'SubprocessHandler', 'DEFAULT_MAX_CABLES']
+
+# Max. number of cables which are queued per handler
+DEFAULT_MAX_CABLES = 100
+
+# Seconds to wait for a free slot in a queue before the worker is checked
+_PUT_TIMEOUT = 1.0
+
+# Marks the end of the event stream
+_STOP = None
+
+
+class SubprocessHandler(object):
+    """\
+    Describes a `ICableHandler` which should be created by and run in a
+    worker process.
+
+    The events are pickled, so the handler receives copies of the
+    event arguments.
+    """
+    def __init__(self, factory, args=(), wanted_events=None):
+        """\
+
+        `factory`
+            A callable which returns the `ICableHandler` instance. The
+            callable and the `args` must be picklable (i.e. a module-level
+            function).
+        `args`
+            The arguments of the `factory`.
+        `wanted_events`
+            The events the handler consumes or ``None`` (default) if the
+            handler wants to receive all events
+            (c.f. `cablemap.core.interfaces.ICableHandler.wanted_events`).
+        """
+        self.factory = factory
+        self.args = tuple(args)
+        self.wanted_events = frozenset(wanted_events) if wanted_events is not None else None
+
+
+def _consume(create_handler, get, drain=True, report=None):
+    """\
+    Issues the queued events to the handler until the end of the event
+    stream.
+
+    Returns ``None`` or the ``sys.exc_info()`` of the first error.
+
+    `create_handler`
+        A callable which returns the `ICableHandler` instance.
+    `get`
+        A callable which returns the next list of events.
+    `drain`
+        Indicates if the remaining events should be consumed (and discarded)
+        after an error. If `drain` is ``False``, the function returns at
+        once.
+    `report`
+        An optional callable which is invoked with the ``sys.exc_info()`` of
+        the first error as soon as it occurs.
+    """
+    error = None
+    try:
+        dispatcher = DispatchCableHandler(create_handler())
+    except Exception:
+        error = sys.exc_info()
+    if error is not None and report is not None:
+        report(error)
+    while error is None or drain:
+        events = get()
+        if events is _STOP:
+            break
+        if error is not None:
+            continue
+        try:
+            for name, args in events:
+                getattr(dispatcher, name)(*args)
+        except Exception:
+            error = sys.exc_info()
+            if report is not None:
+                report(error)
+    return error
+
+
+class _ThreadWorker(object):
+    """\
+    Runs a `ICableHandler` in a daemon thread.
+    """
+    def __init__(self, handler, max_cables):
+        self.wanted_events = wanted_events(handler)
+        self._handler = handler
+        self._queue = Queue(max_cables)
+        self._thread = None
+        self.error = None
+
+    def start(self):
+        self._thread = threading.Thread(target=self._run, name='cablemap-fanout')
+        self._thread.daemon = True
+        self._thread.start()
+
+    def _run(self):
+        _consume(lambda: self._handler, self._queue.get, report=self._report)
+
+    def _report(self, error):
+        self.error = error
+
+    def put(self, events):
+        self._raise_error()
+        # The thread discards the events after an error, so it never stops
+        # to consume the queue before the end of the event stream
+        self._queue.put(events)
+
+    def join(self):
+        self._queue.put(_STOP)
+        self._thread.join()
+        self._raise_error()
+
+    def abort(self):
+        self.join()
+
+    def _raise_error(self):
+        error = self.error
+        if error is not None:
+            raise error[0], error[1], error[2]
+
+
+def _run_subprocess(factory, args, queue, result):
+    # Stop at the first error, the parent process notices that the worker
+    # has terminated
+    error = _consume(lambda: factory(*args), queue.get, drain=False)
+    result.put(''.join(traceback.format_exception(*error)) if error is not None else None)
+
+
+class _ProcessWorker(object):
+    """\
+    Runs the `ICableHandler` of a `SubprocessHandler` in a worker process.
+    """
+    def __init__(self, subprocess_handler, max_cables):
+        self.wanted_events = subprocess_handler.wanted_events
+        self._queue = multiprocessing.Queue(max_cables)
+        self._result = multiprocessing.Queue(1)
+        self._process = multiprocessing.Process(target=_run_subprocess,
+                                                args=(subprocess_handler.factory,
+                                                      subprocess_handler.args,
+                                                      self._queue, self._result))
+        self._process.daemon = True
+
+    def start(self):
+        self._process.start()
+
+    def put(self, events):
+        if not self._process.is_alive():
+            self._raise_terminated()
+        while True:
+            try:
+                self._queue.put(events, True, _PUT_TIMEOUT)
+                return
+            except Full:
+                if not self._process.is_alive():
+                    self._raise_terminated()
+
+    def join(self):
+        self.put(_STOP)
+        while True:
+            try:
+                error = self._result.get(True, _PUT_TIMEOUT)
+                break
+            except Empty:
+                if not self._process.is_alive():
+                    self._raise_terminated()
+        self._process.join()
+        if error is not None:
+            raise RuntimeError('Error in worker process:\n%s' % error)
+
+    def abort(self):
+        self._queue.cancel_join_thread()
+        self._process.terminate()
+        self._process.join()
+
+    def _raise_terminated(self):
+        """\
+        Raises an error after the worker process terminated before the end
+        of the event stream.
+        """
+        # The worker reports an error of the handler before it terminates
+        try:
+            error = self._result.get(True, _PUT_TIMEOUT)
+        except Empty:
+            error = None
+        self._queue.cancel_join_thread()
+        self._process.join()
+        if error is not None:
+            raise RuntimeError('Error in worker process:\n%s' % error)
+        raise RuntimeError('The worker process terminated unexpectedly (exit code: %r)' % self._process.exitcode)
+
+
+class FanOutCableHandler(object):
+    """\
+    A `ICableHandler` which delegates the events to multiple underlying
+    handlers which run in their own worker threads or processes.
+
+    The events of a cable are delivered after the ``end_cable`` event, the
+    ``start`` event is delivered at once and the ``end`` event returns after
+    all underlying handlers have processed all events.
+
+    If an underlying handler raised an error (or its worker process
+    terminated), the error is re-raised by the next ``end_cable`` or ``end``
+    event and all workers are stopped. Errors of worker processes are
+    reported as `RuntimeError`.
+    """
+    implements(ICableHandler)
+
+    def __init__(self, handlers, max_cables=DEFAULT_MAX_CABLES):
+        """\
+
+        `handlers`
+            An iterable of `ICableHandler` instances, which run in a worker
+            thread, or `SubprocessHandler` instances, which run in a worker
+            process.
+        `max_cables`
+            The max. number of processed cables which are queued per handler.
+        """
+        self._workers = tuple(_ProcessWorker(h, max_cables) if isinstance(h, SubprocessHandler)
+                              else _ThreadWorker(h, max_cables) for h in handlers)
+        self.wanted_events = _union_wanted_events(self._workers)
+        self._events = []
+        append = self._events.append
+        for name in CABLE_EVENTS:
+            setattr(self, name, self._recorder(name, append))
+
+    @staticmethod
+    def _recorder(name, append):
+        def record(*args):
+            append((name, args))
+        return record
+
+    def __getattr__(self, name):
+        # Called for unknown events only
+        return self._recorder(name, self._events.append)
+
+    def start(self):
+        for worker in self._workers:
+            worker.start()
+        self._events.append(('start', ()))
+        self._flush()
+
+    def start_cable(self, reference_id, canonical_id):
+        self._events.append(('start_cable', (reference_id, canonical_id)))
+
+    def end_cable(self):
+        self._events.append(('end_cable', ()))
+        self._flush()
+
+    def end(self):
+        self._events.append(('end', ()))
+        self._flush()
+        error = None
+        for worker in self._workers:
+            try:
+                worker.join()
+            except Exception:
+                if error is None:
+                    error = sys.exc_info()
+        if error is not None:
+            raise error[0], error[1], error[2]
+
+    def _flush(self):
+        events = self._events[:]
+        del self._events[:]
+        try:
+            for worker in self._workers:
+                worker.put(events)
+        except Exception:
+            # A handler failed: stop all workers and report the error at once
+            error = sys.exc_info()
+            for worker in self._workers:
+                try:
+                    worker.abort()
+                except Exception:
+                    pass
+            raise error[0], error[1], error[2]
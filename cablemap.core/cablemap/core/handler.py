@@ -13,17 +13,63 @@ This module defines a event handlers to process cables.
 :license:      BSD license
 """
 from __future__ import absolute_import
+import os
 import logging
-import urllib2
+from functools import partial
 from .utils import cables_from_source, titlefy
 from .interfaces import ICableHandler, implements
 
+# All events which may be issued between ``start_cable`` and ``end_cable``
+CABLE_EVENTS = frozenset([
+    'handle_wikileaks_iri', 'handle_creation_datetime', 'handle_release_date',
+    'handle_nondisclosure_deadline', 'handle_transmission_id', 'handle_subject',
+    'handle_summary', 'handle_comment', 'handle_header', 'handle_content',
+    'handle_origin', 'handle_classification', 'handle_partial',
+    'handle_classification_category', 'handle_classificationist',
+    'handle_signer', 'handle_tag', 'handle_media_iri', 'handle_recipient',
+    'handle_info_recipient', 'handle_reference',
+    ])
+
+
+def wanted_events(handler):
+    """\
+    Returns the events (a frozenset of event names) the provided `handler`
+    consumes or ``None`` if the handler wants to receive all events.
+
+    c.f. `cablemap.core.interfaces.ICableHandler.wanted_events`
+
+    `handler`
+        A `ICableHandler` instance.
+    """
+    wanted = getattr(handler, 'wanted_events', None)
+    # Handlers which resolve all attributes via __getattr__ return an event function
+    if wanted is None or callable(wanted):
+        return None
+    return frozenset(wanted)
+
+
+def _union_wanted_events(handlers):
+    """\
+    Returns the union of the events the `handlers` consume or ``None``
+    if one of the handlers wants to receive all events.
+    """
+    res = frozenset()
+    for handler in handlers:
+        wanted = wanted_events(handler)
+        if wanted is None:
+            return None
+        res |= wanted
+    return res
+
 
 class NoopCableHandler(object):
     """\
     `ICableHandler` implementation which does nothing.
     """
     implements(ICableHandler)
+
+    # Subclasses do not declare which events they consume by default
+    wanted_events = None
     
     def __getattr__(self, name):
         def noop(*args): pass
@@ -44,6 +90,10 @@ class DelegatingCableHandler(object):
         """
         self._handler = handler
 
+    @property
+    def wanted_events(self):
+        return wanted_events(self._handler)
+
     def __getattr__(self, name):
         return getattr(self._handler, name)
 
@@ -55,16 +105,31 @@ class LoggingCableHandler(object):
     """
     implements(ICableHandler)
     
-    def __init__(self, handler, level='info'):
+    def __init__(self, handler, level='info', instrumentation=None):
         """\
 
         `handler`
             The ICableHandler instance which should receive the events.
         `level`
             The logging level (default: 'info')
+        `instrumentation`
+            An optional `cablemap.core.instrument.Instrumentation` instance.
+            If provided, a summary of the timings is logged at ``end()``.
         """
         self._handler = handler
         self.level = level
+        self.instrumentation = instrumentation
+
+    @property
+    def wanted_events(self):
+        return wanted_events(self._handler)
+
+    def end(self):
+        log = getattr(logging, self.level)
+        log('end()')
+        self._handler.end()
+        if self.instrumentation is not None:
+            log('Timings:\n%s' % self.instrumentation.summary())
 
     def __getattr__(self, name):
         def logme(*args):
@@ -91,6 +156,10 @@ class TeeCableHandler(object):
         self._first = first
         self._second = second
 
+    @property
+    def wanted_events(self):
+        return _union_wanted_events((self._first, self._second))
+
     def __getattr__(self, name):
         def delegate(*args):
             getattr(self._first, name)(*args)
@@ -113,6 +182,10 @@ class MultipleCableHandler(object):
         """
         self._handlers = tuple(handlers)
 
+    @property
+    def wanted_events(self):
+        return _union_wanted_events(self._handlers)
+
     def __getattr__(self, name):
         def delegate(*args):
             for handler in self._handlers:
@@ -161,6 +234,8 @@ class CableIdFilter(DelegatingCableHandler):
         return noop
 
 
+_METADATA_ONLY_OMITTED_EVENTS = frozenset(['handle_release_date', 'handle_content', 'handle_header'])
+
 class DefaultMetadataOnlyFilter(DelegatingCableHandler):
     """\
     ICableHandler implementation that acts as filter to omit the
@@ -179,6 +254,11 @@ class DefaultMetadataOnlyFilter(DelegatingCableHandler):
         if titlefy_subject:
             self.handle_subject = self._handle_subject_titlefy
 
+    @property
+    def wanted_events(self):
+        wanted = wanted_events(self._handler)
+        return (CABLE_EVENTS if wanted is None else wanted) - _METADATA_ONLY_OMITTED_EVENTS
+
     def handle_wikileaks_iri(self, iri):
         if iri.startswith(u'http://wikileaks.org') and iri.endswith(u'html'):
             self._handler.handle_wikileaks_iri(iri)
@@ -216,6 +296,7 @@ class DebitlyFilter(DelegatingCableHandler):
         }
 
     def handle_media_iri(self, iri):
+        import urllib2
         class HeadRequest(urllib2.Request):
             def get_method(self):
                 return 'HEAD'
@@ -231,10 +312,128 @@ class DebitlyFilter(DelegatingCableHandler):
         self._handler.handle_media_iri(iri)
 
 
+# Events which are issued independently of the wanted events
+_LIFECYCLE_EVENTS = ('start', 'end', 'start_cable', 'end_cable')
+
+
+class DispatchCableHandler(object):
+    """\
+    A `ICableHandler` which binds each event to a flat tuple of the methods
+    of the underlying handlers.
+
+    The handler tree is resolved once when the `DispatchCableHandler` is
+    created: `TeeCableHandler`, `MultipleCableHandler` and the events which
+    a `DelegatingCableHandler` (or a subclass) does not override are
+    flattened; `NoopCableHandler` instances and events which are not wanted
+    by a handler (c.f. `wanted_events`) are dropped. An event with no method
+    left is not wanted by the `DispatchCableHandler` at all, so
+    `handle_cable` does not issue it.
+
+    Handlers which resolve events dynamically through a custom ``__getattr__``
+    (i.e. `CableIdFilter`) are asked for the event method on each event.
+
+    The handler tree must not be changed after the `DispatchCableHandler`
+    was created.
+    """
+    implements(ICableHandler)
+
+    def __init__(self, handler):
+        """\
+
+        `handler`
+            The ICableHandler instance which should receive the events.
+        """
+        self._handler = handler
+        self._methods = {}
+        for name in _LIFECYCLE_EVENTS + tuple(sorted(CABLE_EVENTS)):
+            methods = self._methods[name] = tuple(_event_methods(handler, name))
+            setattr(self, name, _dispatcher(methods))
+        self.wanted_events = frozenset(name for name in CABLE_EVENTS if self._methods[name])
+
+    def __getattr__(self, name):
+        # Called for unknown events only
+        return getattr(self._handler, name)
+
+
+def _event_methods(handler, name):
+    """\
+    Returns an iterable of callables which should receive the event `name`
+    of the provided `handler`.
+    """
+    cls = type(handler)
+    if cls is DispatchCableHandler:
+        methods = handler._methods.get(name)
+        return methods if methods is not None else (getattr(handler, name),)
+    if cls is TeeCableHandler:
+        return _event_methods(handler._first, name) + _event_methods(handler._second, name)
+    if cls is MultipleCableHandler:
+        return tuple(method for h in handler._handlers for method in _event_methods(h, name))
+    if cls is NoopCableHandler:
+        return ()
+    if name in CABLE_EVENTS:
+        wanted = wanted_events(handler)
+        if wanted is not None and name not in wanted:
+            return ()
+    try:
+        return (object.__getattribute__(handler, name),)
+    except AttributeError:
+        pass
+    # The event is resolved by __getattr__
+    if cls is CableIdFilter:
+        dispatch = _dispatcher(_event_methods(handler._handler, name))
+        if dispatch is _noop:
+            return ()
+        def accepted(*args):
+            if handler._accept:
+                dispatch(*args)
+        return (accepted,)
+    getattr_ = getattr(cls.__getattr__, 'im_func', None) if hasattr(cls, '__getattr__') else None
+    if getattr_ is DelegatingCableHandler.__dict__['__getattr__']:
+        return _event_methods(handler._handler, name)
+    if getattr_ is NoopCableHandler.__dict__['__getattr__']:
+        return ()
+    if getattr_ is LoggingCableHandler.__dict__['__getattr__']:
+        # Stateless, the returned function can be reused
+        return (getattr(handler, name),)
+    return (partial(_call_event, handler, name),)
+
+
+def _call_event(handler, name, *args):
+    getattr(handler, name)(*args)
+
+
+def _dispatcher(methods):
+    """\
+    Returns a function which invokes all `methods`.
+    """
+    if not methods:
+        return _noop
+    if len(methods) == 1:
+        return methods[0]
+    if len(methods) == 2:
+        first, second = methods
+        def dispatch2(*args):
+            first(*args)
+            second(*args)
+        return dispatch2
+    def dispatch(*args):
+        for method in methods:
+            method(*args)
+    return dispatch
+
+
+def _noop(*args):
+    pass
+
+
 def handle_cable(cable, handler, standalone=True):
     """\
     Emits event from the provided `cable` to the handler.
 
+    Only those events are issued which are consumed by the `handler`
+    (c.f. `wanted_events`); properties of the cable which are not needed
+    are not parsed at all.
+
     `cable`
         A cable object.
     `handler`
@@ -245,54 +444,99 @@ def handle_cable(cable, handler, standalone=True):
         If `standalone` is set to ``False``, no ``handler.start()``
         and ``handler.end()`` event will be issued.
     """
+    if standalone:
+        handler.start()
+    _handle_cable(cable, handler, wanted_events(handler))
+    if standalone:
+        handler.end()
+
+
+def _handle_cable(cable, handler, wanted):
+    """\
+    Emits the events of the provided `cable` between ``start_cable``
+    and ``end_cable``.
+
+    `wanted`
+        A set of event names which should be issued or ``None`` to
+        issue all events.
+    """
     def datetime(dt):
         date, time = dt.split(u' ')
         if len(time) == 5:
             time += u':00'
         time += u'Z'
         return u'T'.join([date, time])
-    if standalone:
-        handler.start()
+    want = wanted.__contains__ if wanted is not None else _want_all
     handler.start_cable(cable.reference_id, cable.canonical_id)
-    for iri in cable.wl_uris:
-        handler.handle_wikileaks_iri(iri)
-    handler.handle_creation_datetime(datetime(cable.created))
-    if cable.released:
-        handler.handle_release_date(cable.released[:10])
-    if cable.nondisclosure_deadline:
-        handler.handle_nondisclosure_deadline(cable.nondisclosure_deadline)
-    if cable.transmission_id:
-        handler.handle_transmission_id(cable.transmission_id)
-    if cable.subject:
-        handler.handle_subject(cable.subject)
-    if cable.summary:
-        handler.handle_summary(cable.summary)
-    if cable.comment:
-        handler.handle_comment(cable.comment)
-    handler.handle_header(cable.header)
-    handler.handle_content(cable.content)
-    handler.handle_origin(cable.origin)
-    handler.handle_classification(cable.classification)
-    handler.handle_partial(cable.partial)
-    for cat in cable.classification_categories:
-        handler.handle_classification_category(cat)
-    for classificationist in cable.classificationists:
-        handler.handle_classificationist(classificationist)
-    for signer in cable.signers:
-        handler.handle_signer(signer)
-    for tag in cable.tags:
-        handler.handle_tag(tag)
-    for iri in cable.media_uris:
-        handler.handle_media_iri(iri)
-    for rec in cable.recipients:
-        handler.handle_recipient(rec)
-    for rec in cable.info_recipients:
-        handler.handle_info_recipient(rec)
-    for ref in cable.references:
-        handler.handle_reference(ref)
+    if want('handle_wikileaks_iri'):
+        for iri in cable.wl_uris:
+            handler.handle_wikileaks_iri(iri)
+    if want('handle_creation_datetime'):
+        handler.handle_creation_datetime(datetime(cable.created))
+    if want('handle_release_date'):
+        released = cable.released
+        if released:
+            handler.handle_release_date(released[:10])
+    if want('handle_nondisclosure_deadline'):
+        nondisclosure_deadline = cable.nondisclosure_deadline
+        if nondisclosure_deadline:
+            handler.handle_nondisclosure_deadline(nondisclosure_deadline)
+    if want('handle_transmission_id'):
+        transmission_id = cable.transmission_id
+        if transmission_id:
+            handler.handle_transmission_id(transmission_id)
+    if want('handle_subject'):
+        subject = cable.subject
+        if subject:
+            handler.handle_subject(subject)
+    if want('handle_summary'):
+        summary = cable.summary
+        if summary:
+            handler.handle_summary(summary)
+    if want('handle_comment'):
+        comment = cable.comment
+        if comment:
+            handler.handle_comment(comment)
+    if want('handle_header'):
+        handler.handle_header(cable.header)
+    if want('handle_content'):
+        handler.handle_content(cable.content)
+    if want('handle_origin'):
+        handler.handle_origin(cable.origin)
+    if want('handle_classification'):
+        handler.handle_classification(cable.classification)
+    if want('handle_partial'):
+        handler.handle_partial(cable.is_partial)
+    if want('handle_classification_category'):
+        for cat in cable.classification_categories:
+            handler.handle_classification_category(cat)
+    if want('handle_classificationist'):
+        for classificationist in cable.classified_by:
+            handler.handle_classificationist(classificationist)
+    if want('handle_signer'):
+        for signer in cable.signed_by:
+            handler.handle_signer(signer)
+    if want('handle_tag'):
+        for tag in cable.tags:
+            handler.handle_tag(tag)
+    if want('handle_media_iri'):
+        for iri in cable.media_uris:
+            handler.handle_media_iri(iri)
+    if want('handle_recipient'):
+        for rec in cable.recipients:
+            handler.handle_recipient(rec)
+    if want('handle_info_recipient'):
+        for rec in cable.info_recipients:
+            handler.handle_info_recipient(rec)
+    if want('handle_reference'):
+        for ref in cable.references:
+            handler.handle_reference(ref)
     handler.end_cable()
-    if standalone:
-        handler.end()
+
+
+def _want_all(name):
+    return True
+
 
 def handle_cables(cables, handler):
     """\
@@ -304,19 +548,24 @@ def handle_cables(cables, handler):
     `handler`
         The `ICableHandler` instance which should receive the events.
     """
+    wanted = wanted_events(handler)
     handler.start()
     for cable in cables:
-        handle_cable(cable, handler, False)
+        _handle_cable(cable, handler, wanted)
     handler.end()
 
 
-def handle_source(path, handler, predicate=None):
+def handle_source(path, handler, predicate=None, workers=None, cache=None, since=None):
     """\
     Reads all cables from the provided source and issues events to
     the `handler`.
 
+    Returns ``None`` or a `cablemap.core.manifest.DirectoryChanges` instance
+    if `since` was provided.
+
     `path`
-        Either a directory with cable files or a CSV file.
+        Either a directory with cable files, an archive of cable files or
+        a (compressed) CSV file (c.f. `cablemap.core.utils.cables_from_source`).
     `handler`
         The `ICableHandler` instance which should receive the events.
     `predicate`
@@ -325,5 +574,42 @@ def handle_source(path, handler, predicate=None):
         By default, all cables are used.
         I.e. ``handle_source('cables.csv', handler, lambda r: r.startswith('09'))``
         would return cables where the reference identifier starts with ``09``.
+    `workers`
+        The number of processes which should parse the cables. If `workers`
+        is ``None`` (default) or ``1``, the cables are parsed by the calling
+        process. Otherwise, the cables are parsed by a pool of `workers`
+        processes (c.f. `cablemap.core.parallel`) and the events are issued
+        in the original order of the source.
+    `cache`
+        An optional `cablemap.core.cache.ParseCache`. If a cache is provided,
+        the parsed properties are taken from the cache and only the cables
+        which are not in the cache are parsed. The cables are parsed by the
+        calling process, `workers` is ignored.
+    `since`
+        An optional `cablemap.core.manifest.Manifest` of a previous run.
+        If a manifest is provided, the `path` must be a directory and only
+        new and changed cables are issued to the `handler`. The returned
+        `cablemap.core.manifest.DirectoryChanges` provides the new manifest
+        and the reference identifiers of the added, changed and deleted
+        cables. The cables are parsed by the calling process, `workers` is
+        ignored.
     """
-    handle_cables(cables_from_source(path, predicate), handler)
+    changes = None
+    if since is not None:
+        from cablemap.core.manifest import DirectoryChanges
+        if not os.path.isdir(path):
+            raise ValueError('A manifest requires a directory, got: "%s"' % path)
+        changes = DirectoryChanges(path, since, predicate)
+    if cache is not None:
+        from cablemap.core.parallel import properties_for_events
+        cables = cache.cached_cables(changes if changes is not None else cables_from_source(path, predicate),
+                                     properties_for_events(wanted_events(handler)))
+    elif changes is not None:
+        cables = changes
+    elif workers is not None and workers > 1:
+        from cablemap.core.parallel import parsed_cables_from_source
+        cables = parsed_cables_from_source(path, predicate, workers, wanted_events(handler))
+    else:
+        cables = cables_from_source(path, predicate)
+    handle_cables(cables, handler)
+    return changes
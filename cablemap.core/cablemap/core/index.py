@@ -0,0 +1,194 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (c) 2011 - 2015 -- Lars Heuer <heuer[at]semagia.com>
+# All rights reserved.
+#
+# License: BSD, see LICENSE.txt for more details.
+#
+"""\
+Provides random access to the cables of a CSV file.
+
+The index maps the reference identifiers (and canonical identifiers) of the
+cables to the byte offset and the length of their rows::
+
+    from cablemap.core.index import build_index, cable_from_index
+
+    index = build_index('cables.csv')
+    index.save('cables.idx')
+    ...
+    index = load_index('cables.idx', 'cables.csv')
+    cable = cable_from_index(index, '09BERLIN1167')
+
+:author:       Lars Heuer (heuer[at]semagia.com)
+:organization: Semagia - <http://www.semagia.com/>
+:license:      BSD license
+"""
+from __future__ import absolute_import, with_statement
+import csv
+from cablemap.core.models import cable_from_row
+from cablemap.core.c14n import canonicalize_id
+
+__all__ = ['CableIndex', 'build_index', 'load_index', 'cable_from_index']
+
+
+class CableIndex(object):
+    """\
+    Maps cable identifiers to the position of their rows within a CSV file.
+    """
+    def __init__(self, filename, entries=(), encoding='utf-8'):
+        """\
+
+        `filename`
+            The CSV file the index refers to.
+        `entries`
+            An iterable of ``(reference_id, canonical_id, offset, length)``
+            tuples.
+        `encoding`
+            The encoding of the CSV file (``UTF-8`` by default).
+        """
+        self.filename = filename
+        self.encoding = encoding
+        self._positions = {}
+        self._canonical_ids = {}
+        self._file = None
+        for reference_id, canonical_id, offset, length in entries:
+            self.add(reference_id, canonical_id, offset, length)
+
+    def add(self, reference_id, canonical_id, offset, length):
+        """\
+        Adds an entry to the index.
+
+        `reference_id`
+            The reference identifier of the cable.
+        `canonical_id`
+            The canonical identifier of the cable.
+        `offset`
+            The byte offset of the row.
+        `length`
+            The length of the row in bytes.
+        """
+        self._positions[reference_id] = (offset, length)
+        if canonical_id != reference_id:
+            self._canonical_ids[canonical_id] = reference_id
+
+    def __len__(self):
+        return len(self._positions)
+
+    def __iter__(self):
+        return iter(self._positions)
+
+    def __contains__(self, cable_id):
+        return self.locate(cable_id) is not None
+
+    def locate(self, cable_id):
+        """\
+        Returns a tuple ``(offset, length)`` of the row of the cable or
+        ``None`` if the cable is unknown.
+
+        `cable_id`
+            A reference identifier or a canonical identifier.
+        """
+        pos = self._positions.get(cable_id)
+        if pos is None:
+            pos = self._positions.get(self._canonical_ids.get(cable_id))
+        return pos
+
+    def row(self, cable_id):
+        """\
+        Returns the row of the cable or ``None`` if the cable is unknown.
+
+        `cable_id`
+            A reference identifier or a canonical identifier.
+        """
+        pos = self.locate(cable_id)
+        if pos is None:
+            return None
+        offset, length = pos
+        if self._file is None:
+            self._file = open(self.filename, 'rb')
+        self._file.seek(offset)
+        data = self._file.read(length)
+        row = next(csv.reader(data.splitlines(True), delimiter=',', quotechar='"', escapechar='\\'))
+        encoding = self.encoding
+        return tuple(unicode(col, encoding) for col in row)
+
+    def save(self, filename):
+        """\
+        Writes the index to the provided `filename`.
+        """
+        canonical_ids = dict((v, k) for k, v in self._canonical_ids.iteritems())
+        with open(filename, 'wb') as f:
+            writer = csv.writer(f)
+            for reference_id, (offset, length) in sorted(self._positions.iteritems(), key=lambda item: item[1]):
+                writer.writerow((reference_id.encode('utf-8'),
+                                 canonical_ids.get(reference_id, reference_id).encode('utf-8'),
+                                 offset, length))
+
+    def close(self):
+        """\
+        Closes the underlying CSV file.
+        """
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+def build_index(filename, encoding='utf-8'):
+    """\
+    Reads the provided CSV file and returns a `CableIndex`.
+
+    `filename`
+        Absolute path to a CSV file, c.f. `cablemap.core.utils.cables_from_csv`
+        The encoding must be ASCII compatible.
+    `encoding`
+        The file encoding (``UTF-8`` by default).
+    """
+    def lines(f):
+        readline = f.readline
+        line = readline()
+        while line:
+            consumed[0] += len(line)
+            yield line
+            line = readline()
+    consumed = [0]
+    index = CableIndex(filename, encoding=encoding)
+    with open(filename, 'rb') as f:
+        offset = 0
+        for row in csv.reader(lines(f), delimiter=',', quotechar='"', escapechar='\\'):
+            # The CSV reader consumes the lines of exactly one row
+            end = consumed[0]
+            reference_id = unicode(row[2], encoding)
+            index.add(reference_id, canonicalize_id(reference_id), offset, end - offset)
+            offset = end
+    return index
+
+
+def load_index(index_filename, filename, encoding='utf-8'):
+    """\
+    Returns a `CableIndex` which was saved by `CableIndex.save`.
+
+    `index_filename`
+        The file which contains the index.
+    `filename`
+        The CSV file the index refers to.
+    `encoding`
+        The file encoding of the CSV file (``UTF-8`` by default).
+    """
+    with open(index_filename, 'rb') as f:
+        entries = [(unicode(reference_id, 'utf-8'), unicode(canonical_id, 'utf-8'), int(offset), int(length))
+                   for reference_id, canonical_id, offset, length in csv.reader(f)]
+    return CableIndex(filename, entries, encoding)
+
+
+def cable_from_index(index, cable_id):
+    """\
+    Returns the cable identified by `cable_id` or ``None`` if the
+    cable is not part of the `index`.
+
+    `index`
+        A `CableIndex` instance.
+    `cable_id`
+        A reference identifier or a canonical identifier.
+    """
+    row = index.row(cable_id)
+    return cable_from_row(row) if row else None
@@ -0,0 +1,344 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (c) 2011 - 2015 -- Lars Heuer <heuer[at]semagia.com>
+# All rights reserved.
+#
+# License: BSD, see LICENSE.txt for more details.
+#
+"""\
+Opt-in timing instrumentation of the `cablemap.core.reader` parsers and of
+`cablemap.core.interfaces.ICableHandler` events.
+
+Nothing is measured unless an `Instrumentation` is enabled (which replaces
+the ``reader.parse_*`` functions by timing wrappers until it is disabled)
+or a handler is wrapped by `Instrumentation.handler`::
+
+    from cablemap.core import handle_source
+    from cablemap.core.instrument import Instrumentation
+
+    instrumentation = Instrumentation()
+    with instrumentation:
+        handle_source('cables.csv', instrumentation.handler(handler))
+    print instrumentation.to_json()
+
+The timings are recorded per key: ``reader.<function name>`` for parsers,
+``handler.<event name>`` for handler events and ``handler.cable`` for the
+time between ``start_cable`` and ``end_cable`` (including the parsing of
+the cable properties on demand).
+
+The call count, the cumulative and the max. duration are exact. The
+percentiles are computed from a uniform sample (reservoir) of at most
+`DEFAULT_SAMPLES` durations per key, so memory stays bounded for long runs;
+they are exact as long as a key was not recorded more often.
+
+Parsers are measured in the calling process only, cables which are parsed
+by worker processes (c.f. `cablemap.core.parallel`) are not measured.
+
+:author:       Lars Heuer (heuer[at]semagia.com)
+:organization: Semagia - <http://www.semagia.com/>
+:license:      BSD license
+"""
+from __future__ import absolute_import
+import json
+import heapq
+import random
+import inspect
+from functools import wraps
+from timeit import default_timer
+from cablemap.core import reader
+from cablemap.core.interfaces import ICableHandler, implements
+from cablemap.core.handler import DispatchCableHandler, CABLE_EVENTS
+
+__all__ = ['Instrumentation', 'InstrumentedCableHandler', 'DEFAULT_SAMPLES']
+
+# Percentiles which are reported by `Instrumentation.stats`
+PERCENTILES = (50, 90, 99)
+
+# Max. number of durations which are kept per key to compute the percentiles
+DEFAULT_SAMPLES = 1000
+
+
+class _Timing(object):
+    """\
+    Collects the statistics of one key.
+    """
+    __slots__ = ('count', 'total', 'max', 'samples', 'slowest')
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        # Uniform sample of the durations (reservoir sampling)
+        self.samples = []
+        # Min-heap of (duration, cable id) tuples
+        self.slowest = []
+
+
+def _percentile(sorted_durations, percent):
+    """\
+    Returns the `percent` percentile (nearest rank) of the sorted durations.
+    """
+    index = max(0, -(-len(sorted_durations) * percent // 100) - 1)
+    return sorted_durations[index]
+
+
+class Instrumentation(object):
+    """\
+    Collects call counts and timings per parser and per handler event and
+    remembers the slowest cables per key.
+    """
+    def __init__(self, slowest=10, samples=DEFAULT_SAMPLES):
+        """\
+
+        `slowest`
+            The number of slowest cable ids which are remembered per key
+            (default: ``10``).
+        `samples`
+            The max. number of durations which are kept per key to compute
+            the percentiles (default: `DEFAULT_SAMPLES`).
+        """
+        self._max_slowest = slowest
+        self._max_samples = max(1, samples)
+        self._random = random.Random(0)
+        self._timings = {}
+        self._originals = None
+        # Reference id of the cable which is processed currently
+        self.cable_id = None
+
+    def record(self, key, duration, cable_id=None):
+        """\
+        Records a duration.
+
+        `key`
+            The name of the measured operation, i.e. ``reader.parse_tags``.
+        `duration`
+            The duration in seconds.
+        `cable_id`
+            The reference id of the cable or ``None``; if it is ``None``,
+            the `cable_id` attribute of this instance is used.
+        """
+        timing = self._timings.get(key)
+        if timing is None:
+            timing = self._timings[key] = _Timing()
+        timing.count += 1
+        timing.total += duration
+        if duration > timing.max or timing.count == 1:
+            timing.max = duration
+        samples = timing.samples
+        if len(samples) < self._max_samples:
+            samples.append(duration)
+        else:
+            index = self._random.randrange(timing.count)
+            if index < self._max_samples:
+                samples[index] = duration
+        if self._max_slowest:
+            item = (duration, cable_id if cable_id is not None else self.cable_id)
+            if len(timing.slowest) < self._max_slowest:
+                heapq.heappush(timing.slowest, item)
+            elif duration > timing.slowest[0][0]:
+                heapq.heapreplace(timing.slowest, item)
+
+    def reset(self):
+        """\
+        Discards all recorded timings.
+        """
+        self._timings.clear()
+
+    @property
+    def enabled(self):
+        """\
+        Indicates if the reader functions are instrumented by this instance.
+        """
+        return self._originals is not None
+
+    def enable(self):
+        """\
+        Replaces the ``parse_*`` functions of the `cablemap.core.reader`
+        module by functions which record their timings.
+
+        Only one `Instrumentation` can be enabled at a time.
+        """
+        if self._originals is not None:
+            return
+        originals = dict((name, func) for name, func in vars(reader).items()
+                         if name.startswith('parse_') and inspect.isfunction(func))
+        if any(hasattr(func, 'instrumentation') for func in originals.values()):
+            raise RuntimeError('The reader is already instrumented')
+        for name, func in originals.items():
+            setattr(reader, name, self._timed(func, 'reader.' + name))
+        self._originals = originals
+
+    def disable(self):
+        """\
+        Restores the original ``parse_*`` functions of the
+        `cablemap.core.reader` module.
+        """
+        if self._originals is None:
+            return
+        for name, func in self._originals.items():
+            setattr(reader, name, func)
+        self._originals = None
+
+    def __enter__(self):
+        self.enable()
+        return self
+
+    def __exit__(self, exc_type, exc_value, tb):
+        self.disable()
+
+    def _timed(self, func, key):
+        """\
+        Returns a function which records the timings of `func`.
+        """
+        args = inspect.getargspec(func).args
+        index = args.index('reference_id') if 'reference_id' in args else None
+        record = self.record
+        @wraps(func)
+        def timed(*args, **kw):
+            start = default_timer()
+            try:
+                return func(*args, **kw)
+            finally:
+                duration = default_timer() - start
+                cable_id = kw.get('reference_id')
+                if cable_id is None and index is not None and index < len(args):
+                    cable_id = args[index]
+                record(key, duration, cable_id)
+        timed.instrumentation = self
+        return timed
+
+    def handler(self, handler):
+        """\
+        Returns a `InstrumentedCableHandler` which records the timings of
+        the events of the provided `handler`.
+
+        `handler`
+            A `ICableHandler` instance.
+        """
+        return InstrumentedCableHandler(handler, self)
+
+    def stats(self):
+        """\
+        Returns a dict which maps the keys to a dict with the call count,
+        the cumulative, mean, max. and percentile durations (in seconds)
+        and the slowest cables (a list of ``[cable id, duration]`` pairs,
+        slowest first).
+
+        The percentiles are estimated from a sample of the durations if a
+        key was recorded more than `samples` times (c.f. `__init__`).
+        """
+        res = {}
+        for key, timing in self._timings.iteritems():
+            durations = sorted(timing.samples)
+            stats = {
+                'count': timing.count,
+                'total': timing.total,
+                'mean': timing.total / timing.count,
+                'max': timing.max,
+                'slowest': [[cable_id, duration] for duration, cable_id in sorted(timing.slowest, reverse=True)],
+            }
+            for percent in PERCENTILES:
+                stats['p%d' % percent] = _percentile(durations, percent)
+            res[key] = stats
+        return res
+
+    def to_json(self, fileobj=None, **kw):
+        """\
+        Returns the statistics (c.f. `stats`) as JSON string or writes
+        them into the provided file-like object.
+
+        `fileobj`
+            An optional file-like object.
+        `kw`
+            Further arguments for ``json.dump``, i.e. ``indent=2``.
+        """
+        kw.setdefault('sort_keys', True)
+        if fileobj is None:
+            return json.dumps(self.stats(), **kw)
+        json.dump(self.stats(), fileobj, **kw)
+
+    def summary(self, limit=None):
+        """\
+        Returns a human readable summary of the statistics; the keys are
+        sorted by their cumulative duration.
+
+        `limit`
+            The max. number of keys to report or ``None`` (default) to
+            report all keys.
+        """
+        stats = sorted(self.stats().iteritems(), key=lambda item: item[1]['total'], reverse=True)
+        lines = ['%-40s %9s %10s %10s %10s %10s  %s' % ('key', 'count', 'total (s)', 'mean (ms)', 'p90 (ms)', 'max (ms)', 'slowest')]
+        for key, s in stats[:limit]:
+            slowest = s['slowest'][0][0] if s['slowest'] else None
+            lines.append('%-40s %9d %10.3f %10.3f %10.3f %10.3f  %s' % (key, s['count'], s['total'], s['mean'] * 1000,
+                                                                       s['p90'] * 1000, s['max'] * 1000, slowest or ''))
+        return '\n'.join(lines)
+
+
+class InstrumentedCableHandler(object):
+    """\
+    A `ICableHandler` which records the timings of the events of the
+    underlying `ICableHandler`.
+
+    Each event is recorded as ``handler.<event name>``; the time between
+    ``start_cable`` and ``end_cable`` is recorded as ``handler.cable``.
+    The reference id of the current cable is provided to the `Instrumentation`
+    so that parsers without a reference id parameter are attributed to the
+    cable as well.
+    """
+    implements(ICableHandler)
+
+    def __init__(self, handler, instrumentation):
+        """\
+
+        `handler`
+            The ICableHandler instance which should receive the events.
+        `instrumentation`
+            The `Instrumentation` which records the timings.
+        """
+        # Resolves handlers like `CableIdFilter` which decide per cable
+        self._handler = DispatchCableHandler(handler)
+        self._instrumentation = instrumentation
+        self._cable_start = None
+        self.wanted_events = self._handler.wanted_events
+        for name in self.wanted_events:
+            setattr(self, name, self._timed(name))
+
+    def _timed(self, name):
+        method = getattr(self._handler, name)
+        record = self._instrumentation.record
+        key = 'handler.' + name
+        def timed(*args):
+            start = default_timer()
+            method(*args)
+            record(key, default_timer() - start)
+        return timed
+
+    def start(self):
+        start = default_timer()
+        self._handler.start()
+        self._instrumentation.record('handler.start', default_timer() - start)
+
+    def end(self):
+        start = default_timer()
+        self._handler.end()
+        self._instrumentation.record('handler.end', default_timer() - start)
+
+    def start_cable(self, reference_id, canonical_id):
+        self._instrumentation.cable_id = reference_id
+        self._cable_start = start = default_timer()
+        self._handler.start_cable(reference_id, canonical_id)
+        self._instrumentation.record('handler.start_cable', default_timer() - start)
+
+    def end_cable(self):
+        start = default_timer()
+        self._handler.end_cable()
+        end = default_timer()
+        instrumentation = self._instrumentation
+        instrumentation.record('handler.end_cable', end - start)
+        instrumentation.record('handler.cable', end - self._cable_start)
+        instrumentation.cable_id = None
+
+    def __getattr__(self, name):
+        # Called for unknown events only
+        return getattr(self._handler, name)
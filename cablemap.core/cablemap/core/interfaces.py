@@ -286,6 +286,16 @@ class ICableHandler(Interface):
     ``None`` values are not accepted by handler. If something is ``None`` (like
     the subject), the event must not be issued.
     """
+    wanted_events = Attribute("""\
+    Optional. An iterable of event names (i.e. ``'handle_subject'``) the
+    handler consumes or ``None`` if the handler wants to receive all events.
+
+    The `start`, `end`, `start_cable`, and `end_cable` events are always
+    issued. Event sources may skip the parsing of cable properties which
+    are not consumed by the handler.
+
+    This attribute is read-only.
+    """)
 
     def start():
         """\
@@ -483,3 +493,44 @@ class ICableHandler(Interface):
         `iri`
             The IRI to add.
         """
+
+
+class IBatchCableHandler(Interface):
+    """\
+    Defines an interface for classes which process chunks of cables at once.
+
+    The first event is `start` and the last event must be `end`.
+    Between these events one or more `handle_batch` events occur.
+
+    c.f. `cablemap.core.batch`
+    """
+    wanted_columns = Attribute("""\
+    Optional. An iterable of cable property names (i.e. ``'tags'``) the
+    handler consumes or ``None`` if the handler wants to receive all
+    properties (c.f. `cablemap.core.models.PARSED_CABLE_FIELDS`).
+
+    The metadata (reference id, canonical id, creation date, release date,
+    origin, classification, and the media IRIs) is always provided.
+    Event sources may skip the parsing of cable properties which are not
+    consumed by the handler.
+
+    This attribute is read-only.
+    """)
+
+    def start():
+        """\
+        First event.
+        """
+
+    def end():
+        """\
+        Last event.
+        """
+
+    def handle_batch(batch):
+        """\
+        Processes a chunk of cables.
+
+        `batch`
+            A `cablemap.core.batch.CableBatch` instance.
+        """
@@ -0,0 +1,171 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (c) 2011 - 2015 -- Lars Heuer <heuer[at]semagia.com>
+# All rights reserved.
+#
+# License: BSD, see LICENSE.txt for more details.
+#
+"""\
+Incremental processing of cable directories.
+
+A manifest records the path, modification time, size and a content hash
+of each cable file of a directory. Processing a directory with the manifest
+of a previous run yields only new and changed cables and reports deleted
+cables::
+
+    from cablemap.core import handle_source
+    from cablemap.core.manifest import Manifest, load_manifest
+
+    manifest = load_manifest('cables.manifest') if os.path.exists('cables.manifest') else Manifest()
+    changes = handle_source('./cable/', handler, since=manifest)
+    changes.manifest.save('cables.manifest')
+    for reference_id in changes.deleted:
+        ...
+
+Files with an unchanged modification time and size are not read.
+
+:author:       Lars Heuer (heuer[at]semagia.com)
+:organization: Semagia - <http://www.semagia.com/>
+:license:      BSD license
+"""
+from __future__ import absolute_import, with_statement
+import os
+import csv
+import hashlib
+from cablemap.core.models import cable_from_html
+from cablemap.core.reader import reference_id_from_filename
+
+__all__ = ['Manifest', 'DirectoryChanges', 'load_manifest']
+
+
+class Manifest(object):
+    """\
+    Maps the paths of cable files (relative to the directory) to
+    ``(mtime, size, digest)`` tuples.
+    """
+    def __init__(self, entries=()):
+        """\
+
+        `entries`
+            An iterable of ``(path, mtime, size, digest)`` tuples.
+        """
+        self._entries = {}
+        for path, mtime, size, digest in entries:
+            self.add(path, mtime, size, digest)
+
+    def add(self, path, mtime, size, digest):
+        """\
+        Adds an entry to the manifest.
+
+        `path`
+            The path of the file, relative to the directory.
+        `mtime`
+            The modification time of the file.
+        `size`
+            The size of the file in bytes.
+        `digest`
+            The SHA-1 hex digest of the file content.
+        """
+        self._entries[path] = (mtime, size, digest)
+
+    def get(self, path):
+        """\
+        Returns a tuple ``(mtime, size, digest)`` or ``None`` if the
+        `path` is unknown.
+        """
+        return self._entries.get(path)
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __iter__(self):
+        return iter(self._entries)
+
+    def __contains__(self, path):
+        return path in self._entries
+
+    def save(self, filename):
+        """\
+        Writes the manifest to the provided `filename`.
+        """
+        with open(filename, 'wb') as f:
+            writer = csv.writer(f)
+            for path, (mtime, size, digest) in sorted(self._entries.iteritems()):
+                writer.writerow((path, repr(mtime), size, digest))
+
+
+def load_manifest(filename):
+    """\
+    Reads a manifest from `filename` (c.f. `Manifest.save`).
+    """
+    with open(filename, 'rb') as f:
+        return Manifest((path, float(mtime), int(size), digest) for path, mtime, size, digest in csv.reader(f))
+
+
+class DirectoryChanges(object):
+    """\
+    Iterable of the new and changed cables of a directory.
+
+    The deleted cables are known after the instance was created, the added
+    and changed cables and the new manifest are complete after the cables
+    were iterated.
+    """
+    def __init__(self, directory, since, predicate=None):
+        """\
+
+        `directory`
+            The directory to read the cables from.
+        `since`
+            The `Manifest` of the previous run. Use an empty `Manifest`
+            for the first run.
+        `predicate`
+            A predicate that is invoked for each cable filename
+            (c.f. `cablemap.core.utils.cables_from_directory`).
+        """
+        self.directory = directory
+        self.manifest = Manifest()
+        self.added = []
+        self.changed = []
+        self._since = since
+        self._candidates = []
+        pred = predicate or bool
+        seen = set()
+        for root, dirs, files in os.walk(directory):
+            for name in (n for n in files if '.html' in n and pred(n[:-5])):
+                filename = os.path.join(root, name)
+                path = os.path.relpath(filename, directory)
+                seen.add(path)
+                st = os.stat(filename)
+                entry = since.get(path)
+                if entry is not None and entry[:2] == (st.st_mtime, st.st_size):
+                    self.manifest.add(path, *entry)
+                else:
+                    self._candidates.append((path, filename, st))
+        self._candidates.sort()
+        deleted = []
+        for path in since:
+            if path in seen:
+                continue
+            if pred(os.path.basename(path)[:-5]):
+                deleted.append(reference_id_from_filename(path))
+            else:
+                # Files which are ignored by the predicate are kept
+                self.manifest.add(path, *since.get(path))
+        self.deleted = sorted(deleted)
+
+    def __iter__(self):
+        since = self._since
+        for path, filename, st in self._candidates:
+            with open(filename, 'rb') as f:
+                data = f.read()
+            digest = hashlib.sha1(data).hexdigest()
+            self.manifest.add(path, st.st_mtime, st.st_size, digest)
+            entry = since.get(path)
+            reference_id = reference_id_from_filename(filename)
+            if entry is None:
+                self.added.append(reference_id)
+            elif entry[2] != digest:
+                self.changed.append(reference_id)
+            else:
+                continue
+            yield cable_from_html(data.decode('utf-8'), reference_id)
@@ -12,10 +12,9 @@ This module provides models to keep data about cables.
 :organization: Semagia - <http://www.semagia.com/>
 :license:      BSD license
 """
-from __future__ import absolute_import
-import codecs
+from __future__ import absolute_import, with_statement
 from itertools import chain
-from operator import itemgetter
+from operator import itemgetter, attrgetter
 from cablemap.core import reader, c14n, consts
 from cablemap.core.interfaces import ICable, IReference, IRecipient, implements
 
@@ -24,18 +23,21 @@ __all__ = ['cable_from_file', 'cable_from_html', 'cable_from_row']
 _EMPTY = tuple()
 
 
-def cable_from_file(filename):
+def cable_from_file(filename, factory=None):
     """\
     Returns a cable from the provided file.
     
     `filename`
         An absolute path to the cable file.
+    `factory`
+        The class of the returned cable (`Cable` by default).
     """
-    html = codecs.open(filename, 'rb', 'utf-8').read()
-    return cable_from_html(html, reader.reference_id_from_filename(filename))
+    with open(filename, 'rb') as f:
+        html = f.read().decode('utf-8')
+    return cable_from_html(html, reader.reference_id_from_filename(filename), factory)
 
 
-def cable_from_html(html, reference_id=None):
+def cable_from_html(html, reference_id=None, factory=None):
     """\
     Returns a cable from the provided HTML page.
     
@@ -44,19 +46,27 @@ def cable_from_html(html, reference_id=None):
     `reference_id`
         The reference identifier of the cable. If the reference_id is ``None``
         this function tries to detect it.
+    `factory`
+        The class of the returned cable (`Cable` by default).
     """
     if not html:
         raise ValueError('The HTML page of the cable must be provided, got: "%r"' % html)
     if not reference_id:
         reference_id = reader.reference_id_from_html(html)
-    cable = Cable(reference_id)
-    reader.parse_meta(html, cable)
-    cable.header = reader.get_header_as_text(html, reference_id)
-    cable.content = reader.get_content_as_text(html, reference_id)
+    ref, created, released, classification, origin, media_uris, header, content = reader.parse_page(html)
+    reader._check_page_reference_id(ref, reference_id)
+    cable = (factory or Cable)(reference_id)
+    cable.created = created
+    cable.released = released
+    cable.origin = origin
+    cable.classification = classification
+    cable.media_uris = media_uris
+    cable.header = header
+    cable.content = content
     return cable
 
 
-def cable_from_row(row):
+def cable_from_row(row, factory=None):
     """\
     Returns a cable from the provided row (a tuple/list).
 
@@ -69,14 +79,12 @@ def cable_from_row(row):
 
     `row`
         A tuple or list with 8 items.
+    `factory`
+        The class of the returned cable (`Cable` by default).
     """
-    def format_creation_date(created):
-        date, time = created.split()
-        month, day, year, hour, minute = [x.zfill(2) for x in chain(date.split(u'/'), time.split(u':'))]
-        return u'%s-%s-%s %s:%s' % (year, month, day, hour, minute)
     _, created, reference_id, origin, classification, _, header, body = row
-    cable = Cable(reference_id)
-    cable.created = format_creation_date(created)
+    cable = (factory or Cable)(reference_id)
+    cable.created = _format_creation_date(created)
     cable.origin = origin
     cable.classification = classification.upper()
     cable.header = header
@@ -84,6 +92,16 @@ def cable_from_row(row):
     return cable
 
 
+def _format_creation_date(created):
+    """\
+    Converts the creation date of a CSV row (``M/D/YYYY H:MM``) into
+    ``YYYY-MM-DD HH:MM``.
+    """
+    date, time = created.split()
+    month, day, year, hour, minute = [x.zfill(2) for x in chain(date.split(u'/'), time.split(u':'))]
+    return u'%s-%s-%s %s:%s' % (year, month, day, hour, minute)
+
+
 # Commonly used base URIs for Wikileaks Cablegate
 # Formats: 
 # * BASE/<year>/<month>/<reference-id>
@@ -108,6 +126,9 @@ class Reference(tuple):
     def __new__(cls, value, kind, bullet=None, title=None):
         return tuple.__new__(cls, (value, kind, bullet.upper() if bullet else None, title.strip('"') if title else None))
 
+    def __getnewargs__(self):
+        return tuple(self)
+
     def is_cable(self):
         return self.kind == consts.REF_KIND_CABLE
 
@@ -127,6 +148,9 @@ class Recipient(tuple):
     def __new__(cls, route, name, precedence=None, mcn=None, excluded=None):
         return tuple.__new__(cls, (route or None, name, precedence or None, mcn or None, excluded or _EMPTY))
 
+    def __getnewargs__(self):
+        return tuple(self)
+
     route = property(itemgetter(0))
     name = property(itemgetter(1))
     excluded = property(itemgetter(2))
@@ -140,27 +164,14 @@ class Recipient(tuple):
     mcn = property(itemgetter(4))
 
 
-class Cable(object):
+class _BaseCable(object):
     """\
-    Holds data about a cable.
-    """
-    implements(ICable)
-
-    def __init__(self, reference_id):
-        """\
+    Provides the properties which are common to all cable implementations.
 
-        `reference_id`
-            The reference identifier of the cable
-        """
-        if not reference_id:
-            raise ValueError('The reference id must be provided')
-        self.reference_id = unicode(reference_id)
-        self.origin = None
-        self.header = None
-        self.content = None
-        self.created = None
-        self.released = None
-        self.classification = None
+    Subclasses must provide the ``reference_id``, ``header``, ``content`` and
+    ``created`` attributes.
+    """
+    __slots__ = ()
 
     @property
     def canonical_id(self):
@@ -201,6 +212,14 @@ class Cable(object):
     def __unicode__(self):
         return self.reference_id
 
+    def _subject_segment(self):
+        """\
+        Returns the `cablemap.core.reader.SubjectSegment` which is shared
+        by the ``subject`` and ``tags`` properties or ``None`` if the
+        cable does not keep it.
+        """
+        return None
+
     #
     # Header properties
     #
@@ -225,7 +244,7 @@ class Cable(object):
     #
     @property
     def subject(self):
-        return reader.parse_subject(self.content, self.reference_id)
+        return reader.parse_subject(self.content, self.reference_id, segment=self._subject_segment())
 
     @property
     def classification_categories(self):
@@ -241,7 +260,7 @@ class Cable(object):
 
     @property
     def tags(self):
-        return reader.parse_tags(self.content, self.reference_id)
+        return reader.parse_tags(self.content, self.reference_id, segment=self._subject_segment())
 
     @property
     def summary(self):
@@ -260,6 +279,267 @@ class Cable(object):
         return reader.parse_classified_by(self.content)
 
 
+class Cable(_BaseCable):
+    """\
+    Holds data about a cable.
+    """
+    implements(ICable)
+
+    def __init__(self, reference_id):
+        """\
+
+        `reference_id`
+            The reference identifier of the cable
+        """
+        if not reference_id:
+            raise ValueError('The reference id must be provided')
+        self.reference_id = unicode(reference_id)
+        self.origin = None
+        self.header = None
+        self.content = None
+        self.created = None
+        self.released = None
+        self.classification = None
+        self.media_uris = _EMPTY
+
+
+def _memoized(prop):
+    """\
+    Returns a property which computes the value of the provided `prop`
+    only once per cable.
+
+    Lists are returned as copies, so callers cannot change the cached value.
+    """
+    fget = prop.fget
+    name = fget.__name__
+    def get(self):
+        parsed = self._parsed
+        if parsed is None:
+            parsed = self._parsed = {}
+        try:
+            res = parsed[name]
+        except KeyError:
+            res = parsed[name] = fget(self)
+        return res[:] if type(res) is list else res
+    return property(get, doc=prop.__doc__)
+
+
+def _invalidating(name):
+    """\
+    Returns a property which stores its value in the slot `name` and
+    discards all parsed values if the value is reassigned.
+    """
+    getter = attrgetter(name)
+    def set(self, value):
+        setattr(self, name, value)
+        self._parsed = None
+        self._segment = None
+    return property(getter, set)
+
+
+class CompactCable(_BaseCable):
+    """\
+    A `Cable` variant which uses ``__slots__`` and parses each property
+    only once.
+
+    The parsed values are discarded if the ``header``, ``content`` or
+    ``created`` attribute is reassigned. The ``subject`` and ``tags``
+    properties share the location of the SUBJECT line
+    (c.f. `cablemap.core.reader.SubjectSegment`). Unlike `Cable`, no arbitrary
+    attributes can be assigned to instances of this class.
+    """
+    implements(ICable)
+    __slots__ = ('reference_id', 'origin', 'released', 'classification', 'media_uris',
+                 '_header', '_content', '_created', '_parsed', '_segment')
+
+    def __init__(self, reference_id):
+        """\
+
+        `reference_id`
+            The reference identifier of the cable
+        """
+        if not reference_id:
+            raise ValueError('The reference id must be provided')
+        self.reference_id = unicode(reference_id)
+        self.origin = None
+        self._header = None
+        self._content = None
+        self._created = None
+        self.released = None
+        self.classification = None
+        self.media_uris = _EMPTY
+        self._parsed = None
+        self._segment = None
+
+    header = _invalidating('_header')
+    content = _invalidating('_content')
+    created = _invalidating('_created')
+
+    canonical_id = _memoized(_BaseCable.canonical_id)
+    transmission_id = _memoized(_BaseCable.transmission_id)
+    recipients = _memoized(_BaseCable.recipients)
+    info_recipients = _memoized(_BaseCable.info_recipients)
+    is_partial = _memoized(_BaseCable.is_partial)
+    subject = _memoized(_BaseCable.subject)
+    classification_categories = _memoized(_BaseCable.classification_categories)
+    nondisclosure_deadline = _memoized(_BaseCable.nondisclosure_deadline)
+    references = _memoized(_BaseCable.references)
+    tags = _memoized(_BaseCable.tags)
+    summary = _memoized(_BaseCable.summary)
+    comment = _memoized(_BaseCable.comment)
+    signed_by = _memoized(_BaseCable.signed_by)
+    classified_by = _memoized(_BaseCable.classified_by)
+
+    def _subject_segment(self):
+        segment = self._segment
+        if segment is None:
+            segment = self._segment = reader.SubjectSegment(self.content)
+        return segment
+
+
+def _mapped_text(name, span_name):
+    """\
+    Returns a property which decodes its value from the span `span_name`
+    on first access and stores it in the slot `name`.
+
+    Reassigning the value discards the span and all parsed values.
+    """
+    def get(self):
+        value = getattr(self, name)
+        if value is None:
+            span = getattr(self, span_name)
+            if span is not None:
+                value = self._source.text(span)
+                setattr(self, name, value)
+        return value
+    def set(self, value):
+        setattr(self, name, value)
+        setattr(self, span_name, None)
+        self._parsed = None
+        self._segment = None
+    return property(get, set)
+
+
+class MappedCable(CompactCable):
+    """\
+    A `CompactCable` which refers to the header and the content within a
+    (memory-mapped) source.
+
+    The header and the content are decoded on first access. `release`
+    discards the decoded texts, they are decoded again if they are accessed
+    later on (c.f. `cablemap.core.utils.mapped_cables_from_csv`).
+    """
+    __slots__ = ('_source', '_header_span', '_content_span')
+
+    def __init__(self, reference_id, source, header_span, content_span):
+        """\
+
+        `reference_id`
+            The reference identifier of the cable
+        `source`
+            An object which provides a ``text(span)`` method which returns
+            the (unicode) text of a span.
+        `header_span`
+            The span of the header within the `source`.
+        `content_span`
+            The span of the content within the `source`.
+        """
+        super(MappedCable, self).__init__(reference_id)
+        self._source = source
+        self._header_span = header_span
+        self._content_span = content_span
+
+    header = _mapped_text('_header', '_header_span')
+    content = _mapped_text('_content', '_content_span')
+
+    def release(self):
+        """\
+        Discards the decoded header and content. The parsed properties are
+        kept.
+        """
+        if self._header_span is not None:
+            self._header = None
+        if self._content_span is not None:
+            self._content = None
+            self._segment = None
+
+
+# Fields of a `ParsedCable`, the order must not be changed
+PARSED_CABLE_FIELDS = (
+    # Metadata which is always available
+    'reference_id', 'canonical_id', 'created', 'released', 'origin', 'classification',
+    'media_uris',
+    # Texts and parsed properties, these may be ``None`` if they were not requested
+    'header', 'content', 'transmission_id', 'recipients', 'info_recipients',
+    'is_partial', 'subject', 'classification_categories', 'nondisclosure_deadline',
+    'references', 'tags', 'summary', 'comment', 'signed_by', 'classified_by',
+    )
+
+_PARSED_CABLE_METADATA = frozenset(PARSED_CABLE_FIELDS[:7])
+
+
+class ParsedCable(tuple, _BaseCable):
+    """\
+    Immutable snapshot of the (parsed) properties of a cable.
+
+    Instances are cheap to pickle and do not need the reader to provide
+    their properties. Properties which were not requested when the snapshot
+    was taken (c.f. `ParsedCable.from_cable`) are ``None``.
+    """
+    __slots__ = ()
+    implements(ICable)
+
+    def __new__(cls, *values):
+        if len(values) != len(PARSED_CABLE_FIELDS):
+            raise TypeError('Expected %d values, got %d' % (len(PARSED_CABLE_FIELDS), len(values)))
+        return tuple.__new__(cls, values)
+
+    def __getnewargs__(self):
+        return tuple(self)
+
+    @classmethod
+    def from_cable(cls, cable, properties=None):
+        """\
+        Returns a snapshot of the provided `cable`.
+
+        `cable`
+            An `ICable` instance.
+        `properties`
+            An optional iterable of property names which should be taken
+            from the `cable`. The metadata (reference id, canonical id,
+            creation date, release date, origin, classification, and the
+            media IRIs) is always taken. If `properties` is ``None`` (default),
+            all properties are parsed.
+        """
+        if properties is None:
+            return tuple.__new__(cls, [getattr(cable, name) for name in PARSED_CABLE_FIELDS])
+        wanted = _PARSED_CABLE_METADATA.union(properties)
+        return tuple.__new__(cls, [getattr(cable, name) if name in wanted else None for name in PARSED_CABLE_FIELDS])
+
+    reference_id = property(itemgetter(0))
+    canonical_id = property(itemgetter(1))
+    created = property(itemgetter(2))
+    released = property(itemgetter(3))
+    origin = property(itemgetter(4))
+    classification = property(itemgetter(5))
+    media_uris = property(itemgetter(6))
+    header = property(itemgetter(7))
+    content = property(itemgetter(8))
+    transmission_id = property(itemgetter(9))
+    recipients = property(itemgetter(10))
+    info_recipients = property(itemgetter(11))
+    is_partial = property(itemgetter(12))
+    subject = property(itemgetter(13))
+    classification_categories = property(itemgetter(14))
+    nondisclosure_deadline = property(itemgetter(15))
+    references = property(itemgetter(16))
+    tags = property(itemgetter(17))
+    summary = property(itemgetter(18))
+    comment = property(itemgetter(19))
+    signed_by = property(itemgetter(20))
+    classified_by = property(itemgetter(21))
+
+
 if __name__ == '__main__':
     import doctest
     doctest.testmod()
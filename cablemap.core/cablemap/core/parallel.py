@@ -0,0 +1,154 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (c) 2011 - 2015 -- Lars Heuer <heuer[at]semagia.com>
+# All rights reserved.
+#
+# License: BSD, see LICENSE.txt for more details.
+#
+"""\
+Parses cables in a pool of worker processes.
+
+The cables are read by the calling process, parsed by the workers and
+returned as `cablemap.core.models.ParsedCable` instances in the original
+order of the source.
+
+:author:       Lars Heuer (heuer[at]semagia.com)
+:organization: Semagia - <http://www.semagia.com/>
+:license:      BSD license
+"""
+from __future__ import absolute_import
+import os
+from collections import deque
+from itertools import islice
+import multiprocessing
+from cablemap.core.models import cable_from_row, cable_from_file, cable_from_html, CompactCable, ParsedCable
+from cablemap.core.utils import rows_from_csv, cablefiles_from_directory, pages_from_archive, is_archive
+
+__all__ = ['parsed_cables_from_source', 'properties_for_events']
+
+# Number of cables which are sent to a worker at once
+DEFAULT_CHUNK_SIZE = 100
+
+# Cable properties which must be parsed to issue an event
+_EVENT_PROPERTIES = {
+    'handle_nondisclosure_deadline': ('nondisclosure_deadline',),
+    'handle_transmission_id': ('transmission_id',),
+    'handle_subject': ('subject',),
+    'handle_summary': ('summary',),
+    'handle_comment': ('comment',),
+    'handle_header': ('header',),
+    'handle_content': ('content',),
+    'handle_partial': ('is_partial',),
+    'handle_classification_category': ('classification_categories',),
+    'handle_classificationist': ('classified_by',),
+    'handle_signer': ('signed_by',),
+    'handle_tag': ('tags',),
+    'handle_recipient': ('recipients',),
+    'handle_info_recipient': ('info_recipients',),
+    'handle_reference': ('references',),
+}
+
+_KIND_CSV = 0
+_KIND_FILE = 1
+_KIND_PAGE = 2
+
+
+def properties_for_events(events):
+    """\
+    Returns the cable properties (a frozenset) which are needed to issue
+    the provided `events` or ``None`` if all properties are needed.
+
+    `events`
+        An iterable of event names or ``None`` (all events).
+    """
+    if events is None:
+        return None
+    res = set()
+    for event in events:
+        res.update(_EVENT_PROPERTIES.get(event, ()))
+    return frozenset(res)
+
+
+def _parse_chunk(task):
+    """\
+    Parses a chunk of cables. Executed by the worker processes.
+
+    `task`
+        A tuple ``(kind, items, properties)``.
+    """
+    kind, items, properties = task
+    from_cable = ParsedCable.from_cable
+    if kind == _KIND_PAGE:
+        return [from_cable(cable_from_html(html, reference_id, CompactCable), properties) for reference_id, html in items]
+    make_cable = cable_from_row if kind == _KIND_CSV else cable_from_file
+    return [from_cable(make_cable(item, CompactCable), properties) for item in items]
+
+
+def _chunks(iterable, size):
+    it = iter(iterable)
+    while True:
+        chunk = list(islice(it, size))
+        if not chunk:
+            break
+        yield chunk
+
+
+def parsed_cables_from_source(path, predicate=None, workers=None, events=None,
+                              chunk_size=DEFAULT_CHUNK_SIZE, max_chunks=None,
+                              properties=None):
+    """\
+    Returns a generator with `cablemap.core.models.ParsedCable` instances
+    which are parsed by a pool of worker processes.
+
+    The cables are returned in the same order as they occur in the source.
+
+    `path`
+        Either a directory with cable files, an archive of cable files or
+        a (compressed) CSV file (c.f. `cablemap.core.utils.cables_from_source`).
+    `predicate`
+        A predicate that is invoked for each cable reference identifier.
+        If the predicate evaluates to ``False`` the cable is ignored.
+        By default, all cables are used.
+    `workers`
+        The number of worker processes. If it is ``None`` (default), the
+        number of CPUs is used.
+    `events`
+        An iterable of `cablemap.core.interfaces.ICableHandler` event names
+        which should be issued for the returned cables. The workers parse
+        only the properties which are required by these events.
+        If `events` is ``None`` (default) all properties are parsed.
+    `chunk_size`
+        The number of cables which are parsed by a worker at once.
+    `max_chunks`
+        The max. number of chunks which are in-flight. If it is ``None``
+        (default), twice the number of workers is used.
+    `properties`
+        An iterable of property names which should be parsed. If it is
+        provided, `events` is ignored.
+    """
+    workers = workers or multiprocessing.cpu_count()
+    max_chunks = max_chunks or 2 * workers
+    if properties is None:
+        properties = properties_for_events(events)
+    else:
+        properties = frozenset(properties)
+    if os.path.isdir(path):
+        kind, items = _KIND_FILE, cablefiles_from_directory(path, predicate)
+    elif is_archive(path):
+        kind, items = _KIND_PAGE, pages_from_archive(path, predicate)
+    else:
+        kind, items = _KIND_CSV, rows_from_csv(path, predicate)
+    pool = multiprocessing.Pool(workers)
+    try:
+        pending = deque()
+        for chunk in _chunks(items, chunk_size):
+            if len(pending) >= max_chunks:
+                for cable in pending.popleft().get():
+                    yield cable
+            pending.append(pool.apply_async(_parse_chunk, ((kind, chunk, properties),)))
+        while pending:
+            for cable in pending.popleft().get():
+                yield cable
+    finally:
+        pool.terminate()
+        pool.join()
@@ -17,13 +17,38 @@ import os
 import re
 import logging
 from cablemap.core import consts as consts, c14n
-from cablemap.core.consts import REFERENCE_ID_PATTERN, MALFORMED_CABLE_IDS, INVALID_CABLE_IDS
+from cablemap.core.consts import REFERENCE_ID_PATTERN, MALFORMED_CABLE_IDS, INVALID_CABLE_IDS, LazyPattern
+from cablemap.core.diagnostics import DIAGNOSTICS, MISSING_TAGS, MISSING_TO, MALFORMED_SUMMARY, \
+     MALFORMED_REFERENCES
 
 logger = logging.getLogger('cablemap.core.reader')
 
 # Indicates the max. index where the reader tries to detect the subject/TAGS/references
 _MAX_HEADER_IDX = 1200
 
+#
+# Versions of the parsers of the cable properties.
+#
+# Increment the version of a property if the result of its parser changes
+# (i.e. fixes in ``_TAG_FIXES`` or ``MALFORMED_CABLE_IDS``). Cached results
+# of older versions are discarded (c.f. `cablemap.core.cache`).
+#
+PARSER_VERSIONS = {
+    'transmission_id': 1,
+    'recipients': 1,
+    'info_recipients': 1,
+    'is_partial': 1,
+    'subject': 1,
+    'classification_categories': 1,
+    'nondisclosure_deadline': 1,
+    'references': 1,
+    'tags': 1,
+    'summary': 1,
+    'comment': 1,
+    'signed_by': 1,
+    'classified_by': 1,
+}
+
 #
 # Cables w/o tags
 #
@@ -40,7 +65,7 @@ _CABLES_WITH_MALFORMED_SUMMARY = (
     '09SOFIA716', '09BUCHAREST354',
     )
 
-_CABLE_ID_SUBJECT_PATTERN = re.compile('^([0-9]+[^:]+):\s(.+)$')
+_CABLE_ID_SUBJECT_PATTERN = LazyPattern('^([0-9]+[^:]+):\s(.+)$')
 
 def reference_id_from_filename(filename):
     """\
@@ -130,8 +155,9 @@ _C14N_FIXES = {
     u'AITTAIPEI': u'TAIPEI',
               
 }
-_C14N_PATTERN = re.compile(r'[0-9]{2}(%s)[0-9]+' % '|'.join(_C14N_FIXES.keys()))
+_C14N_PATTERN = LazyPattern(r'[0-9]{2}(%s)[0-9]+' % '|'.join(_C14N_FIXES.keys()))
 
+@c14n.memoize()
 def canonicalize_id(reference_id):
     """\
     Returns the canonicalized form of the provided reference_id.
@@ -156,7 +182,7 @@ def canonicalize_id(reference_id):
         return reference_id.replace(origin, _C14N_FIXES[origin])
     return MALFORMED_CABLE_IDS.get(reference_id, INVALID_CABLE_IDS.get(reference_id, reference_id))
 
-_REFERENCE_ID_FROM_HTML_PATTERN = re.compile('<h3>Viewing cable ([0-9]{2,}[A-Z0-9]+),', re.UNICODE)
+_REFERENCE_ID_FROM_HTML_PATTERN = LazyPattern('<h3>Viewing cable ([0-9]{2,}[A-Z0-9]+),', re.UNICODE)
 
 def reference_id_from_html(html):
     """\
@@ -171,8 +197,6 @@ def reference_id_from_html(html):
     raise ValueError("Cannot extract the cable's reference id")
 
 
-_CONTENT_PATTERN = re.compile(ur'(?:<code><pre>)(.+?)(?:</pre></code>)', re.DOTALL|re.UNICODE)
-
 def get_content_as_text(file_content, reference_id):
     """\
     Returns the cable content as text (HTML links etc. will be removed, c.f.
@@ -183,7 +207,10 @@ def get_content_as_text(file_content, reference_id):
     `reference_id`
         The reference identifier of the cable.
     """
-    return _clean_html(_CONTENT_PATTERN.findall(file_content)[-1])
+    sections = _text_sections(file_content)
+    if not sections:
+        raise IndexError('No <code><pre> section found')
+    return _clean_html(file_content[sections[-1][0]:sections[-1][1]])
 
 
 def get_header_as_text(file_content, reference_id):
@@ -193,35 +220,84 @@ def get_header_as_text(file_content, reference_id):
     `file_content`
         The HTML file content, c.f. `get_file_content`.
     """
-    res = _CONTENT_PATTERN.findall(file_content)
-    if len(res) == 2:
-        content = res[0]
-    elif len(res) == 1:
-        return ''
-    else:
-        raise ValueError('Unexpected <code><pre> sections: "%r"' % res)
-    return _clean_html(content)
+    return get_header_and_content_as_text(file_content, reference_id)[0]
+
+
+def get_header_and_content_as_text(file_content, reference_id):
+    """\
+    Returns a tuple ``(header, content)`` of the cable. The ``<code><pre>``
+    sections are located in one scan (c.f. `get_header_as_text` and
+    `get_content_as_text`).
+
+    `file_content`
+        The HTML file content, c.f. `get_file_content`.
+    `reference_id`
+        The reference identifier of the cable.
+    """
+    return _header_and_content(file_content, _text_sections(file_content))
+
+
+def _text_sections(html, start=0):
+    """\
+    Returns a list of ``(start, end)`` tuples of the ``<code><pre>`` sections
+    of the provided `html` page.
 
+    `html`
+        The HTML page.
+    `start`
+        The index where the search starts.
+    """
+    sections = []
+    find = html.find
+    idx = find(u'<code><pre>', start)
+    while idx != -1:
+        idx += 11
+        # An empty section does not end the section (c.f. the former
+        # ``<code><pre>(.+?)</pre></code>`` pattern)
+        end = find(u'</pre></code>', idx + 1)
+        if end == -1:
+            break
+        sections.append((idx, end))
+        idx = find(u'<code><pre>', end + 13)
+    return sections
+
+
+def _header_and_content(html, sections):
+    """\
+    Returns the cleaned header and content of the provided `html` page.
+
+    `sections`
+        The sections of the page, c.f. `_text_sections`.
+    """
+    if len(sections) == 2:
+        (hs, he), (cs, ce) = sections
+        return _clean_html(html[hs:he]), _clean_html(html[cs:ce])
+    elif len(sections) == 1:
+        s, e = sections[0]
+        return u'', _clean_html(html[s:e])
+    raise ValueError('Unexpected <code><pre> sections: "%r"' % [html[s:e] for s, e in sections])
 
-_LINK_PATTERN = re.compile(ur'<a[^>]*>', re.UNICODE)
-_HTML_TAG_PATTERN = re.compile(r'</?[a-zA-Z]+>')
-_BACKSLASH_PATTERN = re.compile(r'\\[ ]*\n|\\[ ]*$')
+
+_CLEAN_HTML_PATTERN = LazyPattern(ur"""(\\(?:[ ]|<a[^>]*>|</?[a-zA-Z]+>)*(?:\n|$))  # Line continuation
+                                      |<a[^>]*>|</?[a-zA-Z]+>                 # Links and tags
+                                      """, re.UNICODE|re.VERBOSE)
+
+def _clean_html_match(m):
+    return u'\n' if m.group(1) is not None else u''
 
 def _clean_html(html):
     """\
     Removes links (``<a href="...">...</a>``) from the provided HTML input.
     Further, it replaces "&#x000A;" with ``\n`` and removes "¶" from the texts.
+
+    Links, tags and line continuations are removed in one sweep.
     """
-    content = html.replace(u'&#x000A;', u'\n').replace(u'¶', '')
-    content = _LINK_PATTERN.sub(u'', content)
-    content = _HTML_TAG_PATTERN.sub(u'', content)
-    content = _BACKSLASH_PATTERN.sub(u'\n', content)
-    return content
+    return _CLEAN_HTML_PATTERN.sub(_clean_html_match, html.replace(u'&#x000A;', u'\n').replace(u'¶', u''))
 
 
-_CLASSIFIED_BY_PATTERN = re.compile(r'Classified[ ]+by[^\n]+', re.IGNORECASE)
-_FIRST_PARAGRAPH_PATTERN = re.compile(r'\n1. ')
-_SUMMARY_PATTERN = re.compile(r'(BEGIN SUMMARY[ ])|(SUMMARY: )')
+_CLASSIFIED_BY_PATTERN = LazyPattern(r'Classified[ ]+by[^\n]+', re.IGNORECASE)
+_FIRST_PARAGRAPH_PATTERN = LazyPattern(r'\n1. ')
+_SUMMARY_PATTERN = LazyPattern(r'(BEGIN SUMMARY[ ])|(SUMMARY: )')
 
 def header_body_from_content(content):
     """\
@@ -262,42 +338,103 @@ def header_body_from_content(content):
     return None, None
 
 
-_META_PATTERN = re.compile(r'''<table.*?class.+?["']cable["']\s*>.+?<a[^>]+>(.+?)</a>.+<td>\s*<a.+?>(.+?)</a>.+<td>\s*<a.+?>(.+?)</a>.+<td>\s*<a.+?>(.+?)</a>''', re.MULTILINE|re.DOTALL)
-_MEDIA_URLS_PATTERN = re.compile(r'''<a href=(?:"|')(https?://[^\.]+\.[^"']+)''')
+_META_TOKEN_PATTERN = LazyPattern(r'''<th>\s*([^<]*?)\s*</th>                 # Column name
+                                     |<td>\s*<a[^>]*>([^<]*)</a>                # Column value
+                                     |(Appears\ in\ these)                      # Begin of the media IRIs
+                                     |<a\ href=["\'](https?://[^\.]+\.[^"\']+)   # Media IRI
+                                     ''', re.VERBOSE)
+
+# Column name -> index of the value in the tuple returned by `parse_page`
+_META_COLUMNS = {
+    'Reference ID': 0,
+    'Created': 1,
+    'Released': 2,
+    'Classification': 3,
+    'Origin': 4,
+}
+
+# Order of the columns if the table has no column names
+_DEFAULT_META_COLUMNS = (0, 1, 3, 4)
+
+def parse_page(html):
+    """\
+    Extracts the metadata, the media IRIs, the header and the content of a
+    cable's HTML page.
+
+    The page is scanned once from the metadata table to the last
+    ``<code><pre>`` section.
+
+    Returns a tuple ``(reference-id, created, released, classification,
+    origin, media-iris, header, content)``. The release date is ``None``
+    if the page does not provide it.
+
+    `html`
+        The HTML page of the cable.
+    """
+    start_idx = html.find(u"<table class='cable'>")
+    if start_idx == -1:
+        raise ValueError('Cable table not found')
+    end_idx = html.find(u'</table>', start_idx)
+    if end_idx == -1:
+        raise ValueError('Cable table not found')
+    values = [None] * 5
+    columns, media_uris = [], []
+    column = 0
+    in_media = False
+    for m in _META_TOKEN_PATTERN.finditer(html, start_idx, end_idx):
+        kind = m.lastindex
+        if kind == 1:
+            columns.append(_META_COLUMNS.get(m.group(1)))
+        elif kind == 2:
+            if columns:
+                idx = columns[column] if column < len(columns) else None
+            else:
+                idx = _DEFAULT_META_COLUMNS[column] if column < len(_DEFAULT_META_COLUMNS) else None
+            if idx is not None:
+                values[idx] = m.group(2)
+            column += 1
+        elif kind == 3:
+            in_media = True
+        elif in_media:
+            media_uris.append(m.group(4))
+    ref, created, released, classification, origin = values
+    if ref is None or created is None or classification is None or origin is None:
+        raise ValueError('Unexpected metadata result: "%r"' % values)
+    header, content = _header_and_content(html, _text_sections(html, end_idx))
+    return ref, created, released, classification.upper(), origin, media_uris or (), header, content
+
+
+def _check_page_reference_id(ref, reference_id):
+    """\
+    Raises a `ValueError` if the reference identifier of a cable's page
+    (`ref`) does not match the `reference_id` of the cable.
+    """
+    if reference_id != ref:
+        reference_id_ = MALFORMED_CABLE_IDS.get(ref)
+        if reference_id_ != reference_id:
+            reference_id_ = INVALID_CABLE_IDS.get(ref)
+            if reference_id_ != reference_id:
+                raise ValueError('cable.reference_id != ref. reference_id="%s", ref="%s"' % (reference_id, ref))
+
 
 def parse_meta(file_content, cable):
     """\
     Extracts the reference id, date/time of creation, the classification,
     and the origin of the cable and assigns the value to the provided `cable`.
     """
-    end_idx = file_content.rindex("</table>")
-    start_idx = file_content.rindex("<table class='cable'>", 0, end_idx)
-    m = _META_PATTERN.search(file_content, start_idx, end_idx)
-    if not m:
-        raise ValueError('Cable table not found')
-    if len(m.groups()) != 4:
-        raise ValueError('Unexpected metadata result: "%r"' % m.groups())
-    # Table content: 
-    # Reference ID | Created | Classification | Origin
-    ref, created, classification, origin = m.groups()
-    if cable.reference_id != ref:
-        reference_id = MALFORMED_CABLE_IDS.get(ref)
-        if reference_id != cable.reference_id:
-            reference_id = INVALID_CABLE_IDS.get(ref)
-            if reference_id != cable.reference_id:
-                raise ValueError('cable.reference_id != ref. reference_id="%s", ref="%s"' % (cable.reference_id, ref))
+    ref, created, released, classification, origin, media_uris, _, _ = parse_page(file_content)
+    _check_page_reference_id(ref, cable.reference_id)
     cable.created = created
+    if released is not None:
+        cable.released = released
     cable.origin = origin
-    # classifications are usually written in upper case, but you never know.. 
-    cable.classification = classification.upper()
-    # Try to find media IRIs
-    start_idx = file_content.rfind(u'Appears in these', start_idx, end_idx)
-    if start_idx > 0:
-        cable.media_uris = _MEDIA_URLS_PATTERN.findall(file_content, start_idx, end_idx)
+    cable.classification = classification
+    if media_uris:
+        cable.media_uris = media_uris
     return cable
 
 
-_TID_PATTERN = re.compile(r'(VZCZ[A-Z]+[0-9]+)', re.UNICODE)
+_TID_PATTERN = LazyPattern(r'(VZCZ[A-Z]+[0-9]+)', re.UNICODE)
 
 def parse_transmission_id(header, reference_id=None):
     """\
@@ -315,10 +452,10 @@ def parse_transmission_id(header, reference_id=None):
     return m.group(1)
 
 
-_REC_PATTERN = re.compile(r'(?:([A-Z]+)/)?([A-Z0-9].+)', re.UNICODE)
-_REC_CLEAN_PATTERN = re.compile(r'(PAGE [0-9]+\s+[A-Z]+\s+[0-9]+\s+[0-9]+Z)')
-_REC_PRECEDENCE_PATTERN = re.compile(r'FLASH|NIACT IMMEDIATE|IMMEDIATE|PR?IORITY|ROUTINE')
-_REC_MCN_PATTERN = re.compile(r'(?:[ ]+)([0-9]{4,})$')
+_REC_PATTERN = LazyPattern(r'(?:([A-Z]+)/)?([A-Z0-9].+)', re.UNICODE)
+_REC_CLEAN_PATTERN = LazyPattern(r'(PAGE [0-9]+\s+[A-Z]+\s+[0-9]+\s+[0-9]+Z)')
+_REC_PRECEDENCE_PATTERN = LazyPattern(r'FLASH|NIACT IMMEDIATE|IMMEDIATE|PR?IORITY|ROUTINE')
+_REC_MCN_PATTERN = LazyPattern(r'(?:[ ]+)([0-9]{4,})$')
 
 def _route_recipient_from_header(header, reference_id):
     from cablemap.core.models import Recipient
@@ -349,7 +486,7 @@ def _route_recipient_from_header(header, reference_id):
     return res
 
 
-_TO_PATTERN = re.compile(r'(?:\nTO\s+)(.+?)(?=INFO|\Z)', re.DOTALL|re.UNICODE)
+_TO_PATTERN = LazyPattern(r'(?:\nTO\s+)(.+?)(?=INFO|\Z)', re.DOTALL|re.UNICODE)
 
 def parse_recipients(header, reference_id=None):
     """\
@@ -358,13 +495,14 @@ def parse_recipients(header, reference_id=None):
     m = _TO_PATTERN.search(header)
     if not m:
         if reference_id and reference_id not in _CABLES_WITHOUT_TO:
-            logger.warn('No TO header found in "%s", header: "%s"' % (reference_id, header))
+            DIAGNOSTICS.report(MISSING_TO, reference_id, logger, logging.WARNING,
+                               'No TO header found in "%s", header: "%s"', reference_id, header)
         return []
     to_header = m.group(1)
     return _route_recipient_from_header(to_header, reference_id)
 
 
-_INFO_PATTERN = re.compile(r'(?:.*?INFO\s+)(.+?)(?=\Z)', re.DOTALL|re.UNICODE)
+_INFO_PATTERN = LazyPattern(r'(?:.*?INFO\s+)(.+?)(?=\Z)', re.DOTALL|re.UNICODE)
 
 def parse_info_recipients(header, reference_id=None):
     """\
@@ -376,7 +514,7 @@ def parse_info_recipients(header, reference_id=None):
     to_header = m.group(1)
     return _route_recipient_from_header(to_header, reference_id)
 
-_CLIST_CONTENT_PATTERN = re.compile(r'''Classified\s+By:?\s*[0-9\.\s]*
+_CLIST_CONTENT_PATTERN = LazyPattern(r'''Classified\s+By:?\s*[0-9\.\s]*
         (?:(?:\s*\([A-Z]\))?\s*Classified\s+by:?\s*)?
         (?:\s*\([A-Z]\)\s*)?
         (?:[A-Z]+/[A-Z]+(?:\s*\-\s*)?)?
@@ -392,7 +530,7 @@ _CLIST_CONTENT_PATTERN = re.compile(r'''Classified\s+By:?\s*[0-9\.\s]*
          (.+?)
         (?=(?:F\s*O\s*R\s+|per\s+)?(?:R\s*E\s*A\s*S?\s*ON?|E\.O\.|1\.[45]|1\.\s*\(|CONFIDENTIAL|Summary))''',
     re.IGNORECASE|re.UNICODE|re.DOTALL|re.VERBOSE)
-_CLSIST_PATTERN = re.compile(r"[\s\.,]*([A-Z][^,;]+(?:\s*,\s*(?:JR\.?|II+))?)\s*", re.IGNORECASE|re.UNICODE)
+_CLSIST_PATTERN = LazyPattern(r"[\s\.,]*([A-Z][^,;]+(?:\s*,\s*(?:JR\.?|II+))?)\s*", re.IGNORECASE|re.UNICODE)
 
 def parse_classified_by(content, normalize=True):
     """\
@@ -420,11 +558,33 @@ def parse_classified_by(content, normalize=True):
     return names
 
 
-_SIGNER_PATTERN = re.compile(r'(?:[\-\?\"/]|\)(?!\s+END)'
+_CLS_CATEGORIES_PATTERN = LazyPattern(r'1\s*\.\s*[45]\s*((?:[\s,/\(\)&]|\band\b|\b[A-H]\b)+)', re.IGNORECASE|re.UNICODE)
+_CLS_CATEGORY_PATTERN = LazyPattern(r'\b([A-H])\b', re.IGNORECASE|re.UNICODE)
+
+def parse_classification_categories(content):
+    """\
+    Returns a maybe empty iterable of classification categories (uppercased
+    chars ``[A-H]``) of the cable, i.e. "1.4 (b) and (d)" becomes ``[u'B', u'D']``
+
+    `content`
+        The cable's content.
+    """
+    for m in _CLS_CATEGORIES_PATTERN.finditer(content):
+        res = []
+        for cat in _CLS_CATEGORY_PATTERN.findall(m.group(1)):
+            cat = cat.upper()
+            if cat not in res:
+                res.append(cat)
+        if res:
+            return res
+    return []
+
+
+_SIGNER_PATTERN = LazyPattern(r'(?:[\-\?\"/]|\)(?!\s+END)'
                              r'|\.(?!\s+The\b)'
                              r'|[\sA-Z]*QUOTE)(?:\s+[GP\-3EXEMPT]+'
                              r'|[\sA-Z]+QUOTE)?\s+([A-Z]+[ \-\']?[A-Z]+)\b\.?#*[ ]*\s*(?:LIMITED |NN+|Declassified/Released|NOTE(?:[ ]+BY|:[ ]+)|SECRET|UNCLASSIFIED|CONFIDENTIAL|\Z)', re.IGNORECASE|re.UNICODE)
-_SIGNER_PATTERN2 = re.compile(r'[A-Za-z0-9\.][ ]*(?:\n[ ]*)+([A-Z]+\-?[A-Z]+(?:[ ]*[\r\n][A-Z]+\-?[A-Z]+)?)[\s\.]*\Z', re.UNICODE)
+_SIGNER_PATTERN2 = LazyPattern(r'[A-Za-z0-9\.][ ]*(?:\n[ ]*)+([A-Z]+\-?[A-Z]+(?:[ ]*[\r\n][A-Z]+\-?[A-Z]+)?)[\s\.]*\Z', re.UNICODE)
 
 def parse_signed_by(content, canonicalize=True):
     """\
@@ -461,16 +621,16 @@ def parse_signed_by(content, canonicalize=True):
     return [c14n.canonicalize_surname(s) for s in signers] if canonicalize else signers
 
 
-# Caution: _SUBJECT_PATTERN/_SUBJECT_MAX_PATTERN is reused by "parse_tags"
-_SUBJECT_PATTERN = re.compile(ur'(?:^|[ ]+)S?UBJ(?:ECT)?(?:(?::\s*)|(?::?\s+))(?!LINE[/]*)(.+?)(?:\Z|(C O N)|(SENSI?TIVE BUT)|([ ]+REFS?:[ ]+)|(\n[ ]*\n|[\s]*[\n][\s]*[\s]*REFS?:?\s)|(REF:\s)|(REF\(S\):?)|(\s*Classified\s)|([1-9]\.?[ ]+Classified By)|([1-9]\.?[ ]*\([^\)]+\))|((?:1\.?[ ]|\r?\n)Summary)|([A-Z]+\s+[0-9]+\s+[0-9]+\.?[0-9]*\s+OF)|(\-\-\-\-\-*\s+)|(Friday)|(PAGE [0-9]+)|(This is a?n Action Req))', re.DOTALL|re.IGNORECASE|re.UNICODE|re.MULTILINE)
-_SUBJECT_MAX_PATTERN = re.compile(r'^1\.?[ ]*(?:\([^\)]+\)|SUMMARY)|"CANCEL THIS', re.IGNORECASE|re.MULTILINE)
-_NL_PATTERN = re.compile(ur'[\r\n]+')
-_SLASH_ESCAPE_PATTERN = re.compile(ur'[\\]+')
-_WS_PATTERN = re.compile(ur'[ ]{2,}', re.UNICODE)
-_BRACES_PATTERN = re.compile(r'^\([^\)]+\)[ ]+| \([A-Z]+\)$')
-_HTML_ENTITIES_PATTERN = re.compile(r'&#([0-9]+);')
+# Caution: _SUBJECT_PATTERN/_SUBJECT_MAX_PATTERN is reused by "parse_tags" (c.f. `SubjectSegment`)
+_SUBJECT_PATTERN = LazyPattern(ur'(?:^|[ ]+)S?UBJ(?:ECT)?(?:(?::\s*)|(?::?\s+))(?!LINE[/]*)(.+?)(?:\Z|(C O N)|(SENSI?TIVE BUT)|([ ]+REFS?:[ ]+)|(\n[ ]*\n|[\s]*[\n][\s]*[\s]*REFS?:?\s)|(REF:\s)|(REF\(S\):?)|(\s*Classified\s)|([1-9]\.?[ ]+Classified By)|([1-9]\.?[ ]*\([^\)]+\))|((?:1\.?[ ]|\r?\n)Summary)|([A-Z]+\s+[0-9]+\s+[0-9]+\.?[0-9]*\s+OF)|(\-\-\-\-\-*\s+)|(Friday)|(PAGE [0-9]+)|(This is a?n Action Req))', re.DOTALL|re.IGNORECASE|re.UNICODE|re.MULTILINE)
+_SUBJECT_MAX_PATTERN = LazyPattern(r'^1\.?[ ]*(?:\([^\)]+\)|SUMMARY)|"CANCEL THIS', re.IGNORECASE|re.MULTILINE)
+_NL_PATTERN = LazyPattern(ur'[\r\n]+')
+_SLASH_ESCAPE_PATTERN = LazyPattern(ur'[\\]+')
+_WS_PATTERN = LazyPattern(ur'[ ]{2,}', re.UNICODE)
+_BRACES_PATTERN = LazyPattern(r'^\([^\)]+\)[ ]+| \([A-Z]+\)$')
+_HTML_ENTITIES_PATTERN = LazyPattern(r'&#([0-9]+);')
 
-def parse_subject(content, reference_id=None, clean=True):
+def parse_subject(content, reference_id=None, clean=True, segment=None):
     """\
     Parses and returns the subject of a cable. If the cable has no subject, an
     empty string is returned.
@@ -492,12 +652,13 @@ def parse_subject(content, reference_id=None, clean=True):
         U.S. Department of State Foreign Affairs Handbook Volume 5 Handbook 1 — Correspondence Handbook
         5 FAH-1 H-210 -- HOW TO USE TELEGRAMS; page 2
         <http://www.state.gov/documents/organization/89319.pdf>
+    `segment`
+        An optional `SubjectSegment` of the `content` (i.e. shared with
+        `parse_tags`).
     """
     def to_unicodechar(match):
         return unichr(int(match.group(1)))
-    m = _SUBJECT_MAX_PATTERN.search(content)
-    max_idx = m.start() if m else _MAX_HEADER_IDX
-    m = _SUBJECT_PATTERN.search(content, 0, max_idx)
+    m = (segment or SubjectSegment(content)).subject_match
     if not m:
         return u''
     res = m.group(1).strip()
@@ -511,7 +672,7 @@ def parse_subject(content, reference_id=None, clean=True):
 
 
 # Commonly month/day/year is used, but sometimes year/month/day
-_DEADLINE_PATTERN = re.compile(r'(?:E.?O.?\s*12958:?\s*DECL\s*:?\s*)([0-9]{1,2}/[0-9]{1,2}/[0-9]{2,4})|([0-9]{4}/[0-9]{2}/[0-9]{2})', re.IGNORECASE|re.UNICODE)
+_DEADLINE_PATTERN = LazyPattern(r'(?:E.?O.?\s*12958:?\s*DECL\s*:?\s*)([0-9]{1,2}/[0-9]{1,2}/[0-9]{2,4})|([0-9]{4}/[0-9]{2}/[0-9]{2})', re.IGNORECASE|re.UNICODE)
 
 def parse_nondisclosure_deadline(content):
     """\
@@ -538,16 +699,118 @@ def parse_nondisclosure_deadline(content):
 
 # Some cables have an (incomplete) header section within the content, i.e. 07LIMA2129
 # This pattern is used to find the "real" REF section
-_REF_OFFSET_PATTERN = re.compile('\n\-+ header')
-_REF_START_PATTERN = re.compile(r'(?:[\nPROGRAM ]*REF|REF\(S\):?\s*)([^\n]+(\n\s*[0-9]+[,\s]+[^\n]+)?)', re.IGNORECASE|re.UNICODE)
-_REF_LAST_REF_PATTERN = re.compile(r'(\n[^\n]*\n)|(\n?[ ]*[A-Z](?:\.(?!O\.|S\.)|\))[^\n]+)', re.IGNORECASE|re.UNICODE)
+_REF_OFFSET_PATTERN = LazyPattern('\n\-+ header')
+_REF_START_PATTERN = LazyPattern(r'(?:[\nPROGRAM ]*REF|REF\(S\):?\s*)([^\n]+(\n\s*[0-9]+[,\s]+[^\n]+)?)', re.IGNORECASE|re.UNICODE)
+_REF_LAST_REF_PATTERN = LazyPattern(r'(\n[^\n]*\n)|(\n?[ ]*[A-Z](?:\.(?!O\.|S\.)|\))[^\n]+)', re.IGNORECASE|re.UNICODE)
 # "(?:(?:[ ]*REF)?[ ]+[A-Z][ ]+)?" for "10HAVANA9": A. REF A HAVANA 639
-_REF_PATTERN = re.compile(r'''([A-Z])?(?:\.|\)|:)?(?:(?:[ ]*REF)?[ ]+[A-Z][ ]+)?\s*\(?([0-9]{2,4})?\)?(?:\s*)([A-Z ]*[A-Z ]*[A-Z\-']{2,})(?:\s+)([0-9]+)(?!\.\.+)(?:\s+\(([0-9]{2,4})\))?''', re.MULTILINE|re.UNICODE|re.IGNORECASE)
-_REF_NOT_REF_PATTERN = re.compile(r'\n[0-9]\.[ ]*(?:\([A-Z]+\))?', re.IGNORECASE|re.UNICODE)
-_REF_STOP_PATTERN = re.compile('(classified by)|summary|\n1\.?\s*\([SBUC]+\)', re.IGNORECASE|re.UNICODE)
-_REF_ORIGIN_PATTERN = re.compile('[0-9]+([A-Z]+)[0-9]+')
+_REF_PATTERN = LazyPattern(r'''([A-Z])?(?:\.|\)|:)?(?:(?:[ ]*REF)?[ ]+[A-Z][ ]+)?\s*\(?([0-9]{2,4})?\)?(?:\s*)([A-Z ]*[A-Z ]*[A-Z\-']{2,})(?:\s+)([0-9]+)(?!\.\.+)(?:\s+\(([0-9]{2,4})\))?''', re.MULTILINE|re.UNICODE|re.IGNORECASE)
+_REF_NOT_REF_PATTERN = LazyPattern(r'\n[0-9]\.[ ]*(?:\([A-Z]+\))?', re.IGNORECASE|re.UNICODE)
+_REF_STOP_PATTERN = LazyPattern('(classified by)|summary|\n1\.?\s*\([SBUC]+\)', re.IGNORECASE|re.UNICODE)
+_REF_ORIGIN_PATTERN = LazyPattern('[0-9]+([A-Z]+)[0-9]+')
 #TODO: The following works for all references which contain something like 02ROME1196, check with other cables
-_CLEAN_REFS_PATTERN = re.compile(r'(PAGE [0-9]+ [A-Z]+ [0-9]+ [0-9]+ OF [0-9]+ [A-Z0-9]+)|([A-Z]+\s+[0-9]+\s+[0-9]+(?:\.[0-9]+)?\s+OF)', re.UNICODE)
+_CLEAN_REFS_PATTERN = LazyPattern(r'(PAGE [0-9]+ [A-Z]+ [0-9]+ [0-9]+ OF [0-9]+ [A-Z0-9]+)|([A-Z]+\s+[0-9]+\s+[0-9]+(?:\.[0-9]+)?\s+OF)', re.UNICODE)
+
+class KeywordMatcher(object):
+    """\
+    Finds several keywords in a text with one scan (Aho-Corasick).
+
+    The automaton is built once, the costs of a search depend on the length
+    of the text but not on the number of keywords::
+
+        >>> m = KeywordMatcher(['SECRET', 'CRETE', 'PART'])
+        >>> m.search('09SECRETE1')
+        'SECRET'
+        >>> m.findall('09SECRETE1')
+        ['SECRET', 'CRETE']
+        >>> m.search('09BERLIN1') is None
+        True
+    """
+    __slots__ = ('keywords', '_delta', '_out')
+
+    def __init__(self, keywords):
+        """\
+
+        `keywords`
+            An iterable of (non-empty) strings.
+        """
+        self.keywords = tuple(sorted(set(keywords)))
+        goto, out = [{}], [()]
+        for keyword in self.keywords:
+            if not keyword:
+                raise ValueError('Empty keywords are not supported')
+            state = 0
+            for c in keyword:
+                nxt = goto[state].get(c)
+                if nxt is None:
+                    nxt = goto[state][c] = len(goto)
+                    goto.append({})
+                    out.append(())
+                state = nxt
+            out[state] = (keyword,)
+        # Breadth-first: Compute the failure links and turn the trie into a
+        # deterministic automaton, each state knows the transitions of its
+        # failure state.
+        delta = [dict(transitions) for transitions in goto]
+        fail = [0] * len(goto)
+        queue = list(goto[0].itervalues())
+        for state in queue:
+            for c, nxt in goto[state].iteritems():
+                queue.append(nxt)
+                fail[nxt] = delta[fail[state]].get(c, 0) if state else 0
+                out[nxt] += out[fail[nxt]]
+            for c, nxt in delta[fail[state]].iteritems():
+                if state and c not in delta[state]:
+                    delta[state][c] = nxt
+        self._delta = delta
+        self._out = out
+
+    def search(self, text):
+        """\
+        Returns the first keyword (the keyword which ends first) found in
+        `text` or ``None``.
+        """
+        delta, out = self._delta, self._out
+        state = 0
+        for c in text:
+            state = delta[state].get(c, 0)
+            if out[state]:
+                return out[state][0]
+        return None
+
+    def findall(self, text):
+        """\
+        Returns a list of all keyword occurrences in `text` in the order of
+        their end positions.
+        """
+        delta, out = self._delta, self._out
+        res = []
+        state = 0
+        for c in text:
+            state = delta[state].get(c, 0)
+            if out[state]:
+                res.extend(out[state])
+        return res
+
+    def __contains__(self, text):
+        return self.search(text) is not None
+
+
+# Invalid references which contain one of these keywords are ignored silently
+_NON_REFERENCE_KEYWORDS = (
+    # Classifications
+    'ONFIDENTIAL', 'ECRET', 'UNCLAS',
+    # Dates
+    'JANUARY', 'FEBRUARY', 'FEBRUAY', 'MARCH', 'APRIL', 'JUNE', 'JULY', 'AUGUST',
+    'SEPTEMBER', 'OCTOBER', 'NOVEMBER', 'DECEMBER', 'ONMAY', 'TODAY', 'DAILY',
+    # Date time groups
+    'ZJAN', 'ZFEB', 'ZAPR', 'ZMAY', 'ZJUN', 'ZJUL', 'ZAUG', 'ZSEP', 'ZOCT', 'ZNOV',
+    # Other words
+    'CORRUPTION', 'PARISPOINT', 'TELCON', 'FORTHE', 'PRIORITY', 'PREVIO', 'PART',
+    'PARAGRAPH', 'SECTION', 'OUTOF', 'PROVIDING', 'NUMBER', 'MAIL', '--',
+)
+
+_NON_REFERENCE_MATCHER = KeywordMatcher(_NON_REFERENCE_KEYWORDS)
+
 
 def parse_references(content, year, reference_id=None, canonicalize=True):
     """\
@@ -594,7 +857,8 @@ def parse_references(content, year, reference_id=None, canonicalize=True):
         m_end = _REF_LAST_REF_PATTERN.search(content, last_end, max_idx)
     res = []
     if m_end and not m_start:
-        logger.warn('Found ref end but no start in "%s", content: "%s"' % (reference_id, content))
+        DIAGNOSTICS.report(MALFORMED_REFERENCES, reference_id, logger, logging.WARNING,
+                           'Found ref end but no start in "%s", content: "%s"', reference_id, content)
     if m_start and last_end:
         start = m_start.start(1)
         end = last_end or m_start.end()
@@ -619,8 +883,8 @@ def parse_references(content, year, reference_id=None, canonicalize=True):
             if length < 7 or length > 25: # constants.MIN_ORIGIN_LENGTH + constants.MIN_SERIAL_LENGTH + length of year or constants.MAX_ORIGIN_LENGTH + constants.MAX_SERIAL_LENGTH + 2 (for the year) 
                 continue
             if not REFERENCE_ID_PATTERN.match(reference):
-                if 'CORRUPTION' not in reference and 'ECRET' not in reference and 'PARISPOINT' not in reference and 'TELCON' not in reference and 'FORTHE' not in reference and 'ZOCT' not in reference and 'ZSEP' not in reference and 'ZMAY' not in reference and 'ZNOV' not in reference and 'ZAUG' not in reference and 'PRIORITY' not in reference and 'ZJAN' not in reference and 'ZFEB' not in reference and 'ZJUN' not in reference and'ZJUL' not in reference and 'PREVIO' not in reference and 'SEPTEMBER' not in reference and 'ZAPR' not in reference and 'ZFEB' not in reference and 'PART' not in reference and 'ONFIDENTIAL' not in reference and 'SECRET' not in reference and 'SECTION' not in reference and 'TODAY' not in reference and 'DAILY' not in reference and 'OUTOF' not in reference and 'PROVIDING' not in reference and 'NUMBER' not in reference and 'APRIL' not in reference and 'OCTOBER' not in reference and 'MAIL' not in reference and 'DECEMBER' not in reference and 'FEBRUAY' not in reference and 'AUGUST' not in reference and 'MARCH' not in reference and 'JULY' not in reference and 'JUNE' not in reference and 'MAIL' not in reference and 'JANUARY' not in reference and '--' not in reference and 'PARAGRAPH' not in reference and 'ANDPREVIOUS' not in reference and 'UNCLAS' not in reference and 'ONMARCH' not in reference and 'ONAPRIL' not in reference and 'FEBRUARY' not in reference and 'ONMAY' not in reference and 'ONJULY' not in reference and 'ONJUNE' not in reference and 'NOVEMBER' not in reference and not 'CONFIDENTIAL' in reference:
-                    logger.debug('Ignore "%s". Not a valid reference identifier (%s)' % (reference, reference_id))
+                if logger.isEnabledFor(logging.DEBUG) and reference not in _NON_REFERENCE_MATCHER:
+                    logger.debug('Ignore "%s". Not a valid reference identifier (%s)', reference, reference_id)
                 continue
             if reference != reference_id:
                 reference = Reference(reference, consts.REF_KIND_CABLE, enum)
@@ -630,11 +894,11 @@ def parse_references(content, year, reference_id=None, canonicalize=True):
 
 
 # "NOFORN" found in "08MADRID308", ^EFIN found in 08BEIJING3662 ("TAGS:" missing)
-_TAGS_PATTERN = re.compile(ur'(?<!\()(?:TAGE?S+|TAG|TAS:|TABS|TGS|AGS:|^(?=EFIN,))(?!\n\nNOFORN)(?:[:,;\s]*)(.+)', re.IGNORECASE|re.UNICODE|re.MULTILINE)
-_TAGS_CONT_PATTERN = re.compile(r'(?:\n)([a-zA-Z_-]+.+)', re.MULTILINE|re.UNICODE)
-_TAGS_CLEANUP_PATTERN = re.compile(ur'\s{5,}[^\n]+|(?:[,\s]+(?:(?:UN)CLASSIFIED|SECRET|PAGE|SUBJECT|E\.\s+O\.)[^\n]+)')
-_TAGS_CONT_NEXT_LINE_PATTERN = re.compile(ur'[ ]*\n[ ]*[A-Za-z_-]+[ ]*,')
-_TAG_PATTERN = re.compile(ur'(GOI[ ]+(?:EX|IN)TERNAL)'
+_TAGS_PATTERN = LazyPattern(ur'(?<!\()(?:TAGE?S+|TAG|TAS:|TABS|TGS|AGS:|^(?=EFIN,))(?!\n\nNOFORN)(?:[:,;\s]*)(.+)', re.IGNORECASE|re.UNICODE|re.MULTILINE)
+_TAGS_CONT_PATTERN = LazyPattern(r'(?:\n)([a-zA-Z_-]+.+)', re.MULTILINE|re.UNICODE)
+_TAGS_CLEANUP_PATTERN = LazyPattern(ur'\s{5,}[^\n]+|(?:[,\s]+(?:(?:UN)CLASSIFIED|SECRET|PAGE|SUBJECT|E\.\s+O\.)[^\n]+)')
+_TAGS_CONT_NEXT_LINE_PATTERN = LazyPattern(ur'[ ]*\n[ ]*[A-Za-z_-]+[ ]*,')
+_TAG_PATTERN = LazyPattern(ur'(GOI[ ]+(?:EX|IN)TERNAL)'
                           ur'|(POLITICAL[ ]+PARTIES)'
                           ur'|(USEU[ ]+BRUSSELS)|(POLITICS[ ]+FOREIGN[ ]+POLICY)'
                           ur'|(MILITARY[ ]+RELATIONS)|(ISRAEL[ ]+RELATIONS)'
@@ -733,7 +997,7 @@ _TAG_FIXES = {
     u'IZPREL': (u'IZ', u'PREL'), # 03ROME2045 and others
 }
 
-def parse_tags(content, reference_id=None, canonicalize=True):
+def parse_tags(content, reference_id=None, canonicalize=True, segment=None):
     """\
     Returns the TAGS of a cable.
     
@@ -748,18 +1012,16 @@ def parse_tags(content, reference_id=None, canonicalize=True):
         TAGs like "ECONEFIN" should be corrected (becomes "ECON", "EFIN").
         ``False`` indicates that the TAGs should be returned as found in
         cable.
+    `segment`
+        An optional `SubjectSegment` of the `content` (i.e. shared with
+        `parse_subject`).
     """
-    max_idx = _MAX_HEADER_IDX
-    m = _SUBJECT_MAX_PATTERN.search(content)
-    if m:
-        max_idx = m.start()
-    m = _SUBJECT_PATTERN.search(content, 0, max_idx)
-    if m:
-        max_idx = min(max_idx, m.start())
+    max_idx = (segment or SubjectSegment(content)).tags_max_idx
     m = _TAGS_PATTERN.search(content, 0, max_idx)
     if not m:
         if reference_id not in _CABLES_WITHOUT_TAGS:
-            logger.debug('No TAGS found in cable ID "%r", content: "%s"' % (reference_id, content))
+            DIAGNOSTICS.report(MISSING_TAGS, reference_id, logger, logging.DEBUG,
+                               'No TAGS found in cable ID "%r", content: "%s"', reference_id, content)
         return []
     tags = _TAGS_CLEANUP_PATTERN.sub(u' ', m.group(1))
     min_idx = m.end()
@@ -784,16 +1046,16 @@ def parse_tags(content, reference_id=None, canonicalize=True):
                 res.append(tag)
     return res
 
-_END_SUMMARY_PATTERN = re.compile(r'END\s+SUMMARY', re.IGNORECASE)
+_END_SUMMARY_PATTERN = LazyPattern(r'END\s+SUMMARY', re.IGNORECASE)
 # 09OSLO146 contains "Summay" instead of "SummaRy"
-_START_SUMMARY_PATTERN = re.compile(ur'(SUMMAR?Y( AND COMMENT)?( AND ACTION REQUEST)?( AND INTRODUCTION)?( AND TABLE OF CONTENTS)?[ ‐\-\n:\.]*)', re.IGNORECASE)
+_START_SUMMARY_PATTERN = LazyPattern(ur'(SUMMAR?Y( AND COMMENT)?( AND ACTION REQUEST)?( AND INTRODUCTION)?( AND TABLE OF CONTENTS)?[ ‐\-\n:\.]*)', re.IGNORECASE)
 # Some cables like 07BAGHDAD3895, 07TRIPOLI1066 contain "End Summary" but no "Summary:" start
 # Since End Summary occurs in the first paragraph, we interpret the first paragraph as summary
-_ALTERNATIVE_START_SUMMARY_PATTERN = re.compile(r'\n1\.[ ]*(\([^\)]+\))? ')
-_PARSE_SUMMARY_PATTERN = re.compile(r'(?:SUMMARY[ \-\n]*)(?::|\.|\s)(.+?)(?=(\n[ ]*\n)|(END[ ]+SUMMARY)|(----+))', re.DOTALL|re.IGNORECASE|re.UNICODE)
-_CLEAN_SUMMARY_CLS_PATTERN = re.compile(r'^[ ]*\([SBU/NTSC]+\)[ ]*')
-_CLEAN_SUMMARY_WS_PATTERN = re.compile('[ \n]+')
-_CLEAN_SUMMARY_PATTERN = re.compile(r'(===+)|(---+)|(((^[1-9])|(\n[1-9]))\.[ ]+\([^\)]+\)[ ]+)|(^[1-2]. Summary:)|(^[1-2]\.[ ]+)|(^and action request. )|(^and comment. )|(2. (C) Summary, continued:)', re.UNICODE|re.IGNORECASE)
+_ALTERNATIVE_START_SUMMARY_PATTERN = LazyPattern(r'\n1\.[ ]*(\([^\)]+\))? ')
+_PARSE_SUMMARY_PATTERN = LazyPattern(r'(?:SUMMARY[ \-\n]*)(?::|\.|\s)(.+?)(?=(\n[ ]*\n)|(END[ ]+SUMMARY)|(----+))', re.DOTALL|re.IGNORECASE|re.UNICODE)
+_CLEAN_SUMMARY_CLS_PATTERN = LazyPattern(r'^[ ]*\([SBU/NTSC]+\)[ ]*')
+_CLEAN_SUMMARY_WS_PATTERN = LazyPattern('[ \n]+')
+_CLEAN_SUMMARY_PATTERN = LazyPattern(r'(===+)|(---+)|(((^[1-9])|(\n[1-9]))\.[ ]+\([^\)]+\)[ ]+)|(^[1-2]. Summary:)|(^[1-2]\.[ ]+)|(^and action request. )|(^and comment. )|(2. (C) Summary, continued:)', re.UNICODE|re.IGNORECASE)
 
 def parse_summary(content, reference_id=None):
     """\
@@ -814,7 +1076,9 @@ def parse_summary(content, reference_id=None):
         if m:
             summary = content[m.end():end_of_summary]
         elif reference_id not in _CABLES_WITH_MALFORMED_SUMMARY:
-            logger.debug('Found "end of summary" but no start in "%s", content: "%s"' % (reference_id, content[:end_of_summary]))
+            DIAGNOSTICS.report(MALFORMED_SUMMARY, reference_id, logger, logging.DEBUG,
+                               'Found "end of summary" but no start in "%s", content: "%s"', reference_id,
+                               content[:end_of_summary])
     else:
         m = _PARSE_SUMMARY_PATTERN.search(content)
         if m:
@@ -827,6 +1091,52 @@ def parse_summary(content, reference_id=None):
     return summary
 
 
+_COMMENT_PATTERN = LazyPattern(r'(?:^|\n|\)|\.)[ ]*COMMENT[ ]*[:\.\-]+[ ]*(.+?)(?=(END[ ]+COMMENT)|(\n[ ]*\n)|\Z)', re.DOTALL|re.IGNORECASE|re.UNICODE)
+
+def parse_comment(content):
+    """\
+    Extracts the comment of the cable's author from the `content` of the cable.
+
+    If no comment can be found, ``None`` is returned.
+
+    `content`
+        The content of the cable.
+    """
+    m = _COMMENT_PATTERN.search(content)
+    if not m:
+        return None
+    return _CLEAN_SUMMARY_WS_PATTERN.sub(u' ', m.group(1)).strip() or None
+
+
+class SubjectSegment(object):
+    """\
+    Locates the SUBJECT line of a cable's content.
+
+    `parse_subject` and `parse_tags` need the same bounds (the TAGS are
+    searched in front of the SUBJECT line), a cable may provide one instance
+    to both functions so that the SUBJECT line is located only once.
+    """
+    __slots__ = ('subject_max_idx', 'subject_match')
+
+    def __init__(self, content):
+        """\
+
+        `content`
+            The cable's content.
+        """
+        m = _SUBJECT_MAX_PATTERN.search(content)
+        self.subject_max_idx = m.start() if m else _MAX_HEADER_IDX
+        self.subject_match = _SUBJECT_PATTERN.search(content, 0, self.subject_max_idx)
+
+    @property
+    def tags_max_idx(self):
+        """\
+        Returns the max. index where the TAGS may occur.
+        """
+        m = self.subject_match
+        return min(self.subject_max_idx, m.start()) if m else self.subject_max_idx
+
+
 if __name__ == '__main__':
     import doctest
     doctest.testmod()
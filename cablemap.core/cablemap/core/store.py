@@ -0,0 +1,463 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (c) 2011 - 2015 -- Lars Heuer <heuer[at]semagia.com>
+# All rights reserved.
+#
+# License: BSD, see LICENSE.txt for more details.
+#
+"""\
+Persists parsed cables in a compact, columnar file.
+
+Each property of the cables is kept in its own column. Strings are stored
+once in a string table and the columns refer to them by their index; list
+valued properties (tags, references, recipients, ...) are kept as offset
+arrays into flat value columns. The store is read via ``mmap``, values are
+decoded on access::
+
+    from cablemap.core import cables_from_source
+    from cablemap.core.store import write_store, cables_from_store
+
+    write_store('cables.store', cables_from_source('cables.csv'))
+    ...
+    for cable in cables_from_store('cables.store'):
+        print cable.subject
+
+The cables provided by the store implement `ICable`, handlers work with them
+without running the parsers again.
+
+:author:       Lars Heuer (heuer[at]semagia.com)
+:organization: Semagia - <http://www.semagia.com/>
+:license:      BSD license
+"""
+from __future__ import absolute_import, with_statement
+import sys
+import mmap
+import shutil
+import struct
+import tempfile
+from array import array
+from cablemap.core.models import _BaseCable, ParsedCable, Reference, Recipient
+from cablemap.core.interfaces import ICable, implements
+
+__all__ = ['CableStore', 'StoredCable', 'write_store', 'cables_from_store']
+
+_MAGIC = 'CABLEST2'
+_HEADER = struct.Struct('<8sII')
+_SECTION = struct.Struct('<48sc7xQQ')
+# Strings up to this length are interned. Longer strings (header, content,
+# summary) are almost always unique.
+_MAX_INTERNED_LENGTH = 256
+_MAX_OFFSET = 0xffffffff
+_SWAP_BYTES = sys.byteorder != 'little'
+
+_STRING_COLUMNS = ('reference_id', 'canonical_id', 'created', 'released', 'origin',
+                   'classification', 'header', 'content', 'transmission_id',
+                   'subject', 'nondisclosure_deadline', 'summary', 'comment')
+
+_LIST_COLUMNS = ('media_uris', 'classification_categories', 'tags', 'signed_by',
+                 'classified_by')
+
+_RECIPIENT_COLUMNS = ('recipients', 'info_recipients')
+
+_REFERENCE_FIELDS = ('value', 'kind', 'bullet', 'title')
+
+# Recipients are stored by position since they are restored by
+# ``Recipient(*values)``
+_RECIPIENT_FIELDS = ('route', 'name', 'precedence', 'mcn')
+
+# Sequence properties which remember if their value was a tuple or a list
+_SEQUENCE_COLUMNS = _LIST_COLUMNS + ('references',) + _RECIPIENT_COLUMNS
+
+
+def write_store(filename, cables):
+    """\
+    Writes the provided cables into a store and returns the number of
+    written cables.
+
+    All properties of the cables are parsed. If a cable is a
+    `cablemap.core.models.ParsedCable` its properties are taken as they are,
+    unknown (``None``) list properties are stored as empty lists.
+
+    `filename`
+        The name of the store.
+    `cables`
+        An iterable of `ICable` instances.
+    """
+    writer = _StoreWriter()
+    try:
+        for cable in cables:
+            if not isinstance(cable, ParsedCable):
+                cable = ParsedCable.from_cable(cable)
+            writer.add(cable)
+        with open(filename, 'wb') as f:
+            writer.write(f)
+    finally:
+        writer.close()
+    return writer.count
+
+
+def cables_from_store(filename, predicate=None):
+    """\
+    Returns a generator with `ICable` instances from the provided store.
+
+    The cables keep the store open, it is closed when neither the generator
+    nor any of the cables is referenced anymore.
+
+    `filename`
+        The name of the store.
+    `predicate`
+        A predicate that is invoked for each cable reference identifier.
+        If the predicate evaluates to ``False`` the cable is ignored.
+        By default, all cables are used.
+    """
+    store = CableStore(filename)
+    for idx in xrange(len(store)):
+        if predicate and not predicate(store.reference_id(idx)):
+            continue
+        yield StoredCable(store, idx)
+
+
+class _StoreWriter(object):
+    """\
+    Collects the columns of a store.
+
+    The columns are kept in memory, the string table is written to a
+    temporary file.
+    """
+    def __init__(self):
+        self.count = 0
+        self._strings = {}
+        self._string_offsets = array('I', [0])
+        self._string_data = tempfile.TemporaryFile()
+        self._sections = []
+        self._columns = {}
+        def column(name, typecode='i', initial=()):
+            arr = array(typecode, initial)
+            self._sections.append((name, arr))
+            self._columns[name] = arr
+        for name in _STRING_COLUMNS:
+            column(name)
+        column('is_partial', 'b')
+        for name in _SEQUENCE_COLUMNS:
+            column(name + '.tuple', 'b')
+        for name in _LIST_COLUMNS:
+            column(name + '.offsets', 'I', [0])
+            column(name + '.values')
+        column('references.offsets', 'I', [0])
+        for name in _REFERENCE_FIELDS:
+            column('references.' + name)
+        for prefix in _RECIPIENT_COLUMNS:
+            column(prefix + '.offsets', 'I', [0])
+            for name in _RECIPIENT_FIELDS:
+                column('%s.%s' % (prefix, name))
+            column(prefix + '.excluded.offsets', 'I', [0])
+            column(prefix + '.excluded.values')
+
+    def _string_id(self, s):
+        if s is None:
+            return -1
+        interned = len(s) <= _MAX_INTERNED_LENGTH
+        if interned:
+            sid = self._strings.get(s)
+            if sid is not None:
+                return sid
+        data = s.encode('utf-8')
+        end = self._string_offsets[-1] + len(data)
+        if end > _MAX_OFFSET:
+            raise ValueError('The string table of the store exceeds %d bytes' % _MAX_OFFSET)
+        self._string_data.write(data)
+        self._string_offsets.append(end)
+        sid = len(self._string_offsets) - 2
+        if interned:
+            self._strings[s] = sid
+        return sid
+
+    def add(self, cable):
+        """\
+        Adds a `ParsedCable` to the store.
+        """
+        columns, string_id = self._columns, self._string_id
+        for name in _STRING_COLUMNS:
+            columns[name].append(string_id(getattr(cable, name)))
+        is_partial = cable.is_partial
+        columns['is_partial'].append(-1 if is_partial is None else int(is_partial))
+        for name in _SEQUENCE_COLUMNS:
+            columns[name + '.tuple'].append(isinstance(getattr(cable, name), tuple))
+        for name in _LIST_COLUMNS:
+            values = columns[name + '.values']
+            values.extend([string_id(s) for s in getattr(cable, name) or ()])
+            columns[name + '.offsets'].append(len(values))
+        value, kind, bullet, title = [columns['references.' + name] for name in _REFERENCE_FIELDS]
+        for ref in cable.references or ():
+            value.append(string_id(ref.value))
+            kind.append(ref.kind)
+            bullet.append(string_id(ref.bullet))
+            title.append(string_id(ref.title))
+        columns['references.offsets'].append(len(value))
+        for prefix in _RECIPIENT_COLUMNS:
+            fields = [columns['%s.%s' % (prefix, name)] for name in _RECIPIENT_FIELDS]
+            excluded = columns[prefix + '.excluded.values']
+            excluded_offsets = columns[prefix + '.excluded.offsets']
+            for recipient in getattr(cable, prefix) or ():
+                for column, val in zip(fields, recipient):
+                    column.append(string_id(val))
+                excluded.extend([string_id(s) for s in recipient[len(_RECIPIENT_FIELDS)]])
+                excluded_offsets.append(len(excluded))
+            columns[prefix + '.offsets'].append(len(fields[0]))
+        self.count += 1
+
+    def write(self, f):
+        """\
+        Writes the store into the file-like object `f`.
+        """
+        sections = [(name, arr.typecode, arr.itemsize * len(arr), len(arr)) for name, arr in self._sections]
+        sections.append(('strings.offsets', 'I', 4 * len(self._string_offsets), len(self._string_offsets)))
+        data_length = self._string_offsets[-1]
+        sections.append(('strings.data', 'c', data_length, data_length))
+        offset = _HEADER.size + _SECTION.size * len(sections)
+        directory = []
+        for name, typecode, length, count in sections:
+            offset += -offset % 8
+            directory.append((name, typecode, offset, count))
+            offset += length
+        f.write(_HEADER.pack(_MAGIC, self.count, len(sections)))
+        for entry in directory:
+            f.write(_SECTION.pack(*entry))
+        arrays = [arr for _, arr in self._sections] + [self._string_offsets]
+        for arr, (_, _, offset, _) in zip(arrays, directory):
+            f.write('\0' * (offset - f.tell()))
+            if _SWAP_BYTES:
+                arr = array(arr.typecode, arr)
+                arr.byteswap()
+            arr.tofile(f)
+        f.write('\0' * (directory[-1][2] - f.tell()))
+        self._string_data.seek(0)
+        shutil.copyfileobj(self._string_data, f)
+
+    def close(self):
+        self._string_data.close()
+
+
+class CableStore(object):
+    """\
+    Provides read access to a store written by `write_store`.
+    """
+    def __init__(self, filename):
+        """\
+
+        `filename`
+            The name of the store.
+        """
+        self.filename = filename
+        self._file = open(filename, 'rb')
+        self._mm = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, self._count, section_count = _HEADER.unpack_from(self._mm, 0)
+        if magic != _MAGIC:
+            self.close()
+            raise ValueError('"%s" is not a cable store' % filename)
+        self._sections = {}
+        for i in xrange(section_count):
+            name, typecode, offset, _ = _SECTION.unpack_from(self._mm, _HEADER.size + i * _SECTION.size)
+            self._sections[name.rstrip('\0')] = (struct.Struct('<' + typecode), offset)
+        self._data_offset = self._sections['strings.data'][1]
+        self._ids = None
+
+    def __len__(self):
+        return self._count
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, tb):
+        self.close()
+
+    def __getitem__(self, idx):
+        if not -self._count <= idx < self._count:
+            raise IndexError('Cable index out of range: %r' % idx)
+        return StoredCable(self, idx % self._count)
+
+    def __iter__(self):
+        for idx in xrange(self._count):
+            yield StoredCable(self, idx)
+
+    def __contains__(self, reference_id):
+        return self.index_of(reference_id) is not None
+
+    def index_of(self, reference_id):
+        """\
+        Returns the position of the cable with the provided reference identifier
+        or ``None`` if the store does not contain the cable.
+
+        `reference_id`
+            The reference identifier or the canonical identifier of a cable.
+        """
+        if self._ids is None:
+            ids = {}
+            for idx in xrange(self._count):
+                ids[self.string_value('canonical_id', idx)] = idx
+                ids[self.string_value('reference_id', idx)] = idx
+            self._ids = ids
+        return self._ids.get(reference_id)
+
+    def cable(self, reference_id):
+        """\
+        Returns the cable with the provided reference identifier or ``None``.
+
+        `reference_id`
+            The reference identifier or the canonical identifier of a cable.
+        """
+        idx = self.index_of(reference_id)
+        return StoredCable(self, idx) if idx is not None else None
+
+    def reference_id(self, idx):
+        """\
+        Returns the reference identifier of the cable at position `idx`.
+        """
+        return self.string_value('reference_id', idx)
+
+    def _value(self, name, idx):
+        st, offset = self._sections[name]
+        return st.unpack_from(self._mm, offset + idx * st.size)[0]
+
+    def _string(self, sid):
+        if sid < 0:
+            return None
+        st, offset = self._sections['strings.offsets']
+        start, end = struct.unpack_from('<II', self._mm, offset + sid * st.size)
+        base = self._data_offset
+        return self._mm[base + start:base + end].decode('utf-8')
+
+    def _range(self, name, idx):
+        st, offset = self._sections[name]
+        return struct.unpack_from('<2' + st.format[-1], self._mm, offset + idx * st.size)
+
+    def string_value(self, name, idx):
+        """\
+        Returns the string property `name` of the cable at position `idx`.
+        """
+        return self._string(self._value(name, idx))
+
+    def list_value(self, name, idx):
+        """\
+        Returns the list property `name` of the cable at position `idx`.
+        """
+        start, end = self._range(name + '.offsets', idx)
+        values, string = name + '.values', self._string
+        value = self._value
+        return self._sequence(name, idx, [string(value(values, i)) for i in xrange(start, end)])
+
+    def bool_value(self, name, idx):
+        """\
+        Returns the boolean property `name` of the cable at position `idx`.
+        """
+        val = self._value(name, idx)
+        return None if val < 0 else bool(val)
+
+    def references(self, idx):
+        """\
+        Returns the references of the cable at position `idx`.
+        """
+        start, end = self._range('references.offsets', idx)
+        string, value = self._string, self._value
+        return self._sequence('references', idx,
+                              [Reference(string(value('references.value', i)), value('references.kind', i),
+                                         string(value('references.bullet', i)), string(value('references.title', i)))
+                               for i in xrange(start, end)])
+
+    def recipients(self, name, idx):
+        """\
+        Returns the recipients (`name` is either ``recipients`` or
+        ``info_recipients``) of the cable at position `idx`.
+        """
+        start, end = self._range(name + '.offsets', idx)
+        string, value = self._string, self._value
+        fields = ['%s.%s' % (name, field) for field in _RECIPIENT_FIELDS]
+        excluded_offsets, excluded = name + '.excluded.offsets', name + '.excluded.values'
+        res = []
+        for i in xrange(start, end):
+            values = [string(value(field, i)) for field in fields]
+            ex_start, ex_end = self._range(excluded_offsets, i)
+            values.append(tuple([string(value(excluded, j)) for j in xrange(ex_start, ex_end)]))
+            res.append(Recipient(*values))
+        return self._sequence(name, idx, res)
+
+    def _sequence(self, name, idx, values):
+        """\
+        Returns the `values` as tuple if the property `name` of the cable
+        at position `idx` was written as tuple.
+        """
+        return tuple(values) if self._value(name + '.tuple', idx) else values
+
+    def close(self):
+        """\
+        Closes the store.
+        """
+        if self._mm is not None:
+            self._mm.close()
+            self._mm = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+def _string_property(name):
+    return property(lambda self: self._store.string_value(name, self._idx))
+
+def _list_property(name):
+    return property(lambda self: self._store.list_value(name, self._idx))
+
+def _recipients_property(name):
+    return property(lambda self: self._store.recipients(name, self._idx))
+
+
+class StoredCable(_BaseCable):
+    """\
+    `ICable` view of a cable within a `CableStore`.
+
+    The properties are read from the store on access; the view keeps a
+    reference to the store and is valid as long as the store is not closed
+    explicitly.
+    """
+    __slots__ = ('_store', '_idx')
+    implements(ICable)
+
+    def __init__(self, store, idx):
+        self._store = store
+        self._idx = idx
+
+    def to_parsed_cable(self):
+        """\
+        Returns a `cablemap.core.models.ParsedCable` with the properties of
+        this cable which is independent of the store.
+        """
+        return ParsedCable.from_cable(self)
+
+    reference_id = _string_property('reference_id')
+    canonical_id = _string_property('canonical_id')
+    created = _string_property('created')
+    released = _string_property('released')
+    origin = _string_property('origin')
+    classification = _string_property('classification')
+    header = _string_property('header')
+    content = _string_property('content')
+    transmission_id = _string_property('transmission_id')
+    subject = _string_property('subject')
+    nondisclosure_deadline = _string_property('nondisclosure_deadline')
+    summary = _string_property('summary')
+    comment = _string_property('comment')
+    media_uris = _list_property('media_uris')
+    classification_categories = _list_property('classification_categories')
+    tags = _list_property('tags')
+    signed_by = _list_property('signed_by')
+    classified_by = _list_property('classified_by')
+    recipients = _recipients_property('recipients')
+    info_recipients = _recipients_property('info_recipients')
+
+    @property
+    def is_partial(self):
+        return self._store.bool_value('is_partial', self._idx)
+
+    @property
+    def references(self):
+        return self._store.references(self._idx)
+
@@ -16,36 +16,47 @@ from __future__ import absolute_import, with_statement
 import os
 import re
 import csv
+import mmap
 import codecs
 import string
-from itertools import imap
+import threading
+import Queue
+from collections import deque
 from StringIO import StringIO
 import gzip
-import urllib2
-from cablemap.core import cable_from_file, cable_from_html, cable_from_row, consts
+import bz2
+import tarfile
+import zipfile
+from cablemap.core import cable_from_html, cable_from_row, consts
+from cablemap.core.reader import reference_id_from_filename
+from cablemap.core.consts import LazyPattern
 import sys
 csv.field_size_limit(sys.maxint)
 del sys
+try:
+    from scandir import scandir as _scandir
+except ImportError:
+    _scandir = getattr(os, 'scandir', None)
 
 _CABLEID2MONTH = None
 
 
-class _Request(urllib2.Request):
-    def __init__(self, url):
-        urllib2.Request.__init__(self, url,
-                                 headers={'User-Agent': 'Cablemap/1.2',
-                                          'Accept-Encoding': 'gzip, identity'})
+_REQUEST_HEADERS = {'User-Agent': 'Cablemap/1.2',
+                    'Accept-Encoding': 'gzip, identity'}
 
 
 def _fetch_url(url):
     """\
     Returns the content of the provided URL.
     """
+    # urllib2 is imported on demand since it is expensive to import and
+    # rarely used
+    import urllib2
     try:
-        resp = urllib2.urlopen(_Request(url))
+        resp = urllib2.urlopen(urllib2.Request(url, headers=_REQUEST_HEADERS))
     except urllib2.URLError:
         if 'wikileaks.org' in url:
-            resp = urllib2.urlopen(_Request(url.replace('wikileaks.org', 'wikileaks.ch')))
+            resp = urllib2.urlopen(urllib2.Request(url.replace('wikileaks.org', 'wikileaks.ch'), headers=_REQUEST_HEADERS))
         else:
             raise
     if resp.info().get('Content-Encoding') == 'gzip':
@@ -54,7 +65,7 @@ def _fetch_url(url):
     
 
 _CGSN_BASE = u'https://cablegatesearch.wikileaks.org/cable.php?id='
-_CGSN_WL_SOURCE_SEARCH = re.compile(ur'''<td.*?>Source.+?<a.*?href=["']([^"']+)''').search
+_CGSN_WL_SOURCE_PATTERN = LazyPattern(ur'''<td.*?>Source.+?<a.*?href=["']([^"']+)''')
 
 def cable_page_by_id(reference_id):
     """\
@@ -96,7 +107,7 @@ def cable_page_by_id(reference_id):
     if wl_url is None:
         # The cable reference is not known, try to consult Cablegatesearch.
         html = _fetch_url(_CGSN_BASE + wl_id)
-        m = _CGSN_WL_SOURCE_SEARCH(html)
+        m = _CGSN_WL_SOURCE_PATTERN.search(html)
         wl_url = m.group(1) if m else None
     if wl_url is None:
         return None
@@ -131,7 +142,9 @@ def cables_from_source(path, predicate=None):
     Returns a generator with ``ICable`` instances.
 
     `path`
-        Either a directory or a CSV file.
+        Either a directory, an archive (``.zip``, ``.tar``, ``.tar.gz``,
+        ``.tgz``, ``.tar.bz2``, ``.tar.xz``) of cable files or a CSV
+        file. The CSV file may be compressed (``.gz``, ``.bz2``, ``.xz``).
     `predicate`
         A predicate that is invoked for each cable reference identifier.
         If the predicate evaluates to ``False`` the cable is ignored.
@@ -139,7 +152,9 @@ def cables_from_source(path, predicate=None):
         I.e. ``cables_from_source('cables.csv', lambda r: r.startswith('09'))``
         would return cables where the reference identifier starts with ``09``.
     """
-    return cables_from_directory(path, predicate) if os.path.isdir(path) else cables_from_csv(path, predicate)
+    if os.path.isdir(path) or is_archive(path):
+        return cables_from_directory(path, predicate)
+    return cables_from_csv(path, predicate)
 
 
 def cables_from_csv(filename, predicate=None, encoding='utf-8'):
@@ -153,6 +168,8 @@ def cables_from_csv(filename, predicate=None, encoding='utf-8'):
         The file must be a CSV file with the following columns:
         <identifier>, <creation-date>, <reference-id>, <origin>, <classification-level>, <references-to-other-cables>, <header>, <body>
         The delimiter must be a comma (``,``) and the content must be enclosed in double quotes (``"``).
+        Files with the extension ``.gz``, ``.bz2`` or ``.xz`` are decompressed
+        while reading.
     `predicate`
         A predicate that is invoked for each cable reference identifier.
         If the predicate evaluates to ``False`` the cable is ignored.
@@ -184,16 +201,187 @@ def rows_from_csv(filename, predicate=None, encoding='utf-8'):
         The file encoding (``UTF-8`` by default).
     """
     pred = predicate or bool
-    with open(filename, 'rb') as f:
-        for row in _UnicodeReader(f, encoding=encoding, delimiter=',', quotechar='"', escapechar='\\'):
-            ident, created, reference_id, origin, classification, references, header, body = row
-            if row and pred(reference_id):
-                yield ident, created, reference_id, origin, classification, references, header, body
+    with _open_binary(filename) as f:
+        lines = f
+        if _compression(filename) and codecs.lookup(encoding).name == 'utf-8':
+            lines = _read_ahead_lines(f)
+        try:
+            for row in _unicode_rows(lines, encoding, pred):
+                yield row
+        finally:
+            if lines is not f:
+                # Stops the read-ahead thread before the file is closed
+                lines.close()
+
+
+# Read buffer size of the CSV files
+_CSV_BUFFER_SIZE = 1 << 20
+
+# Max. number of decompressed chunks which are read ahead
+_READ_AHEAD_CHUNKS = 4
+
+_COMPRESSION_EXTENSIONS = (
+    # extension, compression
+    ('.gz', 'gz'), ('.tgz', 'gz'),
+    ('.bz2', 'bz2'), ('.tbz2', 'bz2'),
+    ('.xz', 'xz'), ('.txz', 'xz'),
+)
+
+_ARCHIVE_EXTENSIONS = ('.zip', '.tar', '.tar.gz', '.tgz', '.tar.bz2', '.tbz2', '.tar.xz', '.txz')
+
+
+def is_archive(path):
+    """\
+    Returns if the provided `path` denotes a ZIP or tar archive (judging by
+    its file extension).
+    """
+    return path.lower().endswith(_ARCHIVE_EXTENSIONS)
+
+
+def _compression(filename):
+    """\
+    Returns the compression of the provided `filename` (``gz``, ``bz2``,
+    ``xz``) or ``None``.
+    """
+    name = filename.lower()
+    for ext, compression in _COMPRESSION_EXTENSIONS:
+        if name.endswith(ext):
+            return compression
+    return None
+
+
+def _lzma():
+    """\
+    Returns the ``lzma`` module which is needed to read ``.xz`` files.
+    """
+    try:
+        import lzma
+    except ImportError:
+        try:
+            from backports import lzma
+        except ImportError:
+            raise ImportError('Reading .xz files requires the "backports.lzma" package')
+    return lzma
+
+
+def _open_binary(filename):
+    """\
+    Opens the provided `filename` in binary mode and returns a file-like
+    object which returns the decompressed data.
+    """
+    compression = _compression(filename)
+    if compression == 'gz':
+        return gzip.GzipFile(filename, 'rb')
+    if compression == 'bz2':
+        return bz2.BZ2File(filename, 'rb', _CSV_BUFFER_SIZE)
+    if compression == 'xz':
+        return _lzma().LZMAFile(filename, 'rb')
+    return open(filename, 'rb', _CSV_BUFFER_SIZE)
+
+
+def _read_ahead_lines(f, chunk_size=_CSV_BUFFER_SIZE, max_chunks=_READ_AHEAD_CHUNKS):
+    """\
+    Returns an iterator over the lines of the (compressed) file `f`.
+
+    The file is read and decompressed by a background thread which stays
+    up to `max_chunks` chunks ahead of the consumer. zlib, bz2 and lzma
+    release the GIL while decompressing, so the decompression overlaps with
+    the parsing of the rows.
+    """
+    chunks = Queue.Queue(max_chunks)
+    stopped = threading.Event()
+    def put(item):
+        while not stopped.is_set():
+            try:
+                chunks.put(item, timeout=.1)
+                return True
+            except Queue.Full:
+                pass
+        return False
+    def fill():
+        try:
+            while True:
+                data = f.read(chunk_size)
+                if not put(data) or not data:
+                    break
+        except Exception, ex:
+            put(ex)
+    reader = threading.Thread(target=fill, name='cablemap-read-ahead')
+    reader.daemon = True
+    reader.start()
+    try:
+        rest = ''
+        while True:
+            chunk = chunks.get()
+            if isinstance(chunk, Exception):
+                raise chunk
+            if not chunk:
+                break
+            lines = chunk.split('\n')
+            lines[0] = rest + lines[0]
+            rest = lines.pop()
+            for line in lines:
+                yield line + '\n'
+        if rest:
+            yield rest
+    finally:
+        stopped.set()
+        reader.join()
+
+
+def _unicode_rows(f, encoding, predicate):
+    """\
+    Returns an iterator over the rows of the cable CSV file `f` where the
+    `predicate` holds true for the reference identifier. The columns are
+    returned as unicode strings.
+
+    `f`
+        A file opened in binary mode or an iterator over the (binary) lines
+        of a UTF-8 encoded file.
+    `encoding`
+        The file encoding.
+    `predicate`
+        A predicate that is invoked for each cable reference identifier.
+    """
+    if codecs.lookup(encoding).name == 'utf-8':
+        return _utf8_rows(f, predicate)
+    return _recoded_rows(f, encoding, predicate)
+
+
+def _utf8_rows(f, predicate):
+    """\
+    Returns an iterator over the rows of the UTF-8 encoded CSV file `f`.
+
+    The delimiter, quote and escape chars are ASCII, so the CSV reader
+    can work directly on the UTF-8 encoded bytes and each column is decoded
+    at most once. The reference identifier is decoded first, the other columns
+    are only decoded if the `predicate` accepts the reference identifier.
+    """
+    for ident, created, reference_id, origin, classification, references, header, body \
+            in csv.reader(f, delimiter=',', quotechar='"', escapechar='\\'):
+        reference_id = unicode(reference_id, 'utf-8')
+        if predicate(reference_id):
+            yield unicode(ident, 'utf-8'), unicode(created, 'utf-8'), reference_id, \
+                  unicode(origin, 'utf-8'), unicode(classification, 'utf-8'), \
+                  unicode(references, 'utf-8'), unicode(header, 'utf-8'), unicode(body, 'utf-8')
+
+
+def _recoded_rows(f, encoding, predicate):
+    """\
+    Returns an iterator over the rows of the CSV file `f` which uses an
+    encoding != UTF-8.
+    """
+    for row in _UnicodeReader(f, encoding=encoding, delimiter=',', quotechar='"', escapechar='\\'):
+        ident, created, reference_id, origin, classification, references, header, body = row
+        if row and predicate(reference_id):
+            yield ident, created, reference_id, origin, classification, references, header, body
 
 
 class _UTF8Recoder:
     """\
     Iterator that reads an encoded stream and reencodes the input to UTF-8
+
+    Only used for CSV files which are not UTF-8 encoded, c.f. `_unicode_rows`
     """
     def __init__(self, f, encoding):
         self.reader = codecs.getreader(encoding)(f)
@@ -222,28 +410,166 @@ class _UnicodeReader:
         return self
 
 
-def cables_from_directory(directory, predicate=None):
+def mapped_cables_from_csv(filename, predicate=None, encoding='utf-8'):
+    """\
+    Returns a generator with ``ICable`` instances which refer to the header
+    and the content within the memory-mapped CSV file.
+
+    Only the metadata of the cables is decoded upfront, the header and the
+    content are decoded on first access (c.f. `cablemap.core.models.MappedCable`).
+    The decoded texts of a cable are discarded when the next cable is
+    requested, i.e. after the handler received the ``end_cable`` event.
+
+    `filename`
+        Absolute path to a CSV file, c.f. `cables_from_csv`.
+    `predicate`
+        A predicate that is invoked for each cable reference identifier.
+        If the predicate evaluates to ``False`` the cable is ignored.
+        By default, all cables are used.
+    `encoding`
+        The file encoding (``UTF-8`` by default). The encoding must be
+        ASCII compatible.
+    """
+    from cablemap.core.models import MappedCable, _format_creation_date
+    if not os.path.getsize(filename):
+        return
+    with open(filename, 'rb') as f:
+        # The map stays open as long as a cable refers to it
+        source = _MappedCSV(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ), encoding)
+    text = source.text
+    previous = None
+    for spans in source.rows():
+        if previous is not None:
+            previous.release()
+            previous = None
+        reference_id = text(spans[2])
+        if predicate and not predicate(reference_id):
+            continue
+        cable = MappedCable(reference_id, source, spans[6], spans[7])
+        cable.created = _format_creation_date(text(spans[1]))
+        cable.origin = text(spans[3])
+        cable.classification = text(spans[4]).upper()
+        previous = cable
+        yield cable
+
+
+_CSV_UNQUOTED_FIELD_PATTERN = LazyPattern(r'[^,"\r\n]*')
+_CSV_UNESCAPE_PATTERN = LazyPattern(r'\\(.)|""', re.DOTALL)
+
+class _MappedCSV(object):
+    """\
+    Provides the spans of the columns of a memory-mapped CSV file and
+    decodes them on demand.
+
+    A span is a tuple ``(start, end, escaped)``.
+    """
+    __slots__ = ('_mm', 'encoding')
+
+    def __init__(self, mm, encoding):
+        self._mm = mm
+        self.encoding = encoding
+
+    def rows(self):
+        """\
+        Returns an iterator over the rows of the CSV file. Each row is a
+        list of spans.
+        """
+        mm = self._mm
+        find, match = mm.find, _CSV_UNQUOTED_FIELD_PATTERN.match
+        pos, size = 0, len(mm)
+        while pos < size:
+            spans = []
+            while True:
+                if mm[pos:pos+1] == '"':
+                    # Quoted column, find the closing quote via memchr instead of
+                    # scanning the (long) header and content with a regex
+                    start = p = pos + 1
+                    escaped = False
+                    while True:
+                        end = find('"', p)
+                        if end == -1:
+                            raise ValueError('Unterminated column at offset %d' % start)
+                        b = end
+                        while b > start and mm[b-1] == '\\':
+                            b -= 1
+                        if (end - b) % 2:
+                            escaped, p = True, end + 1
+                        elif mm[end+1:end+2] == '"':
+                            escaped, p = True, end + 2
+                        else:
+                            break
+                    pos = end + 1
+                    escaped = escaped or find('\\', start, end) != -1
+                else:
+                    start = pos
+                    pos = end = match(mm, pos).end()
+                    escaped = False
+                spans.append((start, end, escaped))
+                c = mm[pos:pos+1]
+                if c == ',':
+                    pos += 1
+                    continue
+                if c == '\r':
+                    pos += 1
+                    c = mm[pos:pos+1]
+                if c == '\n':
+                    pos += 1
+                elif c:
+                    raise ValueError('Unexpected character %r at offset %d' % (c, pos))
+                break
+            if len(spans) > 1 or spans[0][0] != spans[0][1]:
+                yield spans
+
+    def text(self, span):
+        """\
+        Returns the unicode text of the provided `span`.
+        """
+        start, end, escaped = span
+        data = self._mm[start:end]
+        if escaped:
+            data = _CSV_UNESCAPE_PATTERN.sub(lambda m: m.group(1) or '"', data)
+        return data.decode(self.encoding)
+
+
+# Max. number of files which are read ahead per thread
+_READ_AHEAD_FILES = 16
+
+def cables_from_directory(directory, predicate=None, threads=None):
     """\
     Returns a generator with ``ICable`` instances.
     
     Walks through the provided directory and returns cables from
-    the ``.html`` files.
+    the ``.html`` files. The cables are returned in the order of
+    `cablefiles_from_directory`.
 
     `directory`
-        The directory to read the cables from.
+        The directory to read the cables from. It may be an archive
+        (``.zip``, ``.tar``, ``.tar.gz``, ``.tgz``, ``.tar.bz2``,
+        ``.tar.xz``) as well, c.f. `pages_from_archive`.
     `predicate`
         A predicate that is invoked for each cable filename.
         If the predicate evaluates to ``False`` the file is ignored.
         By default, all cable files are used.
         I.e. ``cables_from_directory('./cables/', lambda f: f.startswith('09'))``
         would return cables where the filename starts with ``09``. 
+    `threads`
+        The number of threads which read the files ahead of the parser or
+        ``None`` (default) to read them by the calling thread,
+        c.f. `pages_from_directory`. Ignored if `directory` is an archive.
     """
-    return imap(cable_from_file, cablefiles_from_directory(directory, predicate))
+    if is_archive(directory) and not os.path.isdir(directory):
+        pages = pages_from_archive(directory, predicate)
+    else:
+        pages = pages_from_directory(directory, predicate, threads)
+    return (cable_from_html(html, reference_id) for reference_id, html in pages)
 
 
 def cablefiles_from_directory(directory, predicate=None):
     """\
     Returns a generator which yields absoulte filenames to cable HTML files.
+
+    The files of a directory are returned before the files of its
+    subdirectories, files and subdirectories are sorted by their names.
     
     `directory`
         The directory.
@@ -255,9 +581,122 @@ def cablefiles_from_directory(directory, predicate=None):
         would accept only filenames starting with ``09``. 
     """
     pred = predicate or bool
-    for root, dirs, files in os.walk(directory):
-        for name in (n for n in files if '.html' in n and pred(n[:-5])):
-            yield os.path.join(os.path.abspath(root), name)
+    def walk(directory):
+        files, dirs = _list_directory(directory)
+        for name in sorted(n for n in files if '.html' in n and pred(n[:-5])):
+            yield os.path.join(directory, name)
+        for name in sorted(dirs):
+            for filename in walk(os.path.join(directory, name)):
+                yield filename
+    return walk(os.path.abspath(directory))
+
+
+def _list_directory(directory):
+    """\
+    Returns a tuple ``(files, directories)`` with the names of the entries
+    of the provided `directory`.
+
+    Uses ``scandir`` if available, which avoids a ``stat`` call per entry
+    on most platforms.
+    """
+    files, dirs = [], []
+    if _scandir is not None:
+        for entry in _scandir(directory):
+            (dirs if entry.is_dir() else files).append(entry.name)
+    else:
+        isdir, join = os.path.isdir, os.path.join
+        for name in os.listdir(directory):
+            (dirs if isdir(join(directory, name)) else files).append(name)
+    return files, dirs
+
+
+def pages_from_directory(directory, predicate=None, threads=None):
+    """\
+    Returns a generator which yields ``(reference-id, html)`` tuples from
+    the cable HTML files of the provided `directory`.
+
+    The pages are returned in the order of `cablefiles_from_directory`.
+
+    `directory`
+        The directory to read the cables from.
+    `predicate`
+        A predicate that is invoked for each cable filename,
+        c.f. `cablefiles_from_directory`.
+    `threads`
+        The number of threads which read the files. The threads read up to
+        16 files per thread ahead of the consumer. If `threads` is ``None``
+        (default) or less than ``2``, the files are read by the calling
+        thread. The threads do not pay off if the files are in the OS cache
+        (c.f. ``helpers/benchmark_directory.py``), they may help if reading
+        a file blocks (i.e. network file systems).
+    """
+    filenames = cablefiles_from_directory(directory, predicate)
+    if not threads or threads < 2:
+        for filename in filenames:
+            yield _read_page(filename)
+        return
+    from multiprocessing.pool import ThreadPool
+    pool = ThreadPool(threads)
+    try:
+        pending = deque()
+        max_pending = threads * _READ_AHEAD_FILES
+        for filename in filenames:
+            if len(pending) >= max_pending:
+                yield pending.popleft().get()
+            pending.append(pool.apply_async(_read_page, (filename,)))
+        while pending:
+            yield pending.popleft().get()
+    finally:
+        pool.terminate()
+        pool.join()
+
+
+def _read_page(filename):
+    """\
+    Returns a tuple ``(reference-id, html)`` of the provided cable file.
+    """
+    with open(filename, 'rb') as f:
+        return reference_id_from_filename(filename), f.read().decode('utf-8')
+
+
+def pages_from_archive(filename, predicate=None):
+    """\
+    Returns a generator which yields ``(reference-id, html)`` tuples from
+    the cable HTML files of a ZIP or tar archive.
+
+    The pages are returned in the order of the archive. Tar archives are
+    read sequentially, they are never extracted to disk.
+
+    `filename`
+        The archive (``.zip``, ``.tar``, ``.tar.gz``, ``.tgz``,
+        ``.tar.bz2``, ``.tar.xz``).
+    `predicate`
+        A predicate that is invoked for each cable filename (without the
+        directory and the ``.html`` extension). If the predicate evaluates
+        to ``False`` the archive member is skipped without reading it.
+    """
+    pred = predicate or bool
+    def wanted(path):
+        name = os.path.basename(path)
+        return '.html' in name and pred(name[:-5])
+    if filename.lower().endswith('.zip'):
+        with zipfile.ZipFile(filename) as zf:
+            for info in zf.infolist():
+                if not info.filename.endswith('/') and wanted(info.filename):
+                    yield reference_id_from_filename(info.filename), zf.read(info).decode('utf-8')
+        return
+    fileobj, mode = None, 'r|*'
+    if _compression(filename) == 'xz':
+        fileobj, mode = _lzma().LZMAFile(filename, 'rb'), 'r|'
+    tf = tarfile.open(filename, mode, fileobj=fileobj, bufsize=_CSV_BUFFER_SIZE)
+    try:
+        for member in tf:
+            if member.isfile() and wanted(member.name):
+                yield reference_id_from_filename(member.name), tf.extractfile(member).read().decode('utf-8')
+    finally:
+        tf.close()
+        if fileobj is not None:
+            fileobj.close()
 
 
 def reference_id_parts(reference_id):
@@ -275,8 +714,145 @@ def reference_id_parts(reference_id):
     raise ValueError('Illegal reference identifier: "%s"' % reference_id)
 
 
-_TAGS_SUBJECT = [l.upper().rstrip() for l in codecs.open(os.path.join(os.path.dirname(__file__), 'subject-tags.txt'), 'rb', 'utf-8')]
-_TAGS_ORG = [l.upper().rstrip() for l in codecs.open(os.path.join(os.path.dirname(__file__), 'organization-tags.txt'), 'rb', 'utf-8')]
+def validate_reference_ids(reference_ids):
+    """\
+    Returns a list of booleans which indicate if the provided reference
+    identifiers are valid, c.f. `reference_id_parts`.
+
+    Each distinct identifier is validated once.
+
+    `reference_ids`
+        An iterable of cable reference identifiers or canonical identifiers.
+    """
+    match = consts.REFERENCE_ID_PATTERN.match
+    seen = {}
+    res = []
+    append = res.append
+    for reference_id in reference_ids:
+        valid = seen.get(reference_id)
+        if valid is None:
+            valid = seen[reference_id] = match(reference_id) is not None
+        append(valid)
+    return res
+
+
+def _data_file_lines(name):
+    """\
+    Returns the lines of the data file `name` which is located in the
+    package directory.
+    """
+    with codecs.open(os.path.join(os.path.dirname(__file__), name), 'rb', 'utf-8') as f:
+        return [l.rstrip() for l in f]
+
+
+class TagClassifier(object):
+    """\
+    Classifies TAGs.
+
+    Geographic TAGs are detected by their length, person TAGs by a comma and
+    program TAGs by their length and the prefix ``K``. Subject and
+    organization TAGs are looked up in hash sets (by default read from
+    ``subject-tags.txt`` and ``organization-tags.txt`` on first use).
+
+    The kind of each distinct TAG is determined once and the number of
+    classified TAGs per kind is available via `counts`.
+    """
+    _MAX_CACHE_SIZE = 1 << 16
+
+    def __init__(self, subject_tags=None, org_tags=None):
+        """\
+
+        `subject_tags`
+            An iterable of subject TAGs or ``None`` to use the default
+            subject TAGs.
+        `org_tags`
+            An iterable of organization TAGs or ``None`` to use the default
+            organization TAGs.
+        """
+        self._subject_tags = frozenset(t.upper() for t in subject_tags) if subject_tags is not None else None
+        self._org_tags = frozenset(t.upper() for t in org_tags) if org_tags is not None else None
+        self._cache = {}
+        #: Maps the TAG kind onto the number of TAGs classified as this kind
+        self.counts = dict.fromkeys((consts.TAG_KIND_UNKNOWN, consts.TAG_KIND_SUBJECT,
+                                     consts.TAG_KIND_PERSON, consts.TAG_KIND_PROGRAM,
+                                     consts.TAG_KIND_GEO, consts.TAG_KIND_ORG), 0)
+
+    def _classify(self, tag):
+        """\
+        Returns the TAG kind (``consts.TAG_KIND_UNKNOWN`` if the kind is unknown).
+        """
+        if len(tag) == 2:
+            return consts.TAG_KIND_GEO
+        if u',' in tag:
+            return consts.TAG_KIND_PERSON
+        if tag[0] in u'Kk' and len(tag) == 4:
+            return consts.TAG_KIND_PROGRAM
+        if self._subject_tags is None:
+            self._subject_tags = frozenset(l.upper() for l in _data_file_lines('subject-tags.txt'))
+        if self._org_tags is None:
+            self._org_tags = frozenset(l.upper() for l in _data_file_lines('organization-tags.txt'))
+        t = tag.upper()
+        if t in self._subject_tags:
+            return consts.TAG_KIND_SUBJECT
+        if t in self._org_tags:
+            return consts.TAG_KIND_ORG
+        return consts.TAG_KIND_UNKNOWN
+
+    def kind(self, tag, default=consts.TAG_KIND_UNKNOWN):
+        """\
+        Returns the TAG kind.
+
+        `tag`
+            A string.
+        `default`
+            A value to return if the TAG kind is unknown
+            (set to ``constants.TAG_KIND_UNKNOWN`` by default)
+        """
+        kind = self._cache.get(tag)
+        if kind is None:
+            if len(self._cache) >= TagClassifier._MAX_CACHE_SIZE:
+                self._cache.clear()
+            kind = self._cache[tag] = self._classify(tag)
+        self.counts[kind] += 1
+        return kind if kind != consts.TAG_KIND_UNKNOWN else default
+
+    def kinds(self, tags, default=consts.TAG_KIND_UNKNOWN):
+        """\
+        Returns a list with the kind of each TAG of `tags`.
+
+        `tags`
+            An iterable of strings.
+        `default`
+            A value to use if the TAG kind is unknown
+            (set to ``constants.TAG_KIND_UNKNOWN`` by default)
+        """
+        cache = self._cache
+        get = cache.get
+        counts = self.counts
+        unknown = consts.TAG_KIND_UNKNOWN
+        res = []
+        append = res.append
+        for tag in tags:
+            kind = get(tag)
+            if kind is None:
+                if len(cache) >= TagClassifier._MAX_CACHE_SIZE:
+                    cache.clear()
+                kind = cache[tag] = self._classify(tag)
+            counts[kind] += 1
+            append(kind if kind != unknown else default)
+        return res
+
+    def reset_counts(self):
+        """\
+        Sets the counters of all TAG kinds to ``0``.
+        """
+        for kind in self.counts:
+            self.counts[kind] = 0
+
+
+# The subject and organization TAGs are read on first use
+_TAG_CLASSIFIER = TagClassifier()
+
 
 def tag_kind(tag, default=consts.TAG_KIND_UNKNOWN):
     """\
@@ -288,23 +864,33 @@ def tag_kind(tag, default=consts.TAG_KIND_UNKNOWN):
         A value to return if the TAG kind is unknown
         (set to ``constants.TAG_KIND_UNKNOWN`` by default)
     """
-    if len(tag) == 2:
-        return consts.TAG_KIND_GEO
-    if u',' in tag:
-        return consts.TAG_KIND_PERSON
-    if tag[0] in u'Kk' and len(tag) == 4:
-        return consts.TAG_KIND_PROGRAM
-    t = tag.upper()
-    if t in _TAGS_SUBJECT:
-        return consts.TAG_KIND_SUBJECT
-    if t in _TAGS_ORG:
-        return consts.TAG_KIND_ORG
-    return default
+    return _TAG_CLASSIFIER.kind(tag, default)
+
+
+def tag_kinds(tags, default=consts.TAG_KIND_UNKNOWN):
+    """\
+    Returns a list with the kind of each TAG of `tags`.
+
+    `tags`
+        An iterable of strings.
+    `default`
+        A value to use if the TAG kind is unknown
+        (set to ``constants.TAG_KIND_UNKNOWN`` by default)
+    """
+    return _TAG_CLASSIFIER.kinds(tags, default)
+
+
+def tag_kind_counts():
+    """\
+    Returns a dict which maps the TAG kinds onto the number of TAGs which
+    were classified by `tag_kind` and `tag_kinds` as this kind.
+    """
+    return dict(_TAG_CLASSIFIER.counts)
 
 
 _CLEAN_PATTERNS = (
         # pattern, substitution
-        (re.compile(r'''([0-9]+\s*\.?\s*\(?[SBU/NTSC]+\)[ ]*)  # Something like 1. (C)
+        (LazyPattern(r'''([0-9]+\s*\.?\s*\(?[SBU/NTSC]+\)[ ]*)  # Something like 1. (C)
                     |(\-{3,}|={3,}|_{3,}|/{3,}|\#{3,}|\*{3,}|\.{4,})      # Section delimiters
                     |(\s*[A-Z]+\s+[0-9 \.]+OF\s+[0-9]+)    # Section numbers like ROME 0001 003.2 OF 004
                     |(^[0-9]+\s*\.\s*)                     # Paragraph numbering without classification
@@ -331,8 +917,6 @@ def clean_content(content):
     return content
 
 
-_ACRONYMS = [l.rstrip() for l in codecs.open(os.path.join(os.path.dirname(__file__), 'acronyms.txt'), 'rb', 'utf-8')]
-
 #TODO: This should be automated as well.
 _SPECIAL_WORDS = {
     'UK-BASED': u'UK-Based',
@@ -373,10 +957,10 @@ _SPECIAL_WORDS = {
     u'FAO/WHO': u'FAO/WHO',
 }
 
-_TITLEFY_SMALL_PATTERN = re.compile(r'^(([0-9]+(th|st|rd|nd))|(a)|(an)|(and)|(as)|(at)|(but)|(by)|(en)|(for)|(if)|(in)|(of)|(on)|(or)|(the)|(to)|(v\.?)|(via)|(vs\.?))$', re.IGNORECASE)
-_TITLEFY_BIG_PATTERN = re.compile(ur"^([%s]?(%s)|(xx+)|(XX+)|(\([A-Z]{2,4}\):?))(?:[%s]?)(([,:;\.\-])|(?:'|’)([a-z]{1,3}))?$" % (string.punctuation, r'|'.join(_ACRONYMS), string.punctuation), re.UNICODE|re.IGNORECASE)
-_APOS_PATTERN = re.compile(ur"^(\w+)('|’|,)([A-Z]{1,3}|,s)$", re.UNICODE|re.IGNORECASE)
-_is_number = re.compile('^[0-9]+(th|st|rd|nd)$', re.IGNORECASE).match
+_TITLEFY_SMALL_PATTERN = LazyPattern(r'^(([0-9]+(th|st|rd|nd))|(a)|(an)|(and)|(as)|(at)|(but)|(by)|(en)|(for)|(if)|(in)|(of)|(on)|(or)|(the)|(to)|(v\.?)|(via)|(vs\.?))$', re.IGNORECASE)
+_TITLEFY_BIG_PATTERN = LazyPattern(lambda: ur"^([%s]?(%s)|(xx+)|(XX+)|(\([A-Z]{2,4}\):?))(?:[%s]?)(([,:;\.\-])|(?:'|’)([a-z]{1,3}))?$" % (string.punctuation, r'|'.join(_data_file_lines('acronyms.txt')), string.punctuation), re.UNICODE|re.IGNORECASE)
+_APOS_PATTERN = LazyPattern(ur"^(\w+)('|’|,)([A-Z]{1,3}|,s)$", re.UNICODE|re.IGNORECASE)
+_NUMBER_PATTERN = LazyPattern('^[0-9]+(th|st|rd|nd)$', re.IGNORECASE)
 
 def titlefy(subject):
     """\
@@ -391,7 +975,7 @@ def titlefy(subject):
     def clean_word(word):
         return _APOS_PATTERN.sub(lambda m: u'%s%s%s' % (m.group(1), m.group(2) if not m.group(2) == ',' else u"'", m.group(3).lower()), word)
     def titlefy_word(word):
-        if _is_number(word):
+        if _NUMBER_PATTERN.match(word):
             return word.lower()
         if _TITLEFY_BIG_PATTERN.match(word):
             return clean_word(word.upper())
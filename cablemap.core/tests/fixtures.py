@@ -0,0 +1,92 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (c) 2011 - 2015 -- Lars Heuer <heuer[at]semagia.com>
+# All rights reserved.
+#
+# License: BSD, see LICENSE.txt for more details.
+#
+"""\
+Test fixtures which are shared by the test modules.
+
+:author:       Lars Heuer (heuer[at]semagia.com)
+:organization: Semagia - <http://www.semagia.com/>
+:license:      BSD license
+"""
+import os
+import tempfile
+
+# CSV file with five cables
+CSV = os.path.join(os.path.dirname(__file__), 'data-csv', 'cables.csv')
+
+# Template of a cable page, c.f. `write_cable`
+HTML = u"""<html><body>
+<table class='cable'>
+<tr><th>Reference ID</th><th>Created</th><th>Classification</th><th>Origin</th></tr>
+<tr>
+<td><a href='/cable/%(year)s/02/%(ref)s.html'>%(ref)s</a></td>
+<td><a href='/date/%(year)s-02_0.html'>%(year)s-02-03 14:05</a></td>
+<td><a href='/classification/2_0.html'>CONFIDENTIAL</a></td>
+<td><a href='/origin/17_0.html'>Embassy Berlin</a></td>
+</tr>
+</table>
+<code><pre>VZCZCXRO1234
+PP RUEHAG
+DE RUEHRL #1167/01 0341405
+ZNY CCCCC ZZH
+P 031405Z FEB 09
+FM AMEMBASSY BERLIN
+TO RUEHC/SECSTATE WASHDC PRIORITY 3001</pre></code>
+<code><pre>C O N F I D E N T I A L BERLIN 001167
+
+E.O. 12958: DECL: 02/03/2019
+TAGS: PREL GM
+SUBJECT: %(subject)s
+
+MURPHY</pre></code>
+</body></html>
+"""
+
+
+def write_cable(directory, reference_id, subject=u'MEETING'):
+    """\
+    Writes the page of a cable into the provided `directory` and returns
+    the filename.
+    """
+    filename = os.path.join(directory, reference_id + '.html')
+    with open(filename, 'wb') as f:
+        f.write((HTML % dict(ref=reference_id, year=2000 + int(reference_id[:2]), subject=subject)).encode('utf-8'))
+    return filename
+
+
+def make_directory():
+    """\
+    Returns a temporary directory with the cables ``09BERLIN1167``,
+    ``09BERLIN1168`` and ``09BERLIN1169`` in the subdirectory ``2009``.
+    """
+    directory = tempfile.mkdtemp()
+    os.mkdir(os.path.join(directory, '2009'))
+    for reference_id in (u'09BERLIN1167', u'09BERLIN1168', u'09BERLIN1169'):
+        write_cable(os.path.join(directory, '2009'), reference_id)
+    return directory
+
+
+class RecordingCableHandler(object):
+    """\
+    Records all events as ``(name, args)`` tuples.
+    """
+    def __init__(self):
+        self.events = []
+
+    def __getattr__(self, name):
+        def record(*args):
+            self.events.append((name, args))
+        return record
+
+
+class WantingCableHandler(RecordingCableHandler):
+    """\
+    Records only the events it has declared.
+    """
+    def __init__(self, wanted):
+        super(WantingCableHandler, self).__init__()
+        self.wanted_events = frozenset(wanted)
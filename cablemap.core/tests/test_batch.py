@@ -0,0 +1,157 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (c) 2011 - 2015 -- Lars Heuer <heuer[at]semagia.com>
+# All rights reserved.
+#
+# License: BSD, see LICENSE.txt for more details.
+#
+"""\
+Tests the `cablemap.core.batch` module.
+
+:author:       Lars Heuer (heuer[at]semagia.com)
+:organization: Semagia - <http://www.semagia.com/>
+:license:      BSD license
+"""
+from nose.tools import eq_, ok_, raises
+from cablemap.core import cables_from_csv, handle_source
+from cablemap.core.models import ParsedCable
+from cablemap.core.batch import CableBatch, CableHandlerAdapter, cable_batches, \
+     handle_batches, handle_source_batches, wanted_columns
+from fixtures import CSV, RecordingCableHandler, WantingCableHandler
+
+
+class RecordingBatchHandler(object):
+    """\
+    Records the batches.
+    """
+    def __init__(self, wanted_columns=None):
+        self.wanted_columns = wanted_columns
+        self.events = []
+        self.batches = []
+
+    def start(self):
+        self.events.append('start')
+
+    def end(self):
+        self.events.append('end')
+
+    def handle_batch(self, batch):
+        self.events.append('handle_batch')
+        self.batches.append(batch)
+
+
+def _parsed_cables():
+    return [ParsedCable.from_cable(cable) for cable in cables_from_csv(CSV)]
+
+
+def test_columns():
+    cables = _parsed_cables()
+    batch = CableBatch(cables)
+    eq_(len(cables), len(batch))
+    eq_(cables, list(batch))
+    eq_(tuple(c.reference_id for c in cables), batch.column('reference_id'))
+    eq_(tuple(c.created for c in cables), batch.column('created'))
+    eq_(tuple(c.origin for c in cables), batch.column('origin'))
+    for i, cable in enumerate(cables):
+        eq_(cable.origin, batch.values('origin', i))
+
+
+def test_sequence_columns():
+    cables = _parsed_cables()
+    batch = CableBatch(cables)
+    tags, offsets = batch.column('tags'), batch.offsets('tags')
+    eq_(len(cables) + 1, len(offsets))
+    eq_(0, offsets[0])
+    eq_(len(tags), offsets[-1])
+    eq_([tag for cable in cables for tag in cable.tags], tags)
+    for i, cable in enumerate(cables):
+        eq_(list(cable.tags), tags[offsets[i]:offsets[i + 1]])
+        eq_(list(cable.tags), batch.values('tags', i))
+        eq_(list(cable.references), batch.values('references', i))
+    ok_(tags is batch.column('tags'))
+
+
+def test_unparsed_sequence_columns():
+    cables = [ParsedCable.from_cable(cable, ['tags']) for cable in cables_from_csv(CSV)]
+    batch = CableBatch(cables, ['tags'])
+    eq_(frozenset(['tags']), batch.properties)
+    eq_([], batch.column('recipients'))
+    eq_([0] * (len(cables) + 1), batch.offsets('recipients'))
+    eq_((None,) * len(cables), batch.column('subject'))
+
+
+def test_empty_batch():
+    batch = CableBatch([])
+    eq_(0, len(batch))
+    eq_((), batch.column('reference_id'))
+    eq_([], batch.column('tags'))
+    eq_([0], batch.offsets('tags'))
+
+
+@raises(ValueError)
+def test_offsets_illegal():
+    CableBatch(_parsed_cables()).offsets('reference_id')
+
+
+def test_cable_batches():
+    cables = _parsed_cables()
+    batches = list(cable_batches(cables_from_csv(CSV), size=2))
+    eq_((len(cables) + 1) // 2, len(batches))
+    ok_(all(len(batch) <= 2 for batch in batches))
+    eq_(cables, [cable for batch in batches for cable in batch])
+
+
+def test_cable_batches_properties():
+    for batch in cable_batches(cables_from_csv(CSV), properties=['tags']):
+        eq_(frozenset(['tags']), batch.properties)
+        for cable in batch:
+            eq_(None, cable.subject)
+
+
+def test_wanted_columns():
+    eq_(None, wanted_columns(RecordingBatchHandler()))
+    eq_(frozenset(['tags']), wanted_columns(RecordingBatchHandler(['tags'])))
+    eq_(None, wanted_columns(RecordingCableHandler()))
+
+
+def test_handle_batches():
+    handler = RecordingBatchHandler(['tags'])
+    handle_batches(cables_from_csv(CSV), handler, size=2)
+    eq_('start', handler.events[0])
+    eq_('end', handler.events[-1])
+    eq_(len(handler.batches), handler.events.count('handle_batch'))
+    eq_([c.reference_id for c in cables_from_csv(CSV)],
+        [reference_id for batch in handler.batches for reference_id in batch.column('reference_id')])
+    eq_(None, handler.batches[0].values('subject', 0))
+
+
+def test_adapter():
+    expected = RecordingCableHandler()
+    handle_source(CSV, expected)
+    handler = RecordingCableHandler()
+    handle_source_batches(CSV, CableHandlerAdapter(handler), size=3)
+    eq_(expected.events, handler.events)
+
+
+def test_adapter_wanted_events():
+    wanted = frozenset(['handle_tag', 'handle_subject'])
+    expected = WantingCableHandler(wanted)
+    handle_source(CSV, expected)
+    handler = WantingCableHandler(wanted)
+    adapter = CableHandlerAdapter(handler)
+    eq_(frozenset(['tags', 'subject']), adapter.wanted_columns)
+    handle_source_batches(CSV, adapter)
+    eq_(expected.events, handler.events)
+
+
+def test_handle_source_batches_workers():
+    expected = RecordingBatchHandler(['tags'])
+    handle_source_batches(CSV, expected, size=2)
+    handler = RecordingBatchHandler(['tags'])
+    handle_source_batches(CSV, handler, size=2, workers=2)
+    eq_([list(batch) for batch in expected.batches], [list(batch) for batch in handler.batches])
+
+
+if __name__ == '__main__':
+    import nose
+    nose.core.runmodule()
@@ -0,0 +1,67 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (c) 2011 - 2015 -- Lars Heuer <heuer[at]semagia.com>
+# All rights reserved.
+#
+# License: BSD, see LICENSE.txt for more details.
+#
+"""\
+Tests the memoized canonicalization functions.
+
+:author:       Lars Heuer (heuer[at]semagia.com)
+:organization: Semagia - <http://www.semagia.com/>
+:license:      BSD license
+"""
+from nose.tools import eq_
+from cablemap.core.c14n import memoize, canonicalize_id, canonicalize_ids, canonicalize_origin
+
+
+def test_memoize():
+    calls = []
+    @memoize(maxsize=2)
+    def upper(s):
+        """Upper"""
+        calls.append(s)
+        return s.upper()
+    eq_('upper', upper.__name__)
+    eq_('Upper', upper.__doc__)
+    eq_((0, 0, 2, 0), upper.cache_info())
+    eq_('A', upper('a'))
+    eq_('A', upper('a'))
+    eq_('B', upper('b'))
+    eq_(['a', 'b'], calls)
+    eq_((1, 2, 2, 2), upper.cache_info())
+    # The cache is full and cleared
+    eq_('C', upper('c'))
+    eq_((1, 3, 2, 1), upper.cache_info())
+    eq_('A', upper('a'))
+    eq_(['a', 'b', 'c', 'a'], calls)
+    upper.cache_clear()
+    eq_((0, 0, 2, 0), upper.cache_info())
+
+
+def test_canonicalize_id_memoized():
+    canonicalize_id.cache_clear()
+    eq_(u'05RIODEJANEIRO123', canonicalize_id(u'05RIO123'))
+    eq_(u'05RIODEJANEIRO123', canonicalize_id(u'05RIO123'))
+    info = canonicalize_id.cache_info()
+    eq_((1, 1, 1), (info.hits, info.misses, info.currsize))
+    eq_(canonicalize_id.__wrapped__(u'05RIO123'), canonicalize_id(u'05RIO123'))
+
+
+def test_canonicalize_origin():
+    eq_(u'RIODEJANEIRO', canonicalize_origin(u'RIO'))
+    eq_(u'VIENNA', canonicalize_origin(u'EMBASSYVIENNA'))
+
+
+def test_canonicalize_ids():
+    canonicalize_id.cache_clear()
+    eq_([u'05RIODEJANEIRO123', u'06STATE1', u'05RIODEJANEIRO123', u'09BERLIN1'],
+        canonicalize_ids(iter([u'05RIO123', u'06SECSTATE1', u'05RIO123', u'09BERLIN1'])))
+    eq_(3, canonicalize_id.cache_info().misses)
+    eq_([], canonicalize_ids([]))
+
+
+if __name__ == '__main__':
+    import nose
+    nose.core.runmodule()
@@ -0,0 +1,170 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (c) 2011 - 2015 -- Lars Heuer <heuer[at]semagia.com>
+# All rights reserved.
+#
+# License: BSD, see LICENSE.txt for more details.
+#
+"""\
+Tests the `cablemap.core.cache` module.
+
+:author:       Lars Heuer (heuer[at]semagia.com)
+:organization: Semagia - <http://www.semagia.com/>
+:license:      BSD license
+"""
+import os
+import tempfile
+from nose.tools import eq_, ok_
+from cablemap.core import cables_from_source, handle_source
+from cablemap.core.models import ParsedCable, PARSED_CABLE_FIELDS
+from cablemap.core.reader import PARSER_VERSIONS
+from cablemap.core.cache import ParseCache, CACHED_PROPERTIES
+from fixtures import CSV, RecordingCableHandler, WantingCableHandler
+
+_CABLE_COUNT = 5
+
+
+def _cache_filename():
+    fd, filename = tempfile.mkstemp(suffix='.cache')
+    os.close(fd)
+    return filename
+
+
+def test_cached_values():
+    def check(expected, cable):
+        eq_(expected, cable)
+    filename = _cache_filename()
+    try:
+        expected = [ParsedCable.from_cable(cable) for cable in cables_from_source(CSV)]
+        cache = ParseCache(filename)
+        eq_(expected, list(cache.cached_cables(cables_from_source(CSV))))
+        cache.close()
+        cache = ParseCache(filename)
+        cables = list(cache.cached_cables(cables_from_source(CSV)))
+        eq_(_CABLE_COUNT * len(CACHED_PROPERTIES), cache.hits)
+        eq_(0, cache.misses)
+        cache.close()
+        for exp, cable in zip(expected, cables):
+            yield check, exp, cable
+    finally:
+        os.remove(filename)
+
+
+def test_warm_run():
+    filename = _cache_filename()
+    try:
+        cache = ParseCache(filename)
+        list(cache.cached_cables(cables_from_source(CSV)))
+        eq_(0, cache.hits)
+        eq_(_CABLE_COUNT * len(CACHED_PROPERTIES), cache.misses)
+        eq_(_CABLE_COUNT, len(cache))
+        cache.close()
+        cache = ParseCache(filename)
+        list(cache.cached_cables(cables_from_source(CSV)))
+        eq_(_CABLE_COUNT * len(CACHED_PROPERTIES), cache.hits)
+        eq_(0, cache.misses)
+        cache.close()
+    finally:
+        os.remove(filename)
+
+
+def test_changed_content():
+    filename = _cache_filename()
+    try:
+        cache = ParseCache(filename)
+        list(cache.cached_cables(cables_from_source(CSV)))
+        cable = list(cables_from_source(CSV))[0]
+        cable.content = cable.content.replace(u'MEETING', u'TALK')
+        cache.hits = cache.misses = 0
+        eq_(u'TALK WITH THE GERMAN FOREIGN MINISTER', cache.parsed_cable(cable).subject)
+        eq_(0, cache.hits)
+        eq_(len(CACHED_PROPERTIES), cache.misses)
+        cache.close()
+    finally:
+        os.remove(filename)
+
+
+def test_version_bump():
+    filename = _cache_filename()
+    try:
+        cache = ParseCache(filename)
+        list(cache.cached_cables(cables_from_source(CSV)))
+        cache.close()
+        versions = dict(PARSER_VERSIONS)
+        versions['tags'] += 1
+        cache = ParseCache(filename, versions=versions)
+        list(cache.cached_cables(cables_from_source(CSV)))
+        eq_(_CABLE_COUNT, cache.misses)
+        eq_(_CABLE_COUNT * (len(CACHED_PROPERTIES) - 1), cache.hits)
+        cache.close()
+    finally:
+        os.remove(filename)
+
+
+def test_properties():
+    filename = _cache_filename()
+    try:
+        cache = ParseCache(filename)
+        cables = list(cache.cached_cables(cables_from_source(CSV), ['subject']))
+        eq_(_CABLE_COUNT, cache.misses)
+        eq_(u'MEETING WITH THE GERMAN FOREIGN MINISTER', cables[0].subject)
+        eq_(None, cables[0].tags)
+        eq_(u'09BERLIN1167', cables[0].reference_id)
+        cache.close()
+    finally:
+        os.remove(filename)
+
+
+def test_eviction():
+    filename = _cache_filename()
+    try:
+        cache = ParseCache(filename)
+        list(cache.cached_cables(cables_from_source(CSV)))
+        size = cache.size
+        cache.close()
+        cache = ParseCache(filename, max_size=size * 3 // 5)
+        cables = list(cables_from_source(CSV))
+        # Touch the first cable, it must not be evicted
+        cache.parsed_cable(cables[0])
+        cables[-1].content += u' '
+        cache.parsed_cable(cables[-1])
+        ok_(cache.size <= cache.max_size)
+        ok_(len(cache) < _CABLE_COUNT + 1)
+        cache.hits = cache.misses = 0
+        cache.parsed_cable(cables[0])
+        eq_(0, cache.misses)
+        cache.close()
+    finally:
+        os.remove(filename)
+
+
+def test_handle_source():
+    filename = _cache_filename()
+    try:
+        expected = RecordingCableHandler()
+        handle_source(CSV, expected)
+        for i in range(2):
+            cache = ParseCache(filename)
+            handler = RecordingCableHandler()
+            handle_source(CSV, handler, cache=cache)
+            eq_(expected.events, handler.events)
+            cache.close()
+    finally:
+        os.remove(filename)
+
+
+def test_handle_source_wanted_events():
+    filename = _cache_filename()
+    try:
+        cache = ParseCache(filename)
+        handler = WantingCableHandler(['handle_subject'])
+        handle_source(CSV, handler, cache=cache)
+        eq_(_CABLE_COUNT, cache.misses)
+        cache.close()
+    finally:
+        os.remove(filename)
+
+
+if __name__ == '__main__':
+    import nose
+    nose.core.runmodule()
@@ -0,0 +1,73 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (c) 2011 - 2015 -- Lars Heuer <heuer[at]semagia.com>
+# All rights reserved.
+#
+# License: BSD, see LICENSE.txt for more details.
+#
+"""\
+Tests the `cablemap.core.consts.LazyPattern` class and the lazy
+initialization of patterns and data files.
+
+:author:       Lars Heuer (heuer[at]semagia.com)
+:organization: Semagia - <http://www.semagia.com/>
+:license:      BSD license
+"""
+import re
+import sys
+import subprocess
+from nose.tools import eq_, ok_
+from cablemap.core.consts import LazyPattern
+
+
+def test_compiled_on_first_use():
+    calls = []
+    def pattern():
+        calls.append(1)
+        return r'([A-Z]+)([0-9]+)'
+    p = LazyPattern(pattern, re.IGNORECASE)
+    eq_([], calls)
+    eq_(('berlin', '1167'), p.match('berlin1167').groups())
+    eq_([1], calls)
+    eq_(('BERLIN', '1'), p.search('09BERLIN1').groups())
+    eq_([1], calls)
+
+
+def test_pattern_api():
+    p = LazyPattern(r'(?P<origin>[A-Z]+)([0-9]+)')
+    compiled = re.compile(r'(?P<origin>[A-Z]+)([0-9]+)')
+    eq_(compiled.findall('BERLIN1 PARIS2'), p.findall('BERLIN1 PARIS2'))
+    eq_(compiled.sub('X', 'BERLIN1 PARIS2'), p.sub('X', 'BERLIN1 PARIS2'))
+    eq_(compiled.split('BERLIN1 PARIS2'), p.split('BERLIN1 PARIS2'))
+    eq_([m.group(1) for m in compiled.finditer('BERLIN1 PARIS2')],
+        [m.group(1) for m in p.finditer('BERLIN1 PARIS2')])
+    eq_(compiled.pattern, p.pattern)
+    eq_(compiled.groups, p.groups)
+    eq_(compiled.groupindex, p.groupindex)
+
+
+def test_compile():
+    p = LazyPattern(r'[0-9]+')
+    compiled = p.compile()
+    ok_(compiled is p.compile())
+    eq_(compiled.match, p.match)
+
+
+def test_import_is_lazy():
+    code = '''
+import cablemap.core
+from cablemap.core import reader, utils, consts
+lazy = [v for m in (reader, utils) for v in vars(m).values() if isinstance(v, consts.LazyPattern)]
+print len(lazy), len([p for p in lazy if 'match' in vars(p)]), utils._TAG_CLASSIFIER._subject_tags is None
+utils.titlefy(u'GERMANY: THE SUBJECT')
+utils.tag_kind(u'PREL')
+print len([p for p in lazy if 'match' in vars(p)]) > 0, utils._TAG_CLASSIFIER._subject_tags is None
+'''
+    out = subprocess.check_output([sys.executable, '-c', code]).split()
+    ok_(int(out[0]) > 0)
+    eq_(['0', 'True', 'True', 'False'], out[1:])
+
+
+if __name__ == '__main__':
+    import nose
+    nose.core.runmodule()
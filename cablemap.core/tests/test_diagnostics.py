@@ -0,0 +1,98 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (c) 2011 - 2015 -- Lars Heuer <heuer[at]semagia.com>
+# All rights reserved.
+#
+# License: BSD, see LICENSE.txt for more details.
+#
+"""\
+Tests the `cablemap.core.diagnostics` module.
+
+:author:       Lars Heuer (heuer[at]semagia.com)
+:organization: Semagia - <http://www.semagia.com/>
+:license:      BSD license
+"""
+import logging
+from nose.tools import eq_, ok_
+from cablemap.core import reader
+from cablemap.core.diagnostics import Diagnostics, DIAGNOSTICS, MISSING_TAGS, MISSING_TO
+
+
+class RecordingLogHandler(logging.Handler):
+    def __init__(self):
+        logging.Handler.__init__(self)
+        self.messages = []
+
+    def emit(self, record):
+        self.messages.append(record.getMessage())
+
+
+class Unformattable(object):
+    """\
+    Fails if it is formatted.
+    """
+    def __str__(self):
+        raise AssertionError('Formatted')
+
+    __repr__ = __unicode__ = __str__
+
+
+def test_counts_and_samples():
+    diagnostics = Diagnostics(samples=2)
+    for reference_id in ('A', 'B', 'C'):
+        diagnostics.report(MISSING_TAGS, reference_id)
+    diagnostics.report(MISSING_TO, 'D')
+    eq_({MISSING_TAGS: 3, MISSING_TO: 1}, diagnostics.counts)
+    eq_({MISSING_TAGS: ['A', 'B'], MISSING_TO: ['D']}, diagnostics.samples)
+    eq_(['missing_tags: 3 (i.e. A, B)', 'missing_to: 1 (i.e. D)'], diagnostics.summary().splitlines())
+    diagnostics.reset()
+    eq_({}, diagnostics.counts)
+    eq_({}, diagnostics.samples)
+    eq_('', diagnostics.summary())
+
+
+def test_lazy_message():
+    logger = logging.getLogger('cablemap.test.diagnostics')
+    logger.setLevel(logging.INFO)
+    log_handler = RecordingLogHandler()
+    logger.addHandler(log_handler)
+    try:
+        diagnostics = Diagnostics()
+        diagnostics.report(MISSING_TAGS, 'A', logger, logging.DEBUG, 'No TAGS: %s', Unformattable())
+        eq_([], log_handler.messages)
+        eq_(1, diagnostics.counts[MISSING_TAGS])
+        diagnostics.report(MISSING_TAGS, 'B', logger, logging.WARNING, 'No TAGS: %s', 'B')
+        eq_(['No TAGS: B'], log_handler.messages)
+    finally:
+        logger.removeHandler(log_handler)
+
+
+def test_log_summary():
+    logger = logging.getLogger('cablemap.test.diagnostics')
+    logger.setLevel(logging.INFO)
+    log_handler = RecordingLogHandler()
+    logger.addHandler(log_handler)
+    try:
+        diagnostics = Diagnostics()
+        diagnostics.log_summary(logger)
+        eq_([], log_handler.messages)
+        diagnostics.report(MISSING_TO, 'A')
+        diagnostics.log_summary(logger)
+        eq_(['Diagnostics:\nmissing_to: 1 (i.e. A)'], log_handler.messages)
+    finally:
+        logger.removeHandler(log_handler)
+
+
+def test_reader_reports():
+    count = DIAGNOSTICS.counts.get(MISSING_TAGS, 0)
+    eq_([], reader.parse_tags(u'Nothing to see here', u'09BERLIN1'))
+    eq_(count + 1, DIAGNOSTICS.counts[MISSING_TAGS])
+    ok_(len(DIAGNOSTICS.samples[MISSING_TAGS]) > 0)
+    count = DIAGNOSTICS.counts.get(MISSING_TO, 0)
+    eq_([], reader.parse_recipients(u'Header w/o recipients', u'09BERLIN1'))
+    eq_(count + 1, DIAGNOSTICS.counts[MISSING_TO])
+
+
+if __name__ == '__main__':
+    import nose
+    nose.core.runmodule()
@@ -0,0 +1,198 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (c) 2011 - 2015 -- Lars Heuer <heuer[at]semagia.com>
+# All rights reserved.
+#
+# License: BSD, see LICENSE.txt for more details.
+#
+"""\
+Tests the `cablemap.core.fanout` module.
+
+:author:       Lars Heuer (heuer[at]semagia.com)
+:organization: Semagia - <http://www.semagia.com/>
+:license:      BSD license
+"""
+import os
+import pickle
+import shutil
+import tempfile
+import threading
+from nose.tools import eq_, ok_, raises
+from cablemap.core import handle_source, cables_from_csv
+from cablemap.core.handler import handle_cables
+from cablemap.core.models import ParsedCable
+from cablemap.core.fanout import FanOutCableHandler, SubprocessHandler
+from fixtures import CSV, RecordingCableHandler, WantingCableHandler
+
+
+class ThreadRecordingCableHandler(RecordingCableHandler):
+    """\
+    Records the events and the threads which issued them.
+    """
+    def __init__(self):
+        super(ThreadRecordingCableHandler, self).__init__()
+        self.threads = set()
+
+    def __getattr__(self, name):
+        def record(*args):
+            self.threads.add(threading.current_thread())
+            self.events.append((name, args))
+        return record
+
+
+class FailingCableHandler(RecordingCableHandler):
+    def handle_subject(self, subject):
+        raise ValueError(subject)
+
+
+class PicklingCableHandler(RecordingCableHandler):
+    """\
+    Writes the recorded events to a file at ``end()``.
+    """
+    def __init__(self, filename):
+        super(PicklingCableHandler, self).__init__()
+        self._filename = filename
+
+    def end(self):
+        self.events.append(('end', ()))
+        with open(self._filename, 'wb') as f:
+            pickle.dump(self.events, f)
+
+
+def _create_pickling_handler(filename):
+    return PicklingCableHandler(filename)
+
+
+class ExitingCableHandler(RecordingCableHandler):
+    def handle_subject(self, subject):
+        os._exit(3)
+
+
+def _create_failing_handler():
+    return FailingCableHandler()
+
+
+def _create_exiting_handler():
+    return ExitingCableHandler()
+
+
+def _counting_cables(counter, copies=200):
+    """\
+    Returns a generator over the parsed test cables (`copies` times) which
+    counts the cables taken from it.
+    """
+    cables = [ParsedCable.from_cable(cable) for cable in cables_from_csv(CSV)]
+    for i in range(copies):
+        for cable in cables:
+            counter.append(1)
+            yield cable
+
+
+def test_fanout():
+    expected = RecordingCableHandler()
+    handle_source(CSV, expected)
+    first, second = ThreadRecordingCableHandler(), ThreadRecordingCableHandler()
+    handle_source(CSV, FanOutCableHandler([first, second], max_cables=2))
+    eq_(expected.events, first.events)
+    eq_(expected.events, second.events)
+    ok_(threading.current_thread() not in first.threads)
+    eq_(1, len(first.threads))
+    ok_(first.threads != second.threads)
+
+
+def test_fanout_wanted_events():
+    expected_first, expected_second = WantingCableHandler(['handle_tag']), WantingCableHandler(['handle_subject'])
+    handle_source(CSV, expected_first)
+    handle_source(CSV, expected_second)
+    first, second = WantingCableHandler(['handle_tag']), WantingCableHandler(['handle_subject'])
+    handler = FanOutCableHandler([first, second])
+    eq_(frozenset(['handle_tag', 'handle_subject']), handler.wanted_events)
+    handle_source(CSV, handler)
+    eq_(expected_first.events, first.events)
+    eq_(expected_second.events, second.events)
+    eq_(None, FanOutCableHandler([RecordingCableHandler(), first]).wanted_events)
+
+
+def test_fanout_error():
+    handler = RecordingCableHandler()
+    try:
+        handle_source(CSV, FanOutCableHandler([FailingCableHandler(), handler], max_cables=1))
+        ok_(False, 'Expected a ValueError')
+    except ValueError:
+        pass
+    # The other handlers are stopped
+    expected = RecordingCableHandler()
+    handle_source(CSV, expected)
+    ok_(len(handler.events) < len(expected.events))
+    eq_(expected.events[:len(handler.events)], handler.events)
+
+
+def test_fanout_subprocess():
+    expected = RecordingCableHandler()
+    handle_source(CSV, expected)
+    tmpdir = tempfile.mkdtemp()
+    try:
+        filename = os.path.join(tmpdir, 'events.pickle')
+        handler = RecordingCableHandler()
+        handle_source(CSV, FanOutCableHandler([SubprocessHandler(_create_pickling_handler, (filename,)),
+                                                handler], max_cables=2))
+        eq_(expected.events, handler.events)
+        with open(filename, 'rb') as f:
+            eq_(expected.events, pickle.load(f))
+    finally:
+        shutil.rmtree(tmpdir)
+
+
+@raises(RuntimeError)
+def test_fanout_subprocess_error():
+    handle_source(CSV, FanOutCableHandler([SubprocessHandler(_create_failing_handler)]))
+
+
+def test_fanout_fail_fast():
+    counter = []
+    try:
+        handle_cables(_counting_cables(counter), FanOutCableHandler([FailingCableHandler()], max_cables=1))
+        ok_(False, 'Expected a ValueError')
+    except ValueError:
+        pass
+    ok_(len(counter) < 50, 'Expected an early error, got %d cables' % len(counter))
+
+
+def test_fanout_subprocess_fail_fast():
+    counter = []
+    try:
+        handle_cables(_counting_cables(counter), FanOutCableHandler([SubprocessHandler(_create_failing_handler)], max_cables=1))
+        ok_(False, 'Expected a RuntimeError')
+    except RuntimeError, ex:
+        ok_('ValueError' in str(ex))
+    ok_(len(counter) < 1000, 'Expected an early error, got %d cables' % len(counter))
+
+
+def test_fanout_subprocess_terminated():
+    handler = RecordingCableHandler()
+    try:
+        handle_source(CSV, FanOutCableHandler([SubprocessHandler(_create_exiting_handler), handler], max_cables=1))
+        ok_(False, 'Expected a RuntimeError')
+    except RuntimeError, ex:
+        ok_('exit code: 3' in str(ex), str(ex))
+
+
+def test_fanout_subprocess_terminated_at_end():
+    # The worker process terminates after it has received all events
+    try:
+        handle_source(CSV, FanOutCableHandler([SubprocessHandler(_create_exiting_handler)]))
+        ok_(False, 'Expected a RuntimeError')
+    except RuntimeError, ex:
+        ok_('exit code: 3' in str(ex), str(ex))
+
+
+def test_subprocess_handler_wanted_events():
+    eq_(None, SubprocessHandler(_create_failing_handler).wanted_events)
+    eq_(frozenset(['handle_tag']), SubprocessHandler(_create_failing_handler, wanted_events=['handle_tag']).wanted_events)
+    eq_(frozenset(['handle_tag']),
+        FanOutCableHandler([SubprocessHandler(_create_failing_handler, wanted_events=['handle_tag'])]).wanted_events)
+
+
+if __name__ == '__main__':
+    import nose
+    nose.core.runmodule()
@@ -0,0 +1,148 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (c) 2011 - 2015 -- Lars Heuer <heuer[at]semagia.com>
+# All rights reserved.
+#
+# License: BSD, see LICENSE.txt for more details.
+#
+"""\
+Tests the `cablemap.core.handler` module.
+
+:author:       Lars Heuer (heuer[at]semagia.com)
+:organization: Semagia - <http://www.semagia.com/>
+:license:      BSD license
+"""
+from nose.tools import eq_, ok_
+from cablemap.core import cable_from_row
+from cablemap.core.models import CompactCable
+from cablemap.core.handler import handle_cable, wanted_events, CABLE_EVENTS, \
+     NoopCableHandler, TeeCableHandler, MultipleCableHandler, DefaultMetadataOnlyFilter, \
+     DelegatingCableHandler, LoggingCableHandler, CableIdFilter, DispatchCableHandler
+from fixtures import RecordingCableHandler, WantingCableHandler
+
+_ROW = (u'1', u'2/3/2009 14:05', u'09BERLIN1167', u'Embassy Berlin', u'confidential', u'',
+        u'VZCZCXRO1234\nPP RUEHAG\nDE RUEHRL #1167\nFM AMEMBASSY BERLIN\nTO RUEHC/SECSTATE WASHDC PRIORITY 3001',
+        u'''E.O. 12958: DECL: 02/03/2019
+TAGS: PREL PGOV GM
+SUBJECT: MEETING WITH THE GERMAN FOREIGN MINISTER
+
+Classified By: Ambassador Philip D. Murphy for reasons 1.4 (b) and (d)
+
+1. (C) Summary: Bla bla. End Summary.
+
+MURPHY
+''')
+
+
+def events_of(cable, handler=None):
+    handler = handler or RecordingCableHandler()
+    handle_cable(cable, handler)
+    return handler.events
+
+
+def test_handle_cable():
+    events = events_of(cable_from_row(_ROW))
+    eq_(('start', ()), events[0])
+    eq_(('start_cable', (u'09BERLIN1167', u'09BERLIN1167')), events[1])
+    eq_(('end', ()), events[-1])
+    eq_(('end_cable', ()), events[-2])
+    names = [name for name, _ in events]
+    eq_(10, names.count('handle_wikileaks_iri'))
+    eq_(3, names.count('handle_tag'))
+    values = dict((name, args) for name, args in events)
+    eq_((u'2009-02-03T14:05:00Z',), values['handle_creation_datetime'])
+    eq_((u'MEETING WITH THE GERMAN FOREIGN MINISTER',), values['handle_subject'])
+    eq_((u'Bla bla.',), values['handle_summary'])
+    eq_((u'2019-02-03',), values['handle_nondisclosure_deadline'])
+    eq_((u'VZCZCXRO1234',), values['handle_transmission_id'])
+    eq_((False,), values['handle_partial'])
+    eq_((u'MURPHY',), values['handle_signer'])
+
+
+def test_handle_compact_cable():
+    eq_(events_of(cable_from_row(_ROW)), events_of(cable_from_row(_ROW, CompactCable)))
+
+
+def test_wanted_events():
+    eq_(None, wanted_events(RecordingCableHandler()))
+    eq_(None, wanted_events(NoopCableHandler()))
+    tags = WantingCableHandler(['handle_tag'])
+    subject = WantingCableHandler(['handle_subject'])
+    eq_(frozenset(['handle_tag', 'handle_subject']), wanted_events(TeeCableHandler(tags, subject)))
+    eq_(None, wanted_events(TeeCableHandler(tags, RecordingCableHandler())))
+    eq_(frozenset(['handle_tag', 'handle_subject']), wanted_events(MultipleCableHandler([tags, subject])))
+    eq_(None, wanted_events(MultipleCableHandler([tags, NoopCableHandler()])))
+    eq_(frozenset(), wanted_events(MultipleCableHandler([])))
+
+
+def test_wanted_events_metadata_filter():
+    wanted = wanted_events(DefaultMetadataOnlyFilter(RecordingCableHandler()))
+    eq_(CABLE_EVENTS - frozenset(['handle_content', 'handle_header', 'handle_release_date']), wanted)
+    wanted = wanted_events(DefaultMetadataOnlyFilter(WantingCableHandler(['handle_tag', 'handle_content'])))
+    eq_(frozenset(['handle_tag']), wanted)
+
+
+def test_handle_cable_wanted_events():
+    events = events_of(cable_from_row(_ROW), WantingCableHandler(['handle_tag']))
+    eq_(['start', 'start_cable', 'handle_tag', 'handle_tag', 'handle_tag', 'end_cable', 'end'],
+        [name for name, _ in events])
+
+
+def test_handle_cable_nothing_wanted():
+    cable = cable_from_row(_ROW, CompactCable)
+    events = events_of(cable, WantingCableHandler([]))
+    eq_(['start', 'start_cable', 'end_cable', 'end'], [name for name, _ in events])
+    # Nothing but the canonical id was parsed
+    eq_(['canonical_id'], list(cable._parsed))
+
+
+def _handler_tree():
+    leaves = [RecordingCableHandler() for i in range(5)]
+    european = CableIdFilter(TeeCableHandler(leaves[0], leaves[1]), lambda canonical_id: 'BERLIN' in canonical_id)
+    return MultipleCableHandler([DefaultMetadataOnlyFilter(TeeCableHandler(european, leaves[2])),
+                                 DelegatingCableHandler(leaves[3]), NoopCableHandler(),
+                                 LoggingCableHandler(leaves[4], 'debug')]), leaves
+
+
+def test_dispatch_handler():
+    rows = (_ROW, (_ROW[0], _ROW[1], u'09PARIS1') + _ROW[3:])
+    expected, expected_leaves = _handler_tree()
+    handler, leaves = _handler_tree()
+    dispatcher = DispatchCableHandler(handler)
+    for row in rows:
+        handle_cable(cable_from_row(row), expected)
+        handle_cable(cable_from_row(row), dispatcher)
+    for expected_leaf, leaf in zip(expected_leaves, leaves):
+        eq_(expected_leaf.events, leaf.events)
+    ok_(leaves[0].events)
+    eq_(1, [name for name, _ in leaves[0].events].count('start_cable'))
+
+
+def test_dispatch_handler_drops_noop_events():
+    tags = WantingCableHandler(['handle_tag'])
+    dispatcher = DispatchCableHandler(MultipleCableHandler([tags, NoopCableHandler(), DelegatingCableHandler(NoopCableHandler())]))
+    eq_(frozenset(['handle_tag']), dispatcher.wanted_events)
+    events_of(cable_from_row(_ROW), dispatcher)
+    eq_(['start', 'start_cable', 'handle_tag', 'handle_tag', 'handle_tag', 'end_cable', 'end'],
+        [name for name, _ in tags.events])
+
+
+def test_dispatch_handler_single_method():
+    class Handler(object):
+        def handle_tag(self, tag): pass
+    handler = Handler()
+    dispatcher = DispatchCableHandler(DelegatingCableHandler(TeeCableHandler(handler, NoopCableHandler())))
+    eq_(handler.handle_tag, dispatcher.handle_tag)
+
+
+def test_dispatch_handler_nested():
+    recorder = RecordingCableHandler()
+    dispatcher = DispatchCableHandler(TeeCableHandler(DispatchCableHandler(recorder), NoopCableHandler()))
+    eq_(CABLE_EVENTS, dispatcher.wanted_events)
+    handle_cable(cable_from_row(_ROW), dispatcher)
+    eq_(events_of(cable_from_row(_ROW)), recorder.events)
+
+
+if __name__ == '__main__':
+    import nose
+    nose.core.runmodule()
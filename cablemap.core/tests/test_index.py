@@ -0,0 +1,75 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (c) 2011 - 2015 -- Lars Heuer <heuer[at]semagia.com>
+# All rights reserved.
+#
+# License: BSD, see LICENSE.txt for more details.
+#
+"""\
+Tests the `cablemap.core.index` module.
+
+:author:       Lars Heuer (heuer[at]semagia.com)
+:organization: Semagia - <http://www.semagia.com/>
+:license:      BSD license
+"""
+import os
+import tempfile
+from nose.tools import eq_, ok_
+from cablemap.core import cable_from_index
+from cablemap.core.utils import rows_from_csv
+from cablemap.core.index import build_index, load_index
+from fixtures import CSV
+
+
+def test_rows():
+    def check(row):
+        eq_(row, index.row(row[2]))
+    index = build_index(CSV)
+    rows = list(rows_from_csv(CSV))
+    eq_(len(rows), len(index))
+    for row in reversed(rows):
+        yield check, row
+
+
+def test_cable_from_index():
+    index = build_index(CSV)
+    cable = cable_from_index(index, u'09BERLIN1167')
+    eq_(u'09BERLIN1167', cable.reference_id)
+    eq_([u'PREL', u'PGOV', u'GM'], cable.tags)
+    eq_(None, cable_from_index(index, u'09BERLIN1'))
+    index.close()
+
+
+def test_canonical_id():
+    fd, filename = tempfile.mkstemp(suffix='.csv')
+    os.close(fd)
+    try:
+        with open(filename, 'wb') as f:
+            f.write(open(CSV, 'rb').read())
+            f.write('"6","3/1/2007 11:00","07SOIA828","Embassy Sofia","UNCLASSIFIED","","","TAGS: PREL BU\n"\n')
+        index = build_index(filename)
+        ok_(u'07SOIA828' in index)
+        ok_(u'07SOFIA828' in index)
+        eq_(u'07SOIA828', cable_from_index(index, u'07SOFIA828').reference_id)
+        index.close()
+    finally:
+        os.remove(filename)
+
+
+def test_save_load():
+    fd, filename = tempfile.mkstemp(suffix='.idx')
+    os.close(fd)
+    try:
+        index = build_index(CSV)
+        index.save(filename)
+        index2 = load_index(filename, CSV)
+        eq_(sorted(index), sorted(index2))
+        for reference_id in index:
+            eq_(index.locate(reference_id), index2.locate(reference_id))
+    finally:
+        os.remove(filename)
+
+
+if __name__ == '__main__':
+    import nose
+    nose.core.runmodule()
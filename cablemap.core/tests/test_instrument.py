@@ -0,0 +1,161 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (c) 2011 - 2015 -- Lars Heuer <heuer[at]semagia.com>
+# All rights reserved.
+#
+# License: BSD, see LICENSE.txt for more details.
+#
+"""\
+Tests the `cablemap.core.instrument` module.
+
+:author:       Lars Heuer (heuer[at]semagia.com)
+:organization: Semagia - <http://www.semagia.com/>
+:license:      BSD license
+"""
+import json
+import logging
+from StringIO import StringIO
+from nose.tools import eq_, ok_, raises
+from cablemap.core import reader, handle_source
+from cablemap.core.handler import LoggingCableHandler
+from cablemap.core.instrument import Instrumentation, _percentile
+from fixtures import CSV, RecordingCableHandler, WantingCableHandler
+
+_REFERENCE_IDS = (u'09BERLIN1167', u'66BUENOSAIRES2481', u'10MADRID12', u'08PARIS1300', u'09BERLIN300')
+
+
+def test_enable_disable():
+    parse_tags = reader.parse_tags
+    instrumentation = Instrumentation()
+    with instrumentation:
+        ok_(instrumentation.enabled)
+        ok_(reader.parse_tags is not parse_tags)
+        eq_('parse_tags', reader.parse_tags.__name__)
+    ok_(not instrumentation.enabled)
+    ok_(reader.parse_tags is parse_tags)
+
+
+@raises(RuntimeError)
+def test_enable_twice():
+    with Instrumentation():
+        Instrumentation().enable()
+
+
+def test_reader_timings():
+    instrumentation = Instrumentation(slowest=2)
+    with instrumentation:
+        handle_source(CSV, WantingCableHandler(['handle_tag', 'handle_comment']))
+    stats = instrumentation.stats()
+    eq_(set(['reader.parse_tags', 'reader.parse_comment']), set(stats))
+    tags = stats['reader.parse_tags']
+    eq_(5, tags['count'])
+    eq_(2, len(tags['slowest']))
+    ok_(tags['slowest'][0][1] >= tags['slowest'][1][1])
+    ok_(tags['slowest'][0][0] in _REFERENCE_IDS)
+    ok_(tags['p50'] <= tags['p90'] <= tags['p99'] <= tags['max'])
+    ok_(abs(tags['total'] - tags['mean'] * 5) < 1e-9)
+    # parse_comment has no reference id parameter
+    eq_([None, None], [cable_id for cable_id, duration in stats['reader.parse_comment']['slowest']])
+
+
+def test_handler_timings():
+    expected = RecordingCableHandler()
+    handle_source(CSV, expected)
+    handler = RecordingCableHandler()
+    instrumentation = Instrumentation()
+    with instrumentation:
+        handle_source(CSV, instrumentation.handler(handler))
+    eq_(expected.events, handler.events)
+    stats = instrumentation.stats()
+    eq_(5, stats['handler.cable']['count'])
+    eq_(1, stats['handler.start']['count'])
+    eq_(len([e for e in expected.events if e[0] == 'handle_tag']), stats['handler.handle_tag']['count'])
+    # The cable id is taken from the current cable
+    ok_(all(cable_id in _REFERENCE_IDS for cable_id, duration in stats['reader.parse_comment']['slowest']))
+
+
+def test_handler_wanted_events():
+    instrumentation = Instrumentation()
+    handler = instrumentation.handler(WantingCableHandler(['handle_tag']))
+    eq_(frozenset(['handle_tag']), handler.wanted_events)
+    handle_source(CSV, handler)
+    eq_(set(['handler.start', 'handler.end', 'handler.start_cable', 'handler.end_cable',
+             'handler.cable', 'handler.handle_tag']), set(instrumentation.stats()))
+
+
+def test_json():
+    instrumentation = Instrumentation()
+    instrumentation.record('a', 0.5, 'X')
+    instrumentation.record('a', 1.5, 'Y')
+    expected = {'a': {'count': 2, 'total': 2.0, 'mean': 1.0, 'max': 1.5,
+                      'p50': 0.5, 'p90': 1.5, 'p99': 1.5,
+                      'slowest': [['Y', 1.5], ['X', 0.5]]}}
+    eq_(expected, json.loads(instrumentation.to_json()))
+    out = StringIO()
+    instrumentation.to_json(out)
+    eq_(expected, json.loads(out.getvalue()))
+    instrumentation.reset()
+    eq_({}, instrumentation.stats())
+
+
+def test_bounded_samples():
+    instrumentation = Instrumentation(slowest=3, samples=100)
+    for i in range(1, 10001):
+        instrumentation.record('a', i / 1000.0, i)
+    timing = instrumentation._timings['a']
+    eq_(100, len(timing.samples))
+    eq_(3, len(timing.slowest))
+    stats = instrumentation.stats()['a']
+    eq_(10000, stats['count'])
+    ok_(abs(stats['total'] - 50005.0) < 1e-6)
+    ok_(abs(stats['mean'] - 5.0005) < 1e-9)
+    eq_(10.0, stats['max'])
+    eq_([[10000, 10.0], [9999, 9.999], [9998, 9.998]], stats['slowest'])
+    # The percentiles are estimated from the sample
+    ok_(3.0 < stats['p50'] < 7.0, stats['p50'])
+    ok_(stats['p50'] <= stats['p90'] <= stats['p99'] <= stats['max'])
+
+
+def test_percentile():
+    durations = range(1, 101)
+    eq_(50, _percentile(durations, 50))
+    eq_(90, _percentile(durations, 90))
+    eq_(100, _percentile(durations, 100))
+    eq_(7, _percentile([7], 99))
+
+
+def test_summary():
+    instrumentation = Instrumentation()
+    instrumentation.record('fast', 0.1, 'X')
+    instrumentation.record('slow', 1.0, 'Y')
+    lines = instrumentation.summary().splitlines()
+    eq_(3, len(lines))
+    ok_(lines[1].startswith('slow'))
+    ok_(lines[1].endswith('Y'))
+    eq_(2, len(instrumentation.summary(limit=1).splitlines()))
+
+
+def test_logging_handler_summary():
+    records = []
+    class Handler(logging.Handler):
+        def emit(self, record):
+            records.append(record.getMessage())
+    log_handler = Handler()
+    logging.getLogger().addHandler(log_handler)
+    try:
+        instrumentation = Instrumentation()
+        instrumentation.record('reader.parse_tags', 0.1)
+        handler = RecordingCableHandler()
+        logging_handler = LoggingCableHandler(handler, 'error', instrumentation)
+        logging_handler.start()
+        logging_handler.end()
+    finally:
+        logging.getLogger().removeHandler(log_handler)
+    eq_([('start', ()), ('end', ())], handler.events)
+    eq_('end()', records[-2])
+    ok_('reader.parse_tags' in records[-1])
+
+
+if __name__ == '__main__':
+    import nose
+    nose.core.runmodule()
@@ -0,0 +1,106 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (c) 2011 - 2015 -- Lars Heuer <heuer[at]semagia.com>
+# All rights reserved.
+#
+# License: BSD, see LICENSE.txt for more details.
+#
+"""\
+Tests the `cablemap.core.manifest` module.
+
+:author:       Lars Heuer (heuer[at]semagia.com)
+:organization: Semagia - <http://www.semagia.com/>
+:license:      BSD license
+"""
+import os
+import shutil
+import tempfile
+from nose.tools import eq_, ok_, raises
+from cablemap.core import handle_source
+from cablemap.core.manifest import Manifest, DirectoryChanges, load_manifest
+from fixtures import CSV, RecordingCableHandler, write_cable, make_directory
+
+
+def _subjects(handler):
+    return [args[0] for name, args in handler.events if name == 'handle_subject']
+
+
+def test_first_run():
+    directory = make_directory()
+    try:
+        handler = RecordingCableHandler()
+        changes = handle_source(directory, handler, since=Manifest())
+        eq_([u'MEETING'] * 3, _subjects(handler))
+        eq_(['09BERLIN1167', '09BERLIN1168', '09BERLIN1169'], changes.added)
+        eq_([], changes.changed)
+        eq_([], changes.deleted)
+        eq_(3, len(changes.manifest))
+        ok_(os.path.join('2009', '09BERLIN1167.html') in changes.manifest)
+    finally:
+        shutil.rmtree(directory)
+
+
+def test_incremental_run():
+    directory = make_directory()
+    try:
+        manifest = handle_source(directory, RecordingCableHandler(), since=Manifest()).manifest
+        path = os.path.join(directory, '2009')
+        write_cable(path, u'09BERLIN1168', u'CHANGED')
+        # Changed mtime, same content
+        os.utime(os.path.join(path, '09BERLIN1169.html'), (0, 0))
+        os.remove(os.path.join(path, '09BERLIN1167.html'))
+        write_cable(path, u'09BERLIN1170')
+        handler = RecordingCableHandler()
+        changes = handle_source(directory, handler, since=manifest)
+        eq_([u'CHANGED', u'MEETING'], _subjects(handler))
+        eq_(['09BERLIN1170'], changes.added)
+        eq_(['09BERLIN1168'], changes.changed)
+        eq_(['09BERLIN1167'], changes.deleted)
+        eq_(3, len(changes.manifest))
+        handler = RecordingCableHandler()
+        changes = handle_source(directory, handler, since=changes.manifest)
+        eq_([], handler.events[2:-2])
+        eq_(([], [], []), (changes.added, changes.changed, changes.deleted))
+    finally:
+        shutil.rmtree(directory)
+
+
+def test_predicate():
+    directory = make_directory()
+    try:
+        manifest = handle_source(directory, RecordingCableHandler(), since=Manifest()).manifest
+        os.remove(os.path.join(directory, '2009', '09BERLIN1167.html'))
+        changes = DirectoryChanges(directory, manifest, lambda ref: ref.endswith('9'))
+        eq_([], list(changes))
+        eq_([], changes.deleted)
+        eq_(3, len(changes.manifest))
+    finally:
+        shutil.rmtree(directory)
+
+
+def test_save_load():
+    directory = make_directory()
+    fd, filename = tempfile.mkstemp(suffix='.manifest')
+    os.close(fd)
+    try:
+        manifest = handle_source(directory, RecordingCableHandler(), since=Manifest()).manifest
+        manifest.save(filename)
+        loaded = load_manifest(filename)
+        eq_(sorted(manifest), sorted(loaded))
+        for path in manifest:
+            eq_(manifest.get(path), loaded.get(path))
+        changes = DirectoryChanges(directory, loaded)
+        eq_([], list(changes))
+    finally:
+        os.remove(filename)
+        shutil.rmtree(directory)
+
+
+@raises(ValueError)
+def test_no_directory():
+    handle_source(CSV, RecordingCableHandler(), since=Manifest())
+
+
+if __name__ == '__main__':
+    import nose
+    nose.core.runmodule()
@@ -0,0 +1,96 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (c) 2011 - 2015 -- Lars Heuer <heuer[at]semagia.com>
+# All rights reserved.
+#
+# License: BSD, see LICENSE.txt for more details.
+#
+"""\
+Tests the `cablemap.core.models.CompactCable`.
+
+:author:       Lars Heuer (heuer[at]semagia.com)
+:organization: Semagia - <http://www.semagia.com/>
+:license:      BSD license
+"""
+from nose.tools import eq_, ok_, raises
+from cablemap.core import cable_from_row, reader
+from cablemap.core.models import Cable, CompactCable
+
+_ROW = (u'1', u'2/3/2009 14:05', u'09BERLIN1167', u'Embassy Berlin', u'confidential', u'',
+        u'VZCZCXRO1234\nPP RUEHAG\nDE RUEHRL #1167\nFM AMEMBASSY BERLIN\nTO RUEHC/SECSTATE WASHDC PRIORITY 3001\nINFO RUEHZL/EUROPEAN POLITICAL COLLECTIVE',
+        u'''E.O. 12958: DECL: 02/03/2019
+TAGS: PREL PGOV GM
+SUBJECT: MEETING WITH THE GERMAN FOREIGN MINISTER
+
+REF: A. BERLIN 1160 B. 08 BERLIN 1162
+
+Classified By: Ambassador Philip D. Murphy for reasons 1.4 (b) and (d)
+
+1. (C) Summary: Bla bla. End Summary.
+
+2. (C) Comment: Blub. End Comment.
+
+MURPHY
+''')
+
+_PROPERTIES = ('canonical_id', 'transmission_id', 'recipients', 'info_recipients',
+               'is_partial', 'subject', 'classification_categories',
+               'nondisclosure_deadline', 'references', 'tags', 'summary',
+               'comment', 'signed_by', 'classified_by', 'wl_uris')
+
+def test_same_as_cable():
+    def check(name):
+        eq_(getattr(cable, name), getattr(compact, name))
+    cable = cable_from_row(_ROW)
+    compact = cable_from_row(_ROW, CompactCable)
+    ok_(isinstance(cable, Cable))
+    ok_(isinstance(compact, CompactCable))
+    for name in _PROPERTIES:
+        yield check, name
+
+
+def test_memoized():
+    calls = []
+    parse_tags = reader.parse_tags
+    def counting_parse_tags(*args, **kw):
+        calls.append(1)
+        return parse_tags(*args, **kw)
+    reader.parse_tags = counting_parse_tags
+    try:
+        cable = cable_from_row(_ROW, CompactCable)
+        eq_([u'PREL', u'PGOV', u'GM'], cable.tags)
+        eq_([u'PREL', u'PGOV', u'GM'], cable.tags)
+    finally:
+        reader.parse_tags = parse_tags
+    eq_([1], calls)
+
+
+def test_memoized_copies():
+    cable = cable_from_row(_ROW, CompactCable)
+    tags = cable.tags
+    tags.append(u'XX')
+    del cable.references[:]
+    eq_([u'PREL', u'PGOV', u'GM'], cable.tags)
+    ok_(cable.tags is not cable.tags)
+    eq_(2, len(cable.references))
+
+
+def test_invalidation():
+    cable = cable_from_row(_ROW, CompactCable)
+    eq_(u'MEETING WITH THE GERMAN FOREIGN MINISTER', cable.subject)
+    ok_(cable.transmission_id)
+    cable.content = u'SUBJECT: SOMETHING ELSE\n\n'
+    eq_(u'SOMETHING ELSE', cable.subject)
+    cable.header = u''
+    eq_(None, cable.transmission_id)
+
+
+@raises(AttributeError)
+def test_slots():
+    cable = CompactCable(u'09BERLIN1167')
+    cable.something = u'else'
+
+
+if __name__ == '__main__':
+    import nose
+    nose.core.runmodule()
@@ -0,0 +1,65 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (c) 2011 - 2015 -- Lars Heuer <heuer[at]semagia.com>
+# All rights reserved.
+#
+# License: BSD, see LICENSE.txt for more details.
+#
+"""\
+Tests the `cablemap.core.parallel` module.
+
+:author:       Lars Heuer (heuer[at]semagia.com)
+:organization: Semagia - <http://www.semagia.com/>
+:license:      BSD license
+"""
+import pickle
+from nose.tools import eq_
+from cablemap.core import cables_from_csv, handle_source
+from cablemap.core.models import ParsedCable
+from cablemap.core.parallel import parsed_cables_from_source, properties_for_events
+from fixtures import CSV, RecordingCableHandler, WantingCableHandler
+
+
+def test_parsed_cable_pickle():
+    for cable in cables_from_csv(CSV):
+        parsed = ParsedCable.from_cable(cable)
+        eq_(parsed, pickle.loads(pickle.dumps(parsed, pickle.HIGHEST_PROTOCOL)))
+
+
+def test_parsed_cable_properties():
+    cable = next(cables_from_csv(CSV))
+    parsed = ParsedCable.from_cable(cable, ['tags'])
+    eq_(cable.tags, parsed.tags)
+    eq_(cable.canonical_id, parsed.canonical_id)
+    eq_(cable.wl_uris, parsed.wl_uris)
+    eq_(None, parsed.subject)
+    eq_(None, parsed.content)
+
+
+def test_properties_for_events():
+    eq_(None, properties_for_events(None))
+    eq_(frozenset(['tags', 'content']), properties_for_events(['handle_tag', 'handle_content', 'handle_origin']))
+
+
+def test_order_preserved():
+    expected = [ParsedCable.from_cable(cable) for cable in cables_from_csv(CSV)]
+    eq_(expected, list(parsed_cables_from_source(CSV, workers=2, chunk_size=2, max_chunks=1)))
+
+
+def test_predicate():
+    pred = lambda r: r.startswith(u'09')
+    eq_([u'09BERLIN1167', u'09BERLIN300'],
+        [c.reference_id for c in parsed_cables_from_source(CSV, pred, workers=2, chunk_size=1)])
+
+
+def test_handle_source_workers():
+    def events(handler, workers):
+        handle_source(CSV, handler, workers=workers)
+        return handler.events
+    eq_(events(RecordingCableHandler(), None), events(RecordingCableHandler(), 3))
+    eq_(events(WantingCableHandler(['handle_tag']), None), events(WantingCableHandler(['handle_tag']), 2))
+
+
+if __name__ == '__main__':
+    import nose
+    nose.core.runmodule()
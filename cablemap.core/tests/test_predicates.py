@@ -0,0 +1,127 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (c) 2011 - 2015 -- Lars Heuer <heuer[at]semagia.com>
+# All rights reserved.
+#
+# License: BSD, see LICENSE.txt for more details.
+#
+"""\
+Tests the `cablemap.core.predicates` module.
+
+:author:       Lars Heuer (heuer[at]semagia.com)
+:organization: Semagia - <http://www.semagia.com/>
+:license:      BSD license
+"""
+from nose.tools import eq_, ok_, raises
+from cablemap.core import predicates as pred
+
+_TEST_DATA = (
+    (u'09BERLIN1167', True),
+    (u'09BERLIN0123', True),
+    (u'09BERLIN1168', True),
+    (u'06HAMBURG57', True),
+    (u'09PARIS1267', False),
+    (u'09EMBASSYBERLIN1', True),
+    (u'09STATE12345', False),
+    (u'09SQCTION02OF02DUSHANBE143', False),
+)
+
+def test_origin_filter():
+    def check(cable_id, expected):
+        eq_(expected, f(cable_id))
+    f = pred.origin_filter(pred.origin_germany)
+    for cable_id, expected in _TEST_DATA:
+        yield check, cable_id, expected
+
+
+def test_year_origin_filter():
+    f = pred.year_origin_filter(lambda y: y == u'09', pred.origin_germany)
+    eq_([True, False, False], [f(u'09BERLIN1'), f(u'08BERLIN1'), f(u'09PARIS1')])
+    eq_([True, False, False], [f(u'09BERLIN2'), f(u'08BERLIN2'), f(u'09PARIS2')])
+
+
+def test_malformed_cable_ids():
+    f = pred.origin_filter(lambda o: o == u'SOFIA')
+    # 07SOIA828 is the malformed identifier of 07SOFIA828
+    eq_(True, f(u'07SOIA828'))
+    eq_(False, f(u'07SOIA829'))
+    eq_(True, f(u'07SOFIA829'))
+
+
+def test_no_filter():
+    eq_(True, pred.year_origin_filter()(u'09BERLIN1'))
+
+
+def test_origin_predicates():
+    def check(predicate, origin, expected):
+        eq_(expected, predicate(origin))
+    for predicate, origin, expected in ((pred.origin_germany, u'BERLIN', True),
+                                        (pred.origin_germany, u'PARIS', False),
+                                        (pred.origin_austria, u'UNVIEVIENNA', True),
+                                        (pred.origin_australia, u'SYDNEY', True),
+                                        (pred.origin_australia, u'BERLIN', False),
+                                        (pred.origin_barbados, u'BERLIN', False),
+                                        (pred.origin_curacao, u'CURACAO', True),
+                                        (pred.origin_curacao, u'CURACA', False),
+                                        (pred.origin_europe, u'BERLIN', True),
+                                        (pred.origin_europe, u'TOKYO', False),
+                                        (pred.origin_east_asia, u'TOKYO', True)):
+        yield check, predicate, origin, expected
+
+
+def test_origin_predicate_names():
+    eq_('origin_germany', pred.origin_germany.__name__)
+    ok_(u'Germany' in pred.origin_germany.__doc__)
+    ok_(u'* Germany' in pred.origin_europe.__doc__)
+    ok_('germany' in pred.COUNTRIES)
+    ok_('europe' in pred.REGIONS)
+
+
+def test_origin_in():
+    f = pred.origin_in(countries=['germany'], regions=['east_asia'])
+    eq_([True, True, True, False], [f(u'BERLIN'), f(u'TOKYO'), f(u'TAIPEI'), f(u'PARIS')])
+    f = pred.origin_in(countries='france')
+    eq_([True, False], [f(u'PARIS'), f(u'BERLIN')])
+    eq_(False, pred.origin_in()(u'BERLIN'))
+
+
+def test_stations_of():
+    eq_(frozenset([u'BONN', u'BERLIN', u'DUSSELDORF', u'FRANKFURT', u'HAMBURG', u'LEIPZIG', u'MUNICH']),
+        pred.stations_of(countries=['germany']))
+    ok_(pred.stations_of(countries=['germany', 'france']) <= pred.stations_of(regions=['europe']))
+    eq_(frozenset(), pred.stations_of())
+
+
+@raises(ValueError)
+def test_stations_of_unknown_country():
+    pred.stations_of(countries=['atlantis'])
+
+
+@raises(ValueError)
+def test_stations_of_unknown_region():
+    pred.stations_of(regions=['atlantis'])
+
+
+def test_filter_ids():
+    ids = [cable_id for cable_id, expected in _TEST_DATA]
+    eq_([cable_id for cable_id, expected in _TEST_DATA if expected],
+        pred.filter_ids(ids, countries=['germany']))
+    eq_([u'09BERLIN1167', u'09BERLIN0123', u'09BERLIN1168', u'09EMBASSYBERLIN1'],
+        pred.filter_ids(ids, countries=['germany'], years=[2009]))
+    eq_([u'06HAMBURG57'], pred.filter_ids(ids, regions=['europe'], years=[u'06']))
+    eq_([u'09PARIS1267'], pred.filter_ids(ids, countries=['france']))
+    eq_(ids, pred.filter_ids(iter(ids)))
+
+
+def test_filter_ids_malformed_cable_ids():
+    eq_([u'07SOIA828', u'07SOFIA829'], pred.filter_ids([u'07SOIA828', u'07SOIA829', u'07SOFIA829'], countries=['bulgaria']))
+
+
+def test_filter_ids_origin_filter():
+    ids = [cable_id for cable_id, expected in _TEST_DATA]
+    eq_(filter(pred.origin_filter(pred.origin_europe), ids), pred.filter_ids(ids, regions=['europe']))
+
+
+if __name__ == '__main__':
+    import nose
+    nose.core.runmodule()
@@ -0,0 +1,40 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (c) 2011 - 2015 -- Lars Heuer <heuer[at]semagia.com>
+# All rights reserved.
+#
+# License: BSD, see LICENSE.txt for more details.
+#
+"""\
+Tests classification category parsing.
+
+:author:       Lars Heuer (heuer[at]semagia.com)
+:organization: Semagia - <http://www.semagia.com/>
+:license:      BSD license
+"""
+from nose.tools import eq_
+from cablemap.core.reader import parse_classification_categories
+
+_TEST_DATA = (
+    (u'Classified By: Ambassador Philip D. Murphy for reasons 1.4 (b) and (d)', [u'B', u'D']),
+    (u'Classified By: Ambassador for reasons 1.4 b, d', [u'B', u'D']),
+    (u'CLASSIFIED BY: POLOFF FOR REASONS 1.5 (B), (D) AND (B)', [u'B', u'D']),
+    (u'Classified By: DCM for reasons 1 . 4 (C)', [u'C']),
+    (u'Classified By: A. for reason 1.4(d)\n\n1. (C) Bla', [u'D']),
+    # No categories
+    (u'Classified By: Ambassador Philip D. Murphy, reason: none', []),
+    (u'1. (U) Bla bla.', []),
+    (u'', []),
+)
+
+
+def test_parse_classification_categories():
+    def check(content, expected):
+        eq_(expected, parse_classification_categories(content))
+    for content, expected in _TEST_DATA:
+        yield check, content, expected
+
+
+if __name__ == '__main__':
+    import nose
+    nose.core.runmodule()
@@ -0,0 +1,38 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (c) 2011 - 2015 -- Lars Heuer <heuer[at]semagia.com>
+# All rights reserved.
+#
+# License: BSD, see LICENSE.txt for more details.
+#
+"""\
+Tests comment parsing.
+
+:author:       Lars Heuer (heuer[at]semagia.com)
+:organization: Semagia - <http://www.semagia.com/>
+:license:      BSD license
+"""
+from nose.tools import eq_
+from cablemap.core.reader import parse_comment
+
+_TEST_DATA = (
+    (u'2. (C) Comment: Blub. End Comment.', u'Blub.'),
+    (u'1. Bla.\n\n2. (C) COMMENT: The minister\n  was  late.  END COMMENT.\n\nMURPHY', u'The minister was late.'),
+    (u'1. Bla.\n\n2. (C) Comment: The minister was late.\n\n3. Bla bla.', u'The minister was late.'),
+    (u'1. Bla.\n(C) COMMENT - The minister was late.', u'The minister was late.'),
+    # No comment section
+    (u'1. (C) Summary: Bla bla. End Summary.\n\nMURPHY', None),
+    (u'', None),
+)
+
+
+def test_parse_comment():
+    def check(content, expected):
+        eq_(expected, parse_comment(content))
+    for content, expected in _TEST_DATA:
+        yield check, content, expected
+
+
+if __name__ == '__main__':
+    import nose
+    nose.core.runmodule()
@@ -0,0 +1,67 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (c) 2011 - 2015 -- Lars Heuer <heuer[at]semagia.com>
+# All rights reserved.
+#
+# License: BSD, see LICENSE.txt for more details.
+#
+"""\
+Tests `cablemap.core.reader.KeywordMatcher`.
+
+:author:       Lars Heuer (heuer[at]semagia.com)
+:organization: Semagia - <http://www.semagia.com/>
+:license:      BSD license
+"""
+from nose.tools import eq_, ok_, raises
+from cablemap.core.reader import KeywordMatcher, _NON_REFERENCE_MATCHER
+
+_KEYWORDS = ('he', 'she', 'his', 'hers')
+
+
+def _naive_findall(keywords, text):
+    return sorted((i + len(k), k) for k in keywords for i in range(len(text)) if text.startswith(k, i))
+
+
+def test_findall():
+    def check(text):
+        eq_(sorted(k for e, k in _naive_findall(_KEYWORDS, text)), sorted(matcher.findall(text)))
+    matcher = KeywordMatcher(_KEYWORDS)
+    for text in ('ushers', 'his', 'hishers', 'sheshe', '', 'xyz', 'hhhe'):
+        yield check, text
+
+
+def test_search():
+    def check(expected, text):
+        eq_(expected, matcher.search(text))
+    matcher = KeywordMatcher(_KEYWORDS)
+    for expected, text in (('she', 'ushers'), ('his', 'this'), (None, 'xyz'), (None, ''), ('he', 'hhhe')):
+        yield check, expected, text
+
+
+def test_contains():
+    matcher = KeywordMatcher(_KEYWORDS)
+    ok_('ushers' in matcher)
+    ok_('hx' not in matcher)
+
+
+def test_keywords():
+    eq_(('a', 'b'), KeywordMatcher(['b', 'a', 'b']).keywords)
+
+
+@raises(ValueError)
+def test_empty_keyword():
+    KeywordMatcher(['a', ''])
+
+
+def test_non_references():
+    def check(expected, reference):
+        eq_(expected, reference in _NON_REFERENCE_MATCHER)
+    for reference in (u'09SECRETSTATE1', u'09PARAGRAPH12', u'08CONFIDENTIAL2', u'09ONJULY1', u'08ZJAN12', u'08A--B12'):
+        yield check, True, reference
+    for reference in (u'09BERLIN1167', u'09STATE12', u'08PARIS1'):
+        yield check, False, reference
+
+
+if __name__ == '__main__':
+    import nose
+    nose.core.runmodule()
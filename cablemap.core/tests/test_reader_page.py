@@ -0,0 +1,87 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (c) 2011 - 2015 -- Lars Heuer <heuer[at]semagia.com>
+# All rights reserved.
+#
+# License: BSD, see LICENSE.txt for more details.
+#
+"""\
+Tests `cablemap.core.reader.parse_page`.
+
+:author:       Lars Heuer (heuer[at]semagia.com)
+:organization: Semagia - <http://www.semagia.com/>
+:license:      BSD license
+"""
+import os
+import codecs
+from nose.tools import eq_, raises
+from cablemap.core import cable_from_html
+from cablemap.core.models import Cable
+from cablemap.core.reader import parse_page, parse_meta, _clean_html
+from fixtures import HTML
+
+_DATA_DIR = os.path.join(os.path.dirname(__file__), 'data-subject', 'in')
+
+
+def _page(reference_id):
+    return codecs.open(os.path.join(_DATA_DIR, reference_id + '.html'), 'rb', 'utf-8').read()
+
+
+def test_meta():
+    def check(reference_id, created, released, classification, origin, media_uris):
+        eq_((reference_id, created, released, classification, origin, media_uris), parse_page(_page(reference_id))[:6])
+    for data in ((u'07BERN881', u'2007-09-11 09:09', u'2011-03-14 06:06', u'SECRET', u'Embassy Bern', [u'http://www.letemps.ch/swiss_papers']),
+                 (u'08BRASILIA93', u'2008-01-15 18:06', u'2011-02-13 00:12', u'CONFIDENTIAL', u'Embassy Brasilia', ()),
+                 (u'10STATE284', u'2010-01-04 18:06', u'2011-01-31 21:09', u'CONFIDENTIAL', u'Secretary of State', ())):
+        yield (check,) + data
+
+
+def test_meta_without_release_date():
+    ref, created, released, classification, origin, media_uris, header, content = \
+        parse_page(HTML % dict(ref=u'09BERLIN1167', year=2009, subject=u'MEETING'))
+    eq_((u'09BERLIN1167', u'2009-02-03 14:05', None, u'CONFIDENTIAL', u'Embassy Berlin', ()),
+        (ref, created, released, classification, origin, media_uris))
+    eq_(u'VZCZCXRO1234', header.split(u'\n')[0])
+    eq_(u'MURPHY', content.split(u'\n')[-1])
+
+
+def test_parse_meta():
+    cable = parse_meta(_page(u'07BERN881'), Cable(u'07BERN881'))
+    eq_(u'2007-09-11 09:09', cable.created)
+    eq_(u'2011-03-14 06:06', cable.released)
+    eq_([u'http://www.letemps.ch/swiss_papers'], cable.media_uris)
+
+
+def test_cable_from_html():
+    cable = cable_from_html(_page(u'08TRIPOLI220'))
+    eq_(u'08TRIPOLI220', cable.reference_id)
+    eq_(u'2008-03-13 15:03', cable.created)
+    eq_(u'2011-01-31 21:09', cable.released)
+
+
+@raises(ValueError)
+def test_reference_id_mismatch():
+    cable_from_html(_page(u'08TRIPOLI220'), u'08TRIPOLI221')
+
+
+@raises(ValueError)
+def test_no_table():
+    parse_page(u'<html><code><pre>CONTENT</pre></code></html>')
+
+
+def test_clean_html():
+    def check(expected, html):
+        eq_(expected, _clean_html(html))
+    for expected, html in ((u'a\nb', u'a&#x000A;b'),
+                           (u'1. Text', u'<a href="#par1">¶</a>1. Text'),
+                           (u'line\nnext', u'line\\&#x000A;next'),
+                           (u'line\nnext', u'line\\ <b></b>\nnext'),
+                           (u'line\n', u'line\\  '),
+                           (u'a\\b', u'a\\b'),
+                           (u'bold', u'<b>bold</B>')):
+        yield check, expected, html
+
+
+if __name__ == '__main__':
+    import nose
+    nose.core.runmodule()
@@ -0,0 +1,76 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (c) 2011 - 2015 -- Lars Heuer <heuer[at]semagia.com>
+# All rights reserved.
+#
+# License: BSD, see LICENSE.txt for more details.
+#
+"""\
+Tests the header segmentation used by the reader.
+
+:author:       Lars Heuer (heuer[at]semagia.com)
+:organization: Semagia - <http://www.semagia.com/>
+:license:      BSD license
+"""
+from nose.tools import eq_, ok_
+from cablemap.core import reader
+from cablemap.core.reader import SubjectSegment, parse_subject, parse_tags
+from cablemap.core.models import CompactCable
+
+_CONTENT = u'''E.O. 12958: DECL: 02/03/2019
+TAGS: PREL PGOV GM
+SUBJECT: MEETING WITH THE GERMAN FOREIGN MINISTER
+
+REF: A. BERLIN 1167 B. 08 BERLIN 1162
+
+Classified By: Ambassador Philip D. Murphy for reasons 1.4 (b) and (d)
+
+1. (C) Summary: Bla bla. End Summary.
+'''
+
+def test_segment_offsets():
+    segment = SubjectSegment(_CONTENT)
+    eq_(_CONTENT.index(u'SUBJECT'), segment.subject_match.start())
+    eq_(_CONTENT.index(u'1. (C)'), segment.subject_max_idx)
+    eq_(_CONTENT.index(u'SUBJECT'), segment.tags_max_idx)
+
+
+def test_segment_no_subject():
+    content = u'TAGS: PREL PGOV GM\n\n1. (C) Bla bla.'
+    segment = SubjectSegment(content)
+    eq_(None, segment.subject_match)
+    eq_(content.index(u'1. (C)'), segment.tags_max_idx)
+
+
+def test_parsers_share_segment():
+    segment = SubjectSegment(_CONTENT)
+    eq_(parse_subject(_CONTENT), parse_subject(_CONTENT, segment=segment))
+    eq_(parse_tags(_CONTENT), parse_tags(_CONTENT, segment=segment))
+    eq_(u'MEETING WITH THE GERMAN FOREIGN MINISTER', parse_subject(_CONTENT, segment=segment))
+    eq_([u'PREL', u'PGOV', u'GM'], parse_tags(_CONTENT, segment=segment))
+
+
+def test_cable_owns_segment():
+    created = []
+    def segment(content):
+        created.append(content)
+        return SubjectSegment(content)
+    orig_segment = reader.SubjectSegment
+    reader.SubjectSegment = segment
+    try:
+        cable = CompactCable(u'09BERLIN1167')
+        cable.content = _CONTENT
+        eq_(u'MEETING WITH THE GERMAN FOREIGN MINISTER', cable.subject)
+        eq_([u'PREL', u'PGOV', u'GM'], cable.tags)
+        eq_(1, len(created))
+        # Reassigning the content discards the segment
+        cable.content = _CONTENT.replace(u'GERMAN', u'FRENCH')
+        eq_(u'MEETING WITH THE FRENCH FOREIGN MINISTER', cable.subject)
+        eq_(2, len(created))
+    finally:
+        reader.SubjectSegment = orig_segment
+
+
+if __name__ == '__main__':
+    import nose
+    nose.core.runmodule()
@@ -0,0 +1,145 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (c) 2011 - 2015 -- Lars Heuer <heuer[at]semagia.com>
+# All rights reserved.
+#
+# License: BSD, see LICENSE.txt for more details.
+#
+"""\
+Tests the `cablemap.core.store` module.
+
+:author:       Lars Heuer (heuer[at]semagia.com)
+:organization: Semagia - <http://www.semagia.com/>
+:license:      BSD license
+"""
+import os
+import tempfile
+from nose.tools import eq_, ok_, raises
+from cablemap.core import cables_from_source
+from cablemap.core.handler import handle_cables
+from cablemap.core.models import ParsedCable, PARSED_CABLE_FIELDS
+from cablemap.core.store import write_store, cables_from_store, CableStore
+from fixtures import CSV, RecordingCableHandler
+
+
+def _store_filename():
+    fd, filename = tempfile.mkstemp(suffix='.store')
+    os.close(fd)
+    return filename
+
+
+def test_roundtrip():
+    def check(expected, cable):
+        for name in PARSED_CABLE_FIELDS:
+            val = getattr(expected, name)
+            eq_(val, getattr(cable, name), name)
+            eq_(type(val), type(getattr(cable, name)), name)
+        for exp_rec, rec in zip(expected.recipients + expected.info_recipients,
+                                cable.recipients + cable.info_recipients):
+            eq_(type(exp_rec[4]), type(rec[4]))
+        eq_(expected, cable)
+    filename = _store_filename()
+    try:
+        expected = [ParsedCable.from_cable(cable) for cable in cables_from_source(CSV)]
+        eq_(len(expected), write_store(filename, cables_from_source(CSV)))
+        stored = [cable.to_parsed_cable() for cable in cables_from_store(filename)]
+        eq_(len(expected), len(stored))
+        for exp, cable in zip(expected, stored):
+            yield check, exp, cable
+    finally:
+        os.remove(filename)
+
+
+def test_read_after_iteration():
+    filename = _store_filename()
+    try:
+        write_store(filename, cables_from_source(CSV))
+        expected = [ParsedCable.from_cable(cable) for cable in cables_from_source(CSV)]
+        cables = list(cables_from_store(filename))
+        eq_(expected[0].subject, cables[0].subject)
+        eq_(expected, [cable.to_parsed_cable() for cable in cables])
+    finally:
+        os.remove(filename)
+
+
+def test_context_manager():
+    filename = _store_filename()
+    try:
+        write_store(filename, cables_from_source(CSV))
+        with CableStore(filename) as store:
+            eq_([u'PREL', u'PGOV', u'GM'], store.cable(u'09BERLIN1167').tags)
+        eq_(None, store._mm)
+    finally:
+        os.remove(filename)
+
+
+def test_handler_events():
+    filename = _store_filename()
+    try:
+        write_store(filename, cables_from_source(CSV))
+        expected = RecordingCableHandler()
+        handle_cables(cables_from_source(CSV), expected)
+        handler = RecordingCableHandler()
+        handle_cables(cables_from_store(filename), handler)
+        eq_(expected.events, handler.events)
+    finally:
+        os.remove(filename)
+
+
+def test_predicate():
+    filename = _store_filename()
+    try:
+        write_store(filename, cables_from_source(CSV))
+        eq_([u'09BERLIN1167', u'09BERLIN300'],
+            [cable.reference_id for cable in cables_from_store(filename, lambda ref: 'BERLIN' in ref)])
+    finally:
+        os.remove(filename)
+
+
+def test_random_access():
+    filename = _store_filename()
+    try:
+        write_store(filename, cables_from_source(CSV))
+        store = CableStore(filename)
+        eq_(5, len(store))
+        ok_(u'09BERLIN1167' in store)
+        ok_(u'09BERLIN1' not in store)
+        eq_([u'PREL', u'PGOV', u'GM'], store.cable(u'09BERLIN1167').tags)
+        eq_(store[-1].reference_id, store[4].reference_id)
+        eq_(None, store.cable(u'09BERLIN1'))
+        store.close()
+    finally:
+        os.remove(filename)
+
+
+def test_partial_snapshot():
+    filename = _store_filename()
+    try:
+        cables = [ParsedCable.from_cable(cable, ()) for cable in cables_from_source(CSV)]
+        write_store(filename, cables)
+        cable = CableStore(filename)[0]
+        eq_(cables[0].reference_id, cable.reference_id)
+        eq_(None, cable.subject)
+        eq_(None, cable.is_partial)
+        eq_([], cable.tags)
+    finally:
+        os.remove(filename)
+
+
+def test_empty_store():
+    filename = _store_filename()
+    try:
+        eq_(0, write_store(filename, []))
+        eq_([], list(cables_from_store(filename)))
+    finally:
+        os.remove(filename)
+
+
+@raises(ValueError)
+def test_no_store():
+    CableStore(CSV)
+
+
+if __name__ == '__main__':
+    import nose
+    nose.core.runmodule()
@@ -0,0 +1,161 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (c) 2011 - 2015 -- Lars Heuer <heuer[at]semagia.com>
+# All rights reserved.
+#
+# License: BSD, see LICENSE.txt for more details.
+#
+"""\
+Tests reading cables from compressed CSV files and from archives.
+
+:author:       Lars Heuer (heuer[at]semagia.com)
+:organization: Semagia - <http://www.semagia.com/>
+:license:      BSD license
+"""
+import os
+import bz2
+import gzip
+import shutil
+import tarfile
+import zipfile
+import tempfile
+from nose.tools import eq_, ok_
+from cablemap.core import cables_from_source, handle_source
+from cablemap.core.models import ParsedCable
+from cablemap.core.utils import cables_from_csv, cables_from_directory, pages_from_archive, is_archive
+from fixtures import CSV, RecordingCableHandler, make_directory
+
+
+def _snapshots(cables):
+    return [ParsedCable.from_cable(cable) for cable in cables]
+
+
+def _compressed_csv(suffix, opener):
+    directory = tempfile.mkdtemp()
+    filename = os.path.join(directory, 'cables.csv' + suffix)
+    f = opener(filename, 'wb')
+    try:
+        f.write(open(CSV, 'rb').read())
+    finally:
+        f.close()
+    return directory, filename
+
+
+def test_compressed_csv():
+    def check(suffix, opener):
+        directory, filename = _compressed_csv(suffix, opener)
+        try:
+            eq_(expected, _snapshots(cables_from_csv(filename)))
+            eq_(expected, _snapshots(cables_from_source(filename)))
+        finally:
+            shutil.rmtree(directory)
+    expected = _snapshots(cables_from_csv(CSV))
+    ok_(expected)
+    for suffix, opener in (('.gz', gzip.open), ('.bz2', bz2.BZ2File)):
+        yield check, suffix, opener
+
+
+def test_compressed_csv_predicate():
+    directory, filename = _compressed_csv('.gz', gzip.open)
+    try:
+        pred = lambda r: r.startswith('09')
+        eq_(_snapshots(cables_from_csv(CSV, pred)), _snapshots(cables_from_csv(filename, pred)))
+    finally:
+        shutil.rmtree(directory)
+
+
+def test_compressed_csv_stop_early():
+    directory, filename = _compressed_csv('.gz', gzip.open)
+    try:
+        cables = cables_from_csv(filename)
+        eq_(1, len([cables.next()]))
+        cables.close()
+    finally:
+        shutil.rmtree(directory)
+
+
+def test_is_archive():
+    def check(expected, filename):
+        eq_(expected, is_archive(filename))
+    for filename in ('cable.zip', 'cable.tar', 'cable.tar.gz', 'cable.TGZ', 'cable.tar.bz2', 'cable.tar.xz'):
+        yield check, True, filename
+    for filename in ('cables.csv', 'cables.csv.gz', 'cables.csv.xz', 'cable'):
+        yield check, False, filename
+
+
+def _archives(source):
+    """\
+    Writes the cable files of the `source` directory into archives and
+    returns the directory of the archives.
+    """
+    directory = tempfile.mkdtemp()
+    paths = []
+    for root, dirs, files in os.walk(source):
+        for name in files:
+            filename = os.path.join(root, name)
+            paths.append((filename, os.path.relpath(filename, source)))
+    paths.sort()
+    for ext, mode in (('.tar', 'w'), ('.tar.gz', 'w:gz'), ('.tgz', 'w:gz'), ('.tar.bz2', 'w:bz2')):
+        tf = tarfile.open(os.path.join(directory, 'cable' + ext), mode)
+        for filename, path in paths:
+            tf.add(filename, path)
+        tf.close()
+    zf = zipfile.ZipFile(os.path.join(directory, 'cable.zip'), 'w', zipfile.ZIP_DEFLATED)
+    for filename, path in paths:
+        zf.write(filename, path)
+    zf.close()
+    return directory
+
+
+def test_archives():
+    def check(filename):
+        eq_(expected, sorted(_snapshots(cables_from_directory(filename))))
+        eq_(expected, sorted(_snapshots(cables_from_source(filename))))
+    source = make_directory()
+    directory = _archives(source)
+    try:
+        expected = sorted(_snapshots(cables_from_directory(source)))
+        eq_(3, len(expected))
+        for name in sorted(os.listdir(directory)):
+            yield check, os.path.join(directory, name)
+    finally:
+        shutil.rmtree(source)
+        shutil.rmtree(directory)
+
+
+def test_archive_predicate():
+    def check(filename):
+        seen = []
+        def pred(name):
+            seen.append(name)
+            return name != u'09BERLIN1168'
+        eq_([u'09BERLIN1167', u'09BERLIN1169'], [reference_id for reference_id, html in pages_from_archive(filename, pred)])
+        eq_([u'09BERLIN1167', u'09BERLIN1168', u'09BERLIN1169'], seen)
+    source = make_directory()
+    directory = _archives(source)
+    try:
+        for name in sorted(os.listdir(directory)):
+            yield check, os.path.join(directory, name)
+    finally:
+        shutil.rmtree(source)
+        shutil.rmtree(directory)
+
+
+def test_handle_source_archive():
+    source = make_directory()
+    directory = _archives(source)
+    try:
+        expected = RecordingCableHandler()
+        handle_source(os.path.join(directory, 'cable.tar.gz'), expected)
+        eq_(3, len([name for name, args in expected.events if name == 'start_cable']))
+        handler = RecordingCableHandler()
+        handle_source(os.path.join(directory, 'cable.tar.gz'), handler, workers=2)
+        eq_(expected.events, handler.events)
+    finally:
+        shutil.rmtree(source)
+        shutil.rmtree(directory)
+
+
+if __name__ == '__main__':
+    import nose
+    nose.core.runmodule()
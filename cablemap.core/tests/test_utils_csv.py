@@ -0,0 +1,72 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (c) 2011 - 2015 -- Lars Heuer <heuer[at]semagia.com>
+# All rights reserved.
+#
+# License: BSD, see LICENSE.txt for more details.
+#
+"""\
+Tests reading cables from CSV files.
+
+:author:       Lars Heuer (heuer[at]semagia.com)
+:organization: Semagia - <http://www.semagia.com/>
+:license:      BSD license
+"""
+import os
+import codecs
+import tempfile
+from nose.tools import eq_, ok_
+from cablemap.core import cables_from_csv
+from cablemap.core.utils import rows_from_csv, _UnicodeReader
+from fixtures import CSV
+
+
+def recoded_rows(filename, encoding='utf-8'):
+    with open(filename, 'rb') as f:
+        return [tuple(row) for row in _UnicodeReader(f, encoding=encoding, delimiter=',', quotechar='"', escapechar='\\')]
+
+
+def test_rows():
+    rows = list(rows_from_csv(CSV))
+    eq_(5, len(rows))
+    eq_(recoded_rows(CSV), rows)
+    ok_(all(isinstance(col, unicode) for row in rows for col in row))
+    ok_(u'M\xfcnchen' in rows[-1][-1])
+
+
+def test_rows_latin1():
+    fd, filename = tempfile.mkstemp(suffix='.csv')
+    os.close(fd)
+    try:
+        codecs.open(filename, 'wb', 'latin-1').write(codecs.open(CSV, 'rb', 'utf-8').read())
+        eq_(list(rows_from_csv(CSV)), list(rows_from_csv(filename, encoding='latin-1')))
+    finally:
+        os.remove(filename)
+
+
+def test_predicate():
+    eq_([u'09BERLIN1167', u'09BERLIN300'],
+        [cable.reference_id for cable in cables_from_csv(CSV, lambda r: r.startswith(u'09'))])
+
+
+def test_predicate_before_decoding():
+    fd, filename = tempfile.mkstemp(suffix='.csv')
+    os.close(fd)
+    try:
+        # The 2nd row contains invalid UTF-8 and must not be decoded
+        with open(filename, 'wb') as f:
+            f.write('"1","2/3/2009 14:05","09BERLIN1","Embassy Berlin","UNCLASSIFIED","","","TAGS: PREL"\n')
+            f.write('"2","2/3/2009 14:05","09PARIS1","Embassy Paris","UNCLASSIFIED","","\xff","\xfe"\n')
+        seen = []
+        def pred(reference_id):
+            seen.append(reference_id)
+            return u'BERLIN' in reference_id
+        eq_([u'09BERLIN1'], [row[2] for row in rows_from_csv(filename, pred)])
+        eq_([u'09BERLIN1', u'09PARIS1'], seen)
+    finally:
+        os.remove(filename)
+
+
+if __name__ == '__main__':
+    import nose
+    nose.core.runmodule()
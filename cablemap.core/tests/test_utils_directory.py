@@ -0,0 +1,81 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (c) 2011 - 2015 -- Lars Heuer <heuer[at]semagia.com>
+# All rights reserved.
+#
+# License: BSD, see LICENSE.txt for more details.
+#
+"""\
+Tests reading cables from directories.
+
+:author:       Lars Heuer (heuer[at]semagia.com)
+:organization: Semagia - <http://www.semagia.com/>
+:license:      BSD license
+"""
+import os
+import shutil
+import tempfile
+from nose.tools import eq_
+from cablemap.core import cable_from_file
+from cablemap.core.models import ParsedCable
+from cablemap.core.reader import get_header_and_content_as_text, get_header_as_text, get_content_as_text
+from cablemap.core.utils import cables_from_directory, cablefiles_from_directory, pages_from_directory
+from fixtures import write_cable
+
+_REFERENCE_IDS = (u'09BERLIN1169', u'09BERLIN1167', u'10BERLIN22', u'09BERLIN1168', u'10BERLIN11')
+
+
+def _make_directory():
+    directory = tempfile.mkdtemp()
+    for year in ('2010', '2009'):
+        os.mkdir(os.path.join(directory, year))
+    for reference_id in _REFERENCE_IDS:
+        write_cable(os.path.join(directory, '20' + reference_id[:2]), reference_id)
+    write_cable(directory, u'08BERLIN1')
+    return directory
+
+
+def test_order():
+    directory = _make_directory()
+    try:
+        eq_([u'08BERLIN1', u'09BERLIN1167', u'09BERLIN1168', u'09BERLIN1169', u'10BERLIN11', u'10BERLIN22'],
+            [os.path.basename(fn)[:-5] for fn in cablefiles_from_directory(directory)])
+    finally:
+        shutil.rmtree(directory)
+
+
+def test_predicate():
+    directory = _make_directory()
+    try:
+        eq_([u'10BERLIN11', u'10BERLIN22'],
+            [reference_id for reference_id, html in pages_from_directory(directory, lambda n: n.startswith('10'))])
+    finally:
+        shutil.rmtree(directory)
+
+
+def test_threads():
+    def check(threads):
+        eq_(expected, [ParsedCable.from_cable(cable) for cable in cables_from_directory(directory, threads=threads)])
+    directory = _make_directory()
+    try:
+        expected = [ParsedCable.from_cable(cable_from_file(fn)) for fn in cablefiles_from_directory(directory)]
+        eq_(6, len(expected))
+        for threads in (None, 1, 2, 8):
+            yield check, threads
+    finally:
+        shutil.rmtree(directory)
+
+
+def test_header_and_content():
+    directory = _make_directory()
+    try:
+        for reference_id, html in pages_from_directory(directory):
+            eq_((get_header_as_text(html, reference_id), get_content_as_text(html, reference_id)),
+                get_header_and_content_as_text(html, reference_id))
+    finally:
+        shutil.rmtree(directory)
+
+
+if __name__ == '__main__':
+    import nose
+    nose.core.runmodule()
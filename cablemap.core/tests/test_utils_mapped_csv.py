@@ -0,0 +1,102 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (c) 2011 - 2015 -- Lars Heuer <heuer[at]semagia.com>
+# All rights reserved.
+#
+# License: BSD, see LICENSE.txt for more details.
+#
+"""\
+Tests `cablemap.core.utils.mapped_cables_from_csv`.
+
+:author:       Lars Heuer (heuer[at]semagia.com)
+:organization: Semagia - <http://www.semagia.com/>
+:license:      BSD license
+"""
+import os
+import tempfile
+from nose.tools import eq_, ok_
+from cablemap.core.models import ParsedCable
+from cablemap.core.handler import handle_cables
+from cablemap.core.utils import cables_from_csv, mapped_cables_from_csv
+from fixtures import CSV, RecordingCableHandler
+
+
+def _write_csv(data):
+    fd, filename = tempfile.mkstemp(suffix='.csv')
+    os.close(fd)
+    with open(filename, 'wb') as f:
+        f.write(data)
+    return filename
+
+
+def test_cables():
+    def check(expected, cable):
+        eq_(expected, ParsedCable.from_cable(cable))
+    expected = [ParsedCable.from_cable(cable) for cable in cables_from_csv(CSV)]
+    cables = list(mapped_cables_from_csv(CSV))
+    eq_(len(expected), len(cables))
+    for exp, cable in zip(expected, cables):
+        yield check, exp, cable
+
+
+def test_handler_events():
+    expected = RecordingCableHandler()
+    handle_cables(cables_from_csv(CSV), expected)
+    handler = RecordingCableHandler()
+    handle_cables(mapped_cables_from_csv(CSV), handler)
+    eq_(expected.events, handler.events)
+
+
+def test_lazy_texts():
+    cables = mapped_cables_from_csv(CSV)
+    cable = next(cables)
+    eq_(None, cable._header)
+    eq_(None, cable._content)
+    ok_(u'Back\\slash' in cable.content)
+    ok_(u'said "yes"' in cable.content)
+    eq_(None, cable._header)
+    eq_(u'MEETING WITH THE GERMAN FOREIGN MINISTER', cable.subject)
+    next(cables)
+    # Released
+    eq_(None, cable._content)
+    # .. but available on demand
+    ok_(cable.content.startswith(u'C O N F I D E N T I A L'))
+
+
+def test_predicate():
+    eq_([u'09BERLIN1167', u'09BERLIN300'],
+        [cable.reference_id for cable in mapped_cables_from_csv(CSV, lambda ref: 'BERLIN' in ref)])
+
+
+def test_reassign():
+    cable = next(mapped_cables_from_csv(CSV))
+    eq_([u'PREL', u'PGOV', u'GM'], cable.tags)
+    cable.content = u'TAGS: ECON\n'
+    cable.release()
+    eq_(u'TAGS: ECON\n', cable.content)
+    eq_([u'ECON'], cable.tags)
+
+
+def test_crlf_and_unquoted():
+    filename = _write_csv('"1","2/3/2009 14:05","09BERLIN1167","Embassy Berlin","CONFIDENTIAL","","HEAD\r\nER","TAGS: PREL GM\r\n"\r\n'
+                          '2,2/4/2009 14:05,09BERLIN1168,Embassy Berlin,SECRET,,,"TAGS: PREL \\"GM\\""\r\n')
+    try:
+        cables = [(c.reference_id, c.created, c.classification, c.header, c.content) for c in mapped_cables_from_csv(filename)]
+        expected = [(c.reference_id, c.created, c.classification, c.header, c.content) for c in cables_from_csv(filename)]
+        eq_(expected, cables)
+        eq_(2, len(cables))
+    finally:
+        os.remove(filename)
+
+
+def test_empty_file():
+    filename = _write_csv('')
+    try:
+        eq_([], list(mapped_cables_from_csv(filename)))
+    finally:
+        os.remove(filename)
+
+
+if __name__ == '__main__':
+    import nose
+    nose.core.runmodule()
@@ -0,0 +1,67 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (c) 2011 - 2015 -- Lars Heuer <heuer[at]semagia.com>
+# All rights reserved.
+#
+# License: BSD, see LICENSE.txt for more details.
+#
+"""\
+Tests the validation of reference identifiers.
+
+:author:       Lars Heuer (heuer[at]semagia.com)
+:organization: Semagia - <http://www.semagia.com/>
+:license:      BSD license
+"""
+from nose.tools import eq_, raises
+from cablemap.core.consts import REFERENCE_ID_PATTERN, STATIONS
+from cablemap.core.utils import reference_id_parts, validate_reference_ids
+
+_VALID = (
+    (u'09BERLIN1167', (u'09', u'BERLIN', u'1167')),
+    (u'10USUNNEWYORK1', (u'10', u'USUNNEWYORK', u'1')),
+    (u'07BANDARSERIBEGAWAN1234567', (u'07', u'BANDARSERIBEGAWAN', u'1234567')),
+    (u'06PARISFR12', (u'06', u'PARISFR', u'12')),
+    (u'06UNESCOPARISFR12', (u'06', u'UNESCOPARISFR', u'12')),
+)
+
+_INVALID = (u'09BERLINX1167', u'9BERLIN1167', u'09BERLIN', u'09BERLIN12345678',
+            u'09berlin1167', u'BERLIN1167', u'09STATEBERLIN1', u'09BERLIN1167A', u'')
+
+
+def test_valid():
+    def check(reference_id, parts):
+        eq_(parts, reference_id_parts(reference_id))
+        eq_(parts, REFERENCE_ID_PATTERN.match(reference_id).groups())
+    for reference_id, parts in _VALID:
+        yield check, reference_id, parts
+
+
+def test_invalid():
+    def check(reference_id):
+        eq_(None, REFERENCE_ID_PATTERN.match(reference_id))
+    for reference_id in _INVALID:
+        yield check, reference_id
+
+
+@raises(ValueError)
+def test_illegal_parts():
+    reference_id_parts(u'09BERLINX1167')
+
+
+def test_stations():
+    def check(station):
+        eq_((u'09', station, u'1'), REFERENCE_ID_PATTERN.match(u'09%s1' % station).groups())
+    for station in sorted(STATIONS):
+        yield check, station
+
+
+def test_validate_reference_ids():
+    ids = [reference_id for reference_id, parts in _VALID] + list(_INVALID)
+    eq_([True] * len(_VALID) + [False] * len(_INVALID), validate_reference_ids(ids))
+    eq_([True, False, True], validate_reference_ids(iter([u'09BERLIN1', u'09BERLINX1', u'09BERLIN1'])))
+    eq_([], validate_reference_ids([]))
+
+
+if __name__ == '__main__':
+    import nose
+    nose.core.runmodule()
@@ -13,7 +13,7 @@ Tests cablemap.core.utils.tag_kind
 :license:      BSD license
 """
 from nose.tools import eq_
-from cablemap.core.utils import tag_kind
+from cablemap.core.utils import tag_kind, tag_kinds, tag_kind_counts, TagClassifier
 from cablemap.core import consts
 
 _TEST_DATA = (
@@ -39,6 +39,33 @@ def test_tag_kind_default():
     eq_(consts.TAG_KIND_UNKNOWN, tag_kind('THIS IS UNKNOWN'))
     eq_(consts.TAG_KIND_SUBJECT, tag_kind('THIS IS UNKNOWN', consts.TAG_KIND_SUBJECT))
 
+def test_tag_kinds():
+    tags = [tag for tag, kind in _TEST_DATA]
+    eq_([kind for tag, kind in _TEST_DATA], tag_kinds(tags))
+    eq_([tag_kind(tag, -1) for tag in tags], tag_kinds(iter(tags), -1))
+    eq_([], tag_kinds([]))
+
+def test_tag_kind_counts():
+    before = tag_kind_counts()
+    tag_kinds([u'GE', u'FR', u'PHUM', u'UNKNOWN'])
+    tag_kind(u'NASA')
+    after = tag_kind_counts()
+    eq_(2, after[consts.TAG_KIND_GEO] - before[consts.TAG_KIND_GEO])
+    eq_(1, after[consts.TAG_KIND_SUBJECT] - before[consts.TAG_KIND_SUBJECT])
+    eq_(1, after[consts.TAG_KIND_ORG] - before[consts.TAG_KIND_ORG])
+    eq_(1, after[consts.TAG_KIND_UNKNOWN] - before[consts.TAG_KIND_UNKNOWN])
+
+def test_tag_classifier():
+    classifier = TagClassifier(subject_tags=[u'prel'], org_tags=[u'NATO'])
+    eq_([consts.TAG_KIND_SUBJECT, consts.TAG_KIND_ORG, consts.TAG_KIND_UNKNOWN, consts.TAG_KIND_GEO],
+        classifier.kinds([u'PREL', u'nato', u'PHUM', u'GE']))
+    eq_(consts.TAG_KIND_PROGRAM, classifier.kind(u'KIPR'))
+    eq_(-1, classifier.kind(u'PHUM', -1))
+    eq_({consts.TAG_KIND_UNKNOWN: 2, consts.TAG_KIND_SUBJECT: 1, consts.TAG_KIND_PERSON: 0,
+         consts.TAG_KIND_PROGRAM: 1, consts.TAG_KIND_GEO: 1, consts.TAG_KIND_ORG: 1}, classifier.counts)
+    classifier.reset_counts()
+    eq_([0], list(set(classifier.counts.values())))
+
 if __name__ == '__main__':
     import nose
     nose.core.runmodule()
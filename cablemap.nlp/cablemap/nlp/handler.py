@@ -35,7 +35,8 @@
 Event handler to create a cable corpus.
 """
 from __future__ import absolute_import
-from cablemap.core.handler import NoopCableHandler, DelegatingCableHandler
+from cablemap.core.handler import NoopCableHandler, DelegatingCableHandler, \
+     wanted_events, CABLE_EVENTS
 from .corpus import WordCorpus, CableCorpus
 
 class NLPFilter(DelegatingCableHandler):
@@ -69,10 +70,23 @@ class NLPFilter(DelegatingCableHandler):
         self.want_tags = want_tags
         self.want_content = want_content
         self.want_summary = want_summary
-        self.want_commet = want_comment
+        self.want_comment = want_comment
         self.want_header = want_header
         self.want_subject = want_subject
 
+    @property
+    def wanted_events(self):
+        wanted = wanted_events(self._handler)
+        if wanted is None:
+            wanted = CABLE_EVENTS
+        unwanted = [name for name, want in (('handle_tag', self.want_tags),
+                                            ('handle_content', self.want_content),
+                                            ('handle_summary', self.want_summary),
+                                            ('handle_comment', self.want_comment),
+                                            ('handle_header', self.want_header),
+                                            ('handle_subject', self.want_subject)) if not want]
+        return wanted.difference(unwanted)
+
     def handle_subject(self, s):
         if self.want_subject:
             self._handler.handle_subject(s)
@@ -138,6 +152,9 @@ class NLPCableHandler(NoopCableHandler):
     the comment and the summary section (which are part of the cable's content) to the corpus
     in addition to the cable's content.
     """
+    wanted_events = frozenset(['handle_subject', 'handle_summary', 'handle_comment',
+                               'handle_header', 'handle_content', 'handle_tag'])
+
     def __init__(self, corpus, before_close=None):
         """\
 
@@ -444,6 +444,8 @@ class MediaTitleResolver(BaseMIOCableHandler):
 
     Requires an Internet connection.
     """
+    wanted_events = frozenset(['handle_media_iri'])
+
     def __init__(self, handler):
         """\
 
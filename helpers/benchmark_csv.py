@@ -0,0 +1,33 @@
+# -*- coding: utf-8 -*-
+"""\
+Compares the UTF-8 CSV reader with the former recoding CSV reader and the
+memory-mapped reader (which does not decode the header and content).
+
+Usage: python benchmark_csv.py [cables.csv]
+"""
+import sys
+import timeit
+from cablemap.core import utils
+
+
+def recoding_reader(filename):
+    with open(filename, 'rb') as f:
+        for row in utils._UnicodeReader(f, encoding='utf-8', delimiter=',', quotechar='"', escapechar='\\'):
+            pass
+
+def utf8_reader(filename):
+    for row in utils.rows_from_csv(filename):
+        pass
+
+def mapped_reader(filename):
+    for cable in utils.mapped_cables_from_csv(filename):
+        pass
+
+def benchmark(filename, repeat=3):
+    for func in (recoding_reader, utf8_reader, mapped_reader):
+        t = min(timeit.repeat(lambda: func(filename), number=1, repeat=repeat))
+        print '%-16s %.3f sec' % (func.__name__, t)
+
+
+if __name__ == '__main__':
+    benchmark(sys.argv[1] if len(sys.argv) > 1 else 'cables.csv')
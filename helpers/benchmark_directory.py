@@ -0,0 +1,33 @@
+# -*- coding: utf-8 -*-
+"""\
+Compares reading the cable files of a directory by the calling thread with
+reading them by a pool of threads.
+
+Drop the OS cache before a run to measure reading from a cold cache
+(i.e. ``sync; echo 3 > /proc/sys/vm/drop_caches`` on Linux), otherwise the
+files are read from the cache after the first run.
+
+Usage: python benchmark_directory.py [cable-directory] [threads]
+"""
+import sys
+import timeit
+from cablemap.core import utils
+
+
+def sequential_reader(directory):
+    for page in utils.pages_from_directory(directory, threads=None):
+        pass
+
+def threaded_reader(directory, threads=4):
+    for page in utils.pages_from_directory(directory, threads=threads):
+        pass
+
+def benchmark(directory, threads=4, repeat=3):
+    for func, args in ((sequential_reader, (directory,)), (threaded_reader, (directory, threads))):
+        t = min(timeit.repeat(lambda: func(*args), number=1, repeat=repeat))
+        print '%-18s %.3f sec' % (func.__name__, t)
+
+
+if __name__ == '__main__':
+    benchmark(sys.argv[1] if len(sys.argv) > 1 else './cable/',
+              int(sys.argv[2]) if len(sys.argv) > 2 else 4)
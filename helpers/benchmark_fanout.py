@@ -0,0 +1,119 @@
+# -*- coding: utf-8 -*-
+"""\
+Compares the synchronous ``DispatchCableHandler(MultipleCableHandler(...))``
+wiring with ``FanOutCableHandler`` (worker threads and worker processes).
+
+Two kinds of writers are measured:
+
+``io``
+    The writers sleep for a moment after each cable to simulate blocking
+    I/O.
+``cpu``
+    The writers serialize each event into CTM-like text (escaping, string
+    formatting) and write it to ``os.devnull``. This stands in for the
+    MIO CTM/XTM serializers of ``generate_topicmaps`` which are pure Python
+    and CPU-bound.
+
+The cables are parsed from the rows of the provided CSV file in each run,
+so the parsing is part of the measurement.
+
+Usage: python benchmark_fanout.py [cables.csv] [writers] [copies]
+"""
+import os
+import sys
+import time
+from cablemap.core.utils import rows_from_csv
+from cablemap.core.models import cable_from_row
+from cablemap.core.handler import handle_cables, MultipleCableHandler, DispatchCableHandler
+from cablemap.core.fanout import FanOutCableHandler, SubprocessHandler
+
+
+class SleepingWriter(object):
+    """\
+    "Writes" each cable at ``end_cable`` by sleeping.
+    """
+    def __init__(self, delay=0.002):
+        self._delay = delay
+
+    def start(self):
+        pass
+
+    def end(self):
+        pass
+
+    def start_cable(self, reference_id, canonical_id):
+        pass
+
+    def end_cable(self):
+        time.sleep(self._delay)
+
+    def __getattr__(self, name):
+        def noop(*args):
+            pass
+        return noop
+
+
+def _escape(value):
+    return unicode(value).replace(u'\\', u'\\\\').replace(u'"', u'\\"')
+
+
+class SerializingWriter(object):
+    """\
+    Serializes the events of each cable into CTM-like statements.
+    """
+    def __init__(self):
+        self._out = None
+        self._lines = []
+
+    def start(self):
+        self._out = open(os.devnull, 'wb')
+
+    def end(self):
+        self._out.close()
+
+    def start_cable(self, reference_id, canonical_id):
+        self._lines = [u'cb:%s isa cb:cable;' % canonical_id]
+
+    def end_cable(self):
+        self._lines.append(u'.\n')
+        self._out.write(u'\n    '.join(self._lines).encode('utf-8'))
+
+    def __getattr__(self, name):
+        def serialize(*args):
+            for arg in args:
+                value = _escape(arg)
+                self._lines.append(u'%s: "%s" ~ cb:%s;' % (name[7:], value, hex(hash(value))))
+        return serialize
+
+
+def _create_sleeping_writer():
+    return SleepingWriter()
+
+
+def _create_serializing_writer():
+    return SerializingWriter()
+
+
+_WRITERS = {
+    'io': (SleepingWriter, _create_sleeping_writer),
+    'cpu': (SerializingWriter, _create_serializing_writer),
+}
+
+
+def benchmark(filename, writers=4, copies=100):
+    rows = list(rows_from_csv(filename)) * copies
+    for kind in ('io', 'cpu'):
+        cls, factory = _WRITERS[kind]
+        for name, handler in (('dispatch', lambda: DispatchCableHandler(MultipleCableHandler([cls() for i in range(writers)]))),
+                              ('threads', lambda: FanOutCableHandler([cls() for i in range(writers)])),
+                              ('processes', lambda: FanOutCableHandler([SubprocessHandler(factory) for i in range(writers)]))):
+            h = handler()
+            start = time.time()
+            handle_cables((cable_from_row(row) for row in rows), h)
+            print '%-4s %-10s %d cables %d writers %.3f sec' % (kind, name, len(rows), writers, time.time() - start)
+
+
+if __name__ == '__main__':
+    benchmark(sys.argv[1] if len(sys.argv) > 1 else 'cables.csv',
+              int(sys.argv[2]) if len(sys.argv) > 2 else 4,
+              int(sys.argv[3]) if len(sys.argv) > 3 else 100)
@@ -0,0 +1,83 @@
+# -*- coding: utf-8 -*-
+"""\
+Compares the ``__getattr__`` based handler wrappers with the
+``DispatchCableHandler`` in the configuration of ``generate_topicmaps``.
+
+``generate_topicmaps`` dispatches the events through
+``DispatchCableHandler(MultipleCableHandler(handlers))``; the ``dispatch``
+run measures this configuration. The topic map handlers are replaced by
+handlers which count the events, the ``DebitlyFilter`` does not resolve
+bit.ly IRIs, the cables are parsed in advance and the subjects are not
+titlefied, so only the event dispatching is measured.
+
+Usage: python benchmark_handlers.py [cables.csv] [repeat]
+"""
+import sys
+import timeit
+from cablemap.core import cables_from_csv, predicates as pred
+from cablemap.core.models import ParsedCable
+from cablemap.core.handler import handle_cables, DefaultMetadataOnlyFilter, \
+     TeeCableHandler, MultipleCableHandler, DelegatingCableHandler, \
+     CableIdFilter, DispatchCableHandler, DebitlyFilter, CABLE_EVENTS
+
+
+class CountingCableHandler(object):
+    """\
+    Counts the events (stands in for a topic map handler).
+    """
+    def __init__(self):
+        self.count = 0
+
+    def _event(self, *args):
+        self.count += 1
+
+for _name in tuple(CABLE_EVENTS) + ('start', 'end', 'start_cable', 'end_cable'):
+    setattr(CountingCableHandler, _name, CountingCableHandler._event)
+
+
+class OfflineDebitlyFilter(DebitlyFilter):
+    """\
+    Passes the media IRIs through without resolving bit.ly IRIs.
+    """
+    def handle_media_iri(self, iri):
+        self._handler.handle_media_iri(iri)
+
+
+class SubjectLocatorsCableHandler(CountingCableHandler):
+    wanted_events = frozenset(['handle_wikileaks_iri'])
+
+
+class ContentCableHandler(DelegatingCableHandler):
+    wanted_events = frozenset(['handle_content', 'handle_header'])
+
+    def __getattr__(self, name):
+        def noop(*args):
+            pass
+        if 'start' not in name and 'end' not in name and 'content' not in name and 'header' not in name:
+            return noop
+        return getattr(self._handler, name)
+
+
+def topicmaps_handler():
+    """\
+    Returns the handler of ``generate_topicmaps`` (w/o media IRI handling).
+    """
+    def tee():
+        return TeeCableHandler(CountingCableHandler(), CountingCableHandler())
+    european_handler = CableIdFilter(tee(), pred.origin_filter(pred.origin_europe))
+    return MultipleCableHandler([DefaultMetadataOnlyFilter(OfflineDebitlyFilter(TeeCableHandler(european_handler, tee())), titlefy_subject=False),
+                                 SubjectLocatorsCableHandler(),
+                                 ContentCableHandler(tee())])
+
+
+def benchmark(filename, repeat=5):
+    cables = [ParsedCable.from_cable(cable) for cable in cables_from_csv(filename)] * 200
+    for name, factory in (('wrappers', topicmaps_handler),
+                          ('dispatch', lambda: DispatchCableHandler(topicmaps_handler()))):
+        t = min(timeit.repeat(lambda: handle_cables(cables, factory()), number=1, repeat=repeat))
+        print '%-10s %d cables %.3f sec' % (name, len(cables), t)
+
+
+if __name__ == '__main__':
+    benchmark(sys.argv[1] if len(sys.argv) > 1 else 'cables.csv',
+              int(sys.argv[2]) if len(sys.argv) > 2 else 5)
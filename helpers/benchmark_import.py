@@ -0,0 +1,62 @@
+# -*- coding: utf-8 -*-
+"""\
+Measures the start-up time of ``cablemap.core`` in fresh interpreters.
+
+Compares importing the package (patterns are compiled and data files are
+read on first use) with importing it and compiling all patterns and reading
+all data files immediately (the former behaviour).
+
+Usage: python benchmark_import.py [repeat]
+"""
+import sys
+import subprocess
+
+_IMPORT = '''
+import time
+start = time.time()
+import cablemap.core
+'''
+
+_EAGER = _IMPORT + '''
+from cablemap.core import reader, utils, c14n, consts
+for mod in (reader, utils, c14n, consts):
+    for value in vars(mod).values():
+        if isinstance(value, consts.LazyPattern):
+            value.compile()
+utils.tag_kind(u'XXXX')
+'''
+
+_FIRST_CABLE = _IMPORT + '''
+from cablemap.core import utils
+utils.titlefy(u'GERMANY: THE FIRST SUBJECT')
+utils.tag_kind(u'PREL')
+'''
+
+_TIMING = '''
+print time.time() - start
+'''
+
+
+def startup_time(code, repeat):
+    """\
+    Returns the min. time of `repeat` runs of `code` in a fresh interpreter.
+    """
+    times = []
+    for i in range(repeat):
+        out = subprocess.check_output([sys.executable, '-c', code + _TIMING])
+        times.append(float(out.strip().splitlines()[-1]))
+    return min(times)
+
+
+def benchmark(repeat=10):
+    # pkg_resources is imported by the "cablemap" namespace package
+    base = startup_time('import time; start = time.time(); import pkg_resources', repeat)
+    print '%-28s %.4f sec' % ('namespace (pkg_resources)', base)
+    for name, code in (('import', _IMPORT),
+                       ('import + first use', _FIRST_CABLE),
+                       ('import + eager compilation', _EAGER)):
+        print '%-28s %.4f sec' % (name, startup_time(code, repeat))
+
+
+if __name__ == '__main__':
+    benchmark(int(sys.argv[1]) if len(sys.argv) > 1 else 10)
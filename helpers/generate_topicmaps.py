@@ -9,7 +9,8 @@ from mio.ctm.miohandler import CTMHandler
 from mio.xtm.miohandler import XTM21Handler
 from cablemap.core import handle_source, predicates as pred
 from cablemap.core.handler import DefaultMetadataOnlyFilter, DebitlyFilter, TeeCableHandler, \
-     MultipleCableHandler, DelegatingCableHandler, CableIdFilter
+     MultipleCableHandler, DelegatingCableHandler, CableIdFilter, DispatchCableHandler
+from cablemap.core.diagnostics import DIAGNOSTICS
 from cablemap.tm import psis
 from cablemap.tm.handler import create_ctm_handler, create_xtm_handler, \
      create_ctm_miohandler, create_xtm_miohandler, MediaTitleResolver, BaseMIOCableHandler
@@ -17,7 +18,7 @@ from cablemap.tm.handler import create_ctm_handler, create_xtm_handler, \
 import logging 
 import sys
 logger = logging.getLogger('cablemap.core.reader')
-logger.setLevel(logging.DEBUG)
+logger.setLevel(logging.INFO)
 logger.addHandler(logging.StreamHandler(sys.stdout))
 
 _CGS_BASE = u'http://www.cablegatesearch.net/cable.php?id='
@@ -26,6 +27,8 @@ class SubjectLocatorsCableHandler(BaseMIOCableHandler):
     """\
     
     """
+    wanted_events = frozenset(['handle_wikileaks_iri'])
+
     def start_cable(self, rid, c14n_id):
         super(SubjectLocatorsCableHandler, self).start_cable(rid, c14n_id)
         self._start_cable()
@@ -42,6 +45,8 @@ class ContentCableHandler(DelegatingCableHandler):
     """\
     
     """
+    wanted_events = frozenset(['handle_content', 'handle_header'])
+
     def __getattr__(self, name):
         def noop(*args):
             pass
@@ -82,9 +87,12 @@ def generate_topicmaps(src, handle_media=False):
         files.append(xtm)
         h = DebitlyFilter(MediaTitleResolver(handler.TeeMapHandler(create_ctm_miohandler(ctm), create_xtm_miohandler(xtm))))
         handlers.append(h)
-    handle_source(src, MultipleCableHandler(handlers))
+    # The MIO serializers are CPU-bound, running them in worker threads or
+    # processes does not pay off (c.f. helpers/benchmark_fanout.py)
+    handle_source(src, DispatchCableHandler(MultipleCableHandler(handlers)))
     for f in files:
         f.close()
+    DIAGNOSTICS.log_summary(logger)
 
    
 if __name__ == '__main__':